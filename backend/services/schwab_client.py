@@ -46,10 +46,9 @@ class DataBridge:
         self.alphagen_thread.start()
         print("AlphaGen app started in background thread")
 
-    def send_data_to_websocket(self, data):
-        """Send data to WebSocket clients."""
-        print(f"📨 DataBridge: Sending data to WebSocket: {data[:100]}...")
-        self.data_queue.put(data)
+    async def send(self, data):
+        """Queue data for WebSocket clients without blocking the caller's loop."""
+        self.data_queue.put_nowait(data)
 
     def get_data_for_websocket(self, timeout=1.0):
         """Get data from the bridge for WebSocket broadcasting."""
@@ -98,7 +97,10 @@ class SchwabWebSocketService:
         while self.is_running:
             try:
                 # Get data from the AlphaGen app via the bridge
-                data = data_bridge.get_data_for_websocket(timeout=1.0)
+                # Wait for bridge data off the event loop so broadcasts keep flowing
+                data = await asyncio.to_thread(
+                    data_bridge.get_data_for_websocket, timeout=1.0
+                )
                 if data:
                     print(f"📡 WebSocket service received data: {data[:100]}...")
                     await self.broadcast_callback(data)
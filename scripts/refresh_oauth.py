@@ -11,7 +11,7 @@ sys.path.insert(0, str(project_root / "src"))
 # Also add project root for imports
 sys.path.insert(0, str(project_root))
 
-from alphagen.config import load_app_config
+from alphagen.config import CONFIG
 
 try:
     from schwab_api.authentication import client_from_login_flow
@@ -32,8 +32,7 @@ def refresh_oauth():
     print("🔄 Refreshing Schwab OAuth2 token...")
     
     try:
-        config = load_app_config()
-        schwab_config = config.schwab
+        schwab_config = CONFIG.schwab
         
         print(f"API Key: {schwab_config.api_key[:10]}...")
         print(f"Token path: {schwab_config.token_path}")
@@ -4,15 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
 import signal
 import sys
 import os
-from typing import Dict
 
 import structlog
 
 from alphagen import __version__
-from alphagen.config import load_app_config
+from alphagen.config import CONFIG
+from alphagen.core.event_loop import install_uvloop
 from alphagen.core.events import (
     EquityTick,
     NormalizedTick,
@@ -36,6 +37,8 @@ from alphagen.storage import (
     insert_positions,
     insert_signal,
     insert_trade_intent,
+    start_bulk_writer,
+    stop_bulk_writer,
 )
 from alphagen.trade_generator import TradeGenerator
 from alphagen.trade_manager import TradeManager
@@ -53,7 +56,7 @@ except ImportError as e:
     print(f"❌ DataBridge import failed: {e}")
     # Fallback if backend services aren't available
     class MockDataBridge:
-        def send_data_to_websocket(self, data):
+        async def send(self, data):
             print(f"Mock bridge: {data[:100]}...")
 
     data_bridge = MockDataBridge()
@@ -63,7 +66,7 @@ except ImportError as e:
 class AlphaGenApp:
     def __init__(self) -> None:
         self._logger = structlog.get_logger("alphagen.app")
-        self._config = load_app_config()
+        self._config = CONFIG
         self._schwab = SchwabOAuthClient.create()
 
         if self._schwab is None:
@@ -87,15 +90,18 @@ class AlphaGenApp:
         self._chart = FileChart() if self._config.features.enable_chart else None
         self._trade_generator = TradeGenerator(emit=self._handle_trade_intent)
         self._signal_engine = SignalEngine(emit=self._handle_signal)
-        self._normalizer = Normalizer(emit=self._handle_normalized_tick)
-        self._market_data = create_market_data_provider()
+        # Pipeline consumers copy what they need, so the emitted tick is reused.
+        self._normalizer = Normalizer(
+            emit=self._handle_normalized_tick, reuse_tick=True
+        )
+        self._market_data = create_market_data_provider(self._config)
         self._running = False
         self._background_tasks: list[asyncio.Task[None]] = []
-        self._intent_index: Dict[int, int] = {}
 
     async def run(self) -> None:
         self._logger.info("starting", version=__version__)
         await init_models()
+        start_bulk_writer()
         if self._chart:
             self._chart.start()
         self._running = True
@@ -107,17 +113,17 @@ class AlphaGenApp:
         )
         await self._market_data.start(callbacks)
         stop_event = asyncio.Event()
-
-        def _cancel(*_: object) -> None:
-            self._logger.info("shutdown_signal")
-            stop_event.set()
-
+        loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
-            asyncio.get_running_loop().add_signal_handler(sig, _cancel)
+            loop.add_signal_handler(sig, self._on_shutdown_signal, stop_event)
 
         await stop_event.wait()
         await self.shutdown()
 
+    def _on_shutdown_signal(self, stop_event: asyncio.Event) -> None:
+        self._logger.info("shutdown_signal")
+        stop_event.set()
+
     async def shutdown(self) -> None:
         self._running = False
         for task in self._background_tasks:
@@ -127,8 +133,11 @@ class AlphaGenApp:
             self._chart.stop()
         await self._option_monitor.shutdown()
         await self._trade_manager.close_all(reason="shutdown")
+        await self._trade_manager.shutdown()
+        await self._position_calculator.flush()
         await self._market_data.stop()
         await self._schwab.close()
+        await stop_bulk_writer()
         self._logger.info("shutdown_complete")
 
     async def _handle_equity_tick(self, tick: EquityTick) -> None:
@@ -148,7 +157,7 @@ class AlphaGenApp:
             }
         }
         print(f"📨 AlphaGen: Sending equity data to bridge: {equity_data}")
-        data_bridge.send_data_to_websocket(json.dumps(equity_data))
+        await data_bridge.send(json.dumps(equity_data))
 
     async def _handle_option_quote(self, quote: OptionQuote) -> None:
         await insert_option_quote(quote)
@@ -166,41 +175,35 @@ class AlphaGenApp:
                 "timestamp": quote.as_of.isoformat(),
             }
         }
-        data_bridge.send_data_to_websocket(json.dumps(option_data))
+        await data_bridge.send(json.dumps(option_data))
 
     async def _handle_normalized_tick(self, tick: NormalizedTick) -> None:
-        import sys
         print("🚨🚨🚨 AlphaGen: _handle_normalized_tick METHOD ENTERED!", file=sys.stderr)
         print("🚨🚨🚨 AlphaGen: _handle_normalized_tick METHOD ENTERED!")
-        try:
-            print("🚨 AlphaGen: _handle_normalized_tick CALLED!")
-            print(f"📊 AlphaGen: Handling normalized tick at {tick.as_of}")
-            print(f"📊 AlphaGen: Normalized tick data - VWAP={tick.equity.session_vwap if tick.equity else 'None'}, MA9={tick.equity.ma9 if tick.equity else 'None'}")
-            await insert_normalized_tick(tick)
-
-            # Send to WebSocket clients for chart updates
-            normalized_data = {
-                "type": "normalized_tick",
-                "data": {
-                    "timestamp": tick.as_of.isoformat(),
-                    "equity": {
-                        "session_vwap": tick.equity.session_vwap if tick.equity else None,
-                        "ma9": tick.equity.ma9 if tick.equity else None,
-                    },
-                    "option": {
-                        "delta": tick.option.delta if tick.option else None,
-                        "gamma": tick.option.gamma if tick.option else None,
-                        "theta": tick.option.theta if tick.option else None,
-                        "vega": tick.option.vega if tick.option else None,
-                    } if tick.option else None,
-                }
+        print("🚨 AlphaGen: _handle_normalized_tick CALLED!")
+        print(f"📊 AlphaGen: Handling normalized tick at {tick.as_of}")
+        print(f"📊 AlphaGen: Normalized tick data - VWAP={tick.equity.session_vwap if tick.equity else 'None'}, MA9={tick.equity.ma9 if tick.equity else 'None'}")
+        await insert_normalized_tick(tick)
+
+        # Send to WebSocket clients for chart updates
+        normalized_data = {
+            "type": "normalized_tick",
+            "data": {
+                "timestamp": tick.as_of.isoformat(),
+                "equity": {
+                    "session_vwap": tick.equity.session_vwap if tick.equity else None,
+                    "ma9": tick.equity.ma9 if tick.equity else None,
+                },
+                "option": {
+                    "delta": tick.option.delta if tick.option else None,
+                    "gamma": tick.option.gamma if tick.option else None,
+                    "theta": tick.option.theta if tick.option else None,
+                    "vega": tick.option.vega if tick.option else None,
+                } if tick.option else None,
             }
-            print(f"📨 AlphaGen: Sending normalized data to bridge: VWAP={tick.equity.session_vwap if tick.equity else 'None'}, MA9={tick.equity.ma9 if tick.equity else 'None'}")
-            data_bridge.send_data_to_websocket(json.dumps(normalized_data))
-        except Exception as e:
-            print(f"❌ AlphaGen: Error in _handle_normalized_tick: {e}")
-            import traceback
-            traceback.print_exc()
+        }
+        print(f"📨 AlphaGen: Sending normalized data to bridge: VWAP={tick.equity.session_vwap if tick.equity else 'None'}, MA9={tick.equity.ma9 if tick.equity else 'None'}")
+        await data_bridge.send(json.dumps(normalized_data))
 
     async def _handle_signal(self, signal: Signal) -> None:
         await insert_signal(signal)
@@ -215,7 +218,7 @@ class AlphaGenApp:
                 "metadata": signal.metadata,
             }
         }
-        data_bridge.send_data_to_websocket(json.dumps(signal_data))
+        await data_bridge.send(json.dumps(signal_data))
 
     async def _record_execution(self, execution: TradeExecution) -> None:
         await insert_execution(execution)
@@ -231,7 +234,7 @@ class AlphaGenApp:
                 "timestamp": execution.as_of.isoformat(),
             }
         }
-        data_bridge.send_data_to_websocket(json.dumps(execution_data))
+        await data_bridge.send(json.dumps(execution_data))
 
     async def _handle_trade_intent(self, intent: TradeIntent) -> None:
         await insert_trade_intent(intent)
@@ -247,7 +250,7 @@ class AlphaGenApp:
                 "timestamp": intent.as_of.isoformat(),
             }
         }
-        data_bridge.send_data_to_websocket(json.dumps(intent_data))
+        await data_bridge.send(json.dumps(intent_data))
 
     async def _on_position_state(self, state: PositionState) -> None:
         # Update latest position state
@@ -271,7 +274,7 @@ class AlphaGenApp:
                 "timestamp": state.as_of.isoformat(),
             }
         }
-        data_bridge.send_data_to_websocket(json.dumps(position_data))
+        await data_bridge.send(json.dumps(position_data))
 
     async def _handle_stream_error(self, exc: Exception) -> None:
         self._logger.error("market_data_stream_error", error=str(exc))
@@ -284,7 +287,7 @@ class AlphaGenApp:
                 "timestamp": asyncio.get_event_loop().time(),
             }
         }
-        data_bridge.send_data_to_websocket(json.dumps(error_data))
+        await data_bridge.send(json.dumps(error_data))
 
     async def _handle_normalized_tick(self, tick: NormalizedTick) -> None:
         await insert_normalized_tick(tick)
@@ -303,17 +306,14 @@ class AlphaGenApp:
         await self._trade_generator.handle_signal(signal_event)
 
     async def _handle_trade_intent(self, intent: TradeIntent) -> None:
-        intent_id = await insert_trade_intent(intent)
-        self._intent_index[id(intent)] = intent_id
+        intent.db_id = await insert_trade_intent(intent)
         await self._trade_manager.handle_intent(intent)
 
     async def _record_execution(self, execution: TradeExecution) -> None:
         intent = execution.intent
-        intent_id = self._intent_index.get(id(intent))
-        if intent_id is None:
-            intent_id = await insert_trade_intent(intent)
-            self._intent_index[id(intent)] = intent_id
-        await insert_execution(execution, intent_id=intent_id)
+        if intent.db_id is None:
+            intent.db_id = await insert_trade_intent(intent)
+        await insert_execution(execution, intent_id=intent.db_id)
         await self._position_calculator.register_execution(execution)
 
     async def _position_poll_loop(self) -> None:
@@ -340,10 +340,18 @@ class AlphaGenApp:
         await self._trade_manager.update_option_quote(quote)
 
 
+def configure_logging(level: str) -> None:
+    """Drop log calls below ``level`` before any event dict is built."""
+    threshold = logging.getLevelNamesMapping().get(level.upper(), logging.INFO)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(threshold))
+
+
 async def main() -> None:
+    configure_logging(CONFIG.logging.level)
     app = AlphaGenApp()
     await app.run()
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -8,6 +8,8 @@ from datetime import datetime
 import click
 
 from alphagen.app import main as run_app
+from alphagen.config import CONFIG
+from alphagen.core.event_loop import install_uvloop
 from alphagen.reports import fetch_daily_pnl
 
 
@@ -17,8 +19,18 @@ def cli() -> None:
 
 
 @cli.command()
-def run() -> None:
+@click.option(
+    "--positions-cache-ttl",
+    type=float,
+    default=None,
+    help="Reuse positions from an on-disk cache for this many seconds. "
+    "For backtests and replays only; leave unset when trading live.",
+)
+def run(positions_cache_ttl: float | None) -> None:
     """Start the real-time Alpha-Gen service."""
+    if positions_cache_ttl is not None:
+        CONFIG.schwab.positions_cache_ttl = positions_cache_ttl
+    install_uvloop()
     try:
         asyncio.run(run_app())
     except Exception as e:
@@ -33,10 +45,15 @@ def report(for_date: datetime | None) -> None:
 
     async def _display() -> None:
         data = await fetch_daily_pnl(for_date.date() if for_date else None)
-        for row in data:
-            click.echo(
+        if not data:
+            return
+        # Emit the whole report in one write rather than one flush per row.
+        click.echo(
+            "\n".join(
                 f"{row['trade_date']}: PnL={row['realized_pnl']:.2f} on {row['trade_count']} trades"
+                for row in data
             )
+        )
 
     try:
         asyncio.run(_display())
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import time, timedelta
 from enum import Enum
 from functools import lru_cache
-from os import getenv
+from os import environ, getenv
 from zoneinfo import ZoneInfo
 
 from dotenv import load_dotenv
@@ -36,16 +36,14 @@ DEFAULT_MARKET_DATA_SOURCE = MarketDataSource.SCHWAB
 class PolygonSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="POLYGON_")
 
-    api_key: str | None = Field(None, alias="API_KEY")
-    equity_ticker: str = Field(DEFAULT_EQUITY_TICKER, alias="EQUITY_TICKER")
-    options_underlying: str = Field(DEFAULT_EQUITY_TICKER, alias="OPTIONS_UNDERLYING")
-    stock_ws_url: str = Field("wss://socket.polygon.io/stocks", alias="STOCK_WS_URL")
-    options_ws_url: str = Field(
-        "wss://socket.polygon.io/options", alias="OPTIONS_WS_URL"
-    )
-    s3_access_key: str | None = Field(None, alias="S3_ACCESS_KEY")
-    s3_secret_key: str | None = Field(None, alias="S3_SECRET_KEY")
-    s3_endpoint: str | None = Field(None, alias="S3_ENDPOINT")
+    api_key: str | None = Field(None)
+    equity_ticker: str = Field(DEFAULT_EQUITY_TICKER)
+    options_underlying: str = Field(DEFAULT_EQUITY_TICKER)
+    stock_ws_url: str = Field("wss://socket.polygon.io/stocks")
+    options_ws_url: str = Field("wss://socket.polygon.io/options")
+    s3_access_key: str | None = Field(None)
+    s3_secret_key: str | None = Field(None)
+    s3_endpoint: str | None = Field(None)
 
 
 class SchwabSettings(BaseSettings):
@@ -58,29 +56,39 @@ class SchwabSettings(BaseSettings):
     paper_trading: bool = Field(True)
     callback_url: str | None = Field("http://localhost:8080/callback")
     token_path: str = Field("config/schwab_token.json")
+    # Seconds a fetched option quote is reused; 0 disables the cache.
+    quote_cache_ttl: float = Field(0.5)
+    # Seconds fetched positions are kept on disk for backtests; 0 disables it.
+    positions_cache_ttl: float = Field(0.0)
+    positions_cache_dir: str = Field(".cache/schwab")
 
 
 class StorageSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="")
 
-    database_url: str = Field(
-        "sqlite+aiosqlite:///./data/alpha_gen.db", alias="DATABASE_URL"
-    )
+    database_url: str = Field("sqlite+aiosqlite:///./data/alpha_gen.db")
 
 
 class RiskSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="RISK_")
 
-    stop_loss_multiple: float = Field(2.0, alias="STOP_LOSS_MULTIPLE")
-    take_profit_multiple: float = Field(0.5, alias="TAKE_PROFIT_MULTIPLE")
-    max_position_size: int = Field(25, alias="MAX_POSITION_SIZE")
-    trading_capital: float = Field(5_000_000.0, alias="TRADING_CAPITAL")
+    stop_loss_multiple: float = Field(2.0)
+    take_profit_multiple: float = Field(0.5)
+    max_position_size: int = Field(25)
+    trading_capital: float = Field(5_000_000.0)
 
 
 class FeatureSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="FEATURE_")
 
-    enable_chart: bool = Field(False, alias="ENABLE_CHART")
+    enable_chart: bool = Field(False)
+    allow_mock_fallback: bool = Field(False)
+
+
+class LoggingSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="LOG_")
+
+    level: str = Field("INFO")
 
 
 class AppConfig(BaseModel):
@@ -89,60 +97,81 @@ class AppConfig(BaseModel):
     storage: StorageSettings = StorageSettings()
     risk: RiskSettings = RiskSettings()
     features: FeatureSettings = FeatureSettings()
+    logging: LoggingSettings = LoggingSettings()
     timezone: ZoneInfo = EST
-    market_data_source: MarketDataSource = DEFAULT_MARKET_DATA_SOURCE
+    # Unknown names are kept as given; the provider factory rejects them.
+    market_data_source: MarketDataSource | str = DEFAULT_MARKET_DATA_SOURCE
+
+
+_CONFIG_ENV_PREFIXES = (
+    "POLYGON_",
+    "SCHWAB_",
+    "RISK_",
+    "FEATURE_",
+    "LOG_",
+    "DATABASE_URL",
+    "MARKET_DATA_SOURCE",
+)
+
+# Environment fingerprint and the AppConfig validated against it.
+_validated_config: tuple[int, AppConfig] | None = None
+
+
+def _env_fingerprint() -> int:
+    return hash(
+        tuple(
+            sorted(
+                (key, value)
+                for key, value in environ.items()
+                if key.startswith(_CONFIG_ENV_PREFIXES)
+            )
+        )
+    )
+
+
+def _build_app_config() -> AppConfig:
+    global _validated_config
+    source = (getenv("MARKET_DATA_SOURCE") or DEFAULT_MARKET_DATA_SOURCE.value).lower()
+    market_data_source: MarketDataSource | str
+    try:
+        market_data_source = MarketDataSource(source)
+    except ValueError:
+        market_data_source = source
+    config = AppConfig(
+        polygon=PolygonSettings(),
+        schwab=SchwabSettings(),
+        storage=StorageSettings(),
+        risk=RiskSettings(),
+        features=FeatureSettings(),
+        logging=LoggingSettings(),
+        market_data_source=market_data_source,
+    )
+    _validated_config = (_env_fingerprint(), config)
+    return config
 
 
 @lru_cache(maxsize=1)
 def load_app_config() -> AppConfig:
-    """Load settings from environment (cached)."""
-    source = getenv("MARKET_DATA_SOURCE")
-    if source and source.lower() != DEFAULT_MARKET_DATA_SOURCE.value:
-        raise ValueError(
-            "Polygon market data is disabled; only 'schwab' is currently supported"
-        )
-    market_source = DEFAULT_MARKET_DATA_SOURCE
-    return AppConfig(
-        polygon=PolygonSettings(
-            API_KEY=getenv("POLYGON_API_KEY"),
-            EQUITY_TICKER=getenv("POLYGON_EQUITY_TICKER", DEFAULT_EQUITY_TICKER),
-            OPTIONS_UNDERLYING=getenv(
-                "POLYGON_OPTIONS_UNDERLYING", DEFAULT_EQUITY_TICKER
-            ),
-            STOCK_WS_URL=getenv(
-                "POLYGON_STOCK_WS_URL", "wss://socket.polygon.io/stocks"
-            ),
-            OPTIONS_WS_URL=getenv(
-                "POLYGON_OPTIONS_WS_URL", "wss://socket.polygon.io/options"
-            ),
-            S3_ACCESS_KEY=getenv("POLYGON_S3_ACCESS_KEY"),
-            S3_SECRET_KEY=getenv("POLYGON_S3_SECRET_KEY"),
-            S3_ENDPOINT=getenv("POLYGON_S3_ENDPOINT"),
-        ),
-        schwab=SchwabSettings(
-            api_key=getenv("SCHWAB_API_KEY"),
-            api_secret=getenv("SCHWAB_API_SECRET"),
-            account_id=getenv("SCHWAB_ACCOUNT_ID"),
-            base_url=getenv("SCHWAB_BASE_URL", "https://api.schwab.com"),
-            paper_trading=getenv("SCHWAB_PAPER_TRADING", "true").lower() == "true",
-            callback_url=getenv(
-                "SCHWAB_CALLBACK_URL", "http://localhost:8080/callback"
-            ),
-            token_path=getenv("SCHWAB_TOKEN_PATH", "config/schwab_token.json"),
-        ),
-        storage=StorageSettings(
-            DATABASE_URL=getenv(
-                "DATABASE_URL", "sqlite+aiosqlite:///./data/alpha_gen.db"
-            ),
-        ),
-        risk=RiskSettings(
-            STOP_LOSS_MULTIPLE=float(getenv("RISK_STOP_LOSS_MULTIPLE", "2.0")),
-            TAKE_PROFIT_MULTIPLE=float(getenv("RISK_TAKE_PROFIT_MULTIPLE", "0.5")),
-            MAX_POSITION_SIZE=int(getenv("RISK_MAX_POSITION_SIZE", "25")),
-            TRADING_CAPITAL=float(getenv("RISK_TRADING_CAPITAL", "5000000.0")),
-        ),
-        features=FeatureSettings(
-            ENABLE_CHART=getenv("FEATURE_ENABLE_CHART", "false").lower() == "true",
-        ),
-        market_data_source=market_source,
-    )
+    """Load settings from environment (cached).
+
+    Each settings model reads its own prefixed environment variables. The
+    market data source is recorded but not checked here, so importing the
+    package never fails on it; ``create_market_data_provider`` does that.
+    """
+    return _build_app_config()
+
+
+def load_app_config_fast() -> AppConfig:
+    """Load settings, skipping validation when the environment is unchanged.
+
+    Meant for test harnesses and worker reloads: if the config-related
+    environment variables match the last validated load, a new AppConfig is
+    assembled with ``model_construct`` from the already validated settings.
+    """
+    cached = _validated_config
+    if cached is not None and cached[0] == _env_fingerprint():
+        return AppConfig.model_construct(**dict(cached[1]))
+    return _build_app_config()
+
+
+CONFIG: AppConfig = load_app_config()
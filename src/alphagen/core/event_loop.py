@@ -0,0 +1,19 @@
+"""Event loop setup shared by the service and debug GUI entrypoints."""
+
+from __future__ import annotations
+
+import asyncio
+
+
+def install_uvloop() -> bool:
+    """Use uvloop for new event loops when it is installed.
+
+    Returns ``True`` if the uvloop policy was installed, ``False`` when the
+    package is unavailable and the default asyncio loop stays in place.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
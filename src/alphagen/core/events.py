@@ -1,15 +1,23 @@
-"""Domain event models used across the pipeline."""
+"""Domain event models used across the pipeline.
+
+Events are plain slotted dataclasses. Payloads are validated once where they
+enter the process (see the Polygon stream adapters), so no pydantic models are
+constructed per tick below that boundary.
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional
 
 from alphagen.config import EST
 
+# Sentinel cooldown deadline that every session timestamp is past.
+_EXPIRED_UNTIL = datetime.min.replace(tzinfo=EST)
+
 
-@dataclass
+@dataclass(slots=True)
 class EquityTick:
     symbol: str
     price: float
@@ -18,11 +26,14 @@ class EquityTick:
     as_of: datetime
 
     def __post_init__(self) -> None:
+        # Ticks align on whole seconds; truncate once here rather than per emit.
         if self.as_of.tzinfo is None:
-            self.as_of = self.as_of.replace(tzinfo=EST)
+            self.as_of = self.as_of.replace(tzinfo=EST, microsecond=0)
+        elif self.as_of.microsecond:
+            self.as_of = self.as_of.replace(microsecond=0)
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionQuote:
     option_symbol: str
     strike: float
@@ -35,7 +46,7 @@ class OptionQuote:
         return (self.bid + self.ask) / 2
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionSnapshot:
     symbol: str
     quantity: int
@@ -44,14 +55,14 @@ class PositionSnapshot:
     as_of: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedTick:
     as_of: datetime
     equity: EquityTick
     option: Optional[OptionQuote]
 
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     as_of: datetime
     action: str
@@ -61,7 +72,7 @@ class Signal:
     cooldown_until: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeIntent:
     as_of: datetime
     action: str
@@ -70,9 +81,22 @@ class TradeIntent:
     limit_price: float
     stop_loss: float
     take_profit: float
+    # Primary key of the persisted TradeIntentRow, set once stored.
+    db_id: Optional[int] = field(default=None, compare=False, repr=False)
+    # Action side, derived once so per-execution consumers skip string ops.
+    is_buy: bool = field(init=False, compare=False, repr=False)
+    is_sell: bool = field(init=False, compare=False, repr=False)
+    # P&L sign of the position this intent opens: -1 for short, 1 for long.
+    direction: int = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        action = self.action.upper()
+        self.is_buy = action.startswith("BUY")
+        self.is_sell = action.startswith("SELL")
+        self.direction = -1 if self.is_sell else 1
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeExecution:
     order_id: str
     status: str
@@ -82,7 +106,7 @@ class TradeExecution:
     intent: TradeIntent
 
 
-@dataclass
+@dataclass(slots=True)
 class CooldownState:
     until: datetime
 
@@ -91,7 +115,7 @@ class CooldownState:
 
     @classmethod
     def expired(cls) -> "CooldownState":
-        return cls(until=datetime.min.replace(tzinfo=EST))
+        return cls(until=_EXPIRED_UNTIL)
 
     def extend(
         self, duration: timedelta, from_time: Optional[datetime] = None
@@ -100,10 +124,14 @@ class CooldownState:
         return CooldownState(until=start + duration)
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionState:
     as_of: datetime
     symbols: dict[str, PositionSnapshot]
+    # Precomputed sum of market values, stamped by the position calculator.
+    market_value_sum: Optional[float] = field(default=None, compare=False, repr=False)
 
     def total_market_value(self) -> float:
+        if self.market_value_sum is not None:
+            return self.market_value_sum
         return sum(pos.market_value for pos in self.symbols.values())
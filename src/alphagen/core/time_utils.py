@@ -2,46 +2,54 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
-from dateutil.relativedelta import relativedelta
 import holidays
 
 from alphagen.config import EST, MARKET_CLOSE, MARKET_OPEN, SESSION_BUFFER
 
 US_MARKET_HOLIDAYS = holidays.NYSE()
+_ONE_DAY = timedelta(days=1)
 
 
 def now_est() -> datetime:
     return datetime.now(tz=EST)
 
 
+@lru_cache(maxsize=64)
+def _session_bounds_for_date(day: date) -> tuple[datetime, datetime]:
+    """Return the buffered session window for ``day``, ignoring holidays."""
+    session_start = datetime.combine(day, MARKET_OPEN, tzinfo=EST)
+    session_end = datetime.combine(day, MARKET_CLOSE, tzinfo=EST)
+    return session_start - SESSION_BUFFER, session_end + SESSION_BUFFER
+
+
+@lru_cache(maxsize=8)
+def _trading_window(day: date) -> tuple[datetime, datetime] | None:
+    """Return the buffered trading window for ``day`` or ``None`` on holidays."""
+    if day in US_MARKET_HOLIDAYS:
+        return None
+    return _session_bounds_for_date(day)
+
+
 def within_trading_window(moment: datetime | None = None) -> bool:
     moment = moment or now_est()
-    if moment.date() in US_MARKET_HOLIDAYS:
-        return False
-    window_open = (
-        datetime.combine(moment.date(), MARKET_OPEN, tzinfo=EST) - SESSION_BUFFER
-    )
-    window_close = (
-        datetime.combine(moment.date(), MARKET_CLOSE, tzinfo=EST) + SESSION_BUFFER
-    )
-    return window_open <= moment <= window_close
+    window = _trading_window(moment.date())
+    return window is not None and window[0] <= moment <= window[1]
 
 
 def session_bounds(day: datetime | None = None) -> tuple[datetime, datetime]:
     day = day or now_est()
-    session_start = datetime.combine(day.date(), MARKET_OPEN, tzinfo=EST)
-    session_end = datetime.combine(day.date(), MARKET_CLOSE, tzinfo=EST)
-    return session_start - SESSION_BUFFER, session_end + SESSION_BUFFER
+    return _session_bounds_for_date(day.date())
 
 
 def next_session_open(after: datetime | None = None) -> datetime:
-    probe = (after or now_est()) + timedelta(days=0)
+    probe = after or now_est()
     while True:
-        probe += relativedelta(days=1)
-        if probe.date() in US_MARKET_HOLIDAYS:
+        probe += _ONE_DAY
+        if probe.weekday() >= 5 or probe.date() in US_MARKET_HOLIDAYS:
             continue
         start, _ = session_bounds(probe)
         if start > (after or now_est()):
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import asyncio
+import sys
 from collections import deque
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import date
 from typing import Callable, Coroutine, Optional
 
 from alphagen.config import DEFAULT_EQUITY_TICKER
@@ -13,15 +13,31 @@ from alphagen.core.events import EquityTick, NormalizedTick, OptionQuote
 from alphagen.core.time_utils import within_trading_window
 
 
-@dataclass
+@dataclass(slots=True)
 class Normalizer:
     emit: Callable[[NormalizedTick], Coroutine[None, None, None]]
     equity_symbol: str = DEFAULT_EQUITY_TICKER
+    # Emit one mutable NormalizedTick per normalizer instead of a fresh one per
+    # tick. Only safe when ``emit`` is done with the tick once it returns.
+    reuse_tick: bool = False
+    _latest_equity: Optional[EquityTick] = field(default=None, init=False, repr=False)
+    _latest_option: Optional[OptionQuote] = field(default=None, init=False, repr=False)
+    _options_by_expiry: dict[date, deque[OptionQuote]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # (session date, underlying price, nearest quote) from the last selection
+    _nearest: Optional[tuple[date, float, OptionQuote]] = field(
+        default=None, init=False, repr=False
+    )
+    _scratch: Optional[NormalizedTick] = field(default=None, init=False, repr=False)
+    # Option symbol -> whether it belongs to the equity, so each contract's
+    # prefix is checked once rather than on every quote.
+    _symbol_matches: dict[str, bool] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     def __post_init__(self) -> None:
-        self._latest_equity: Optional[EquityTick] = None
-        self._latest_option: Optional[OptionQuote] = None
-        self._option_buffer: deque[OptionQuote] = deque(maxlen=20)
+        self.equity_symbol = sys.intern(self.equity_symbol)
 
     async def ingest_equity(self, tick: EquityTick) -> None:
         if tick.symbol != self.equity_symbol:
@@ -32,56 +48,80 @@ class Normalizer:
         await self._attempt_emit()
 
     async def ingest_option(self, quote: OptionQuote) -> None:
-        if quote.option_symbol.startswith(self.equity_symbol):
-            self._option_buffer.append(quote)
-            if not within_trading_window(quote.as_of):
-                return
-            self._latest_option = self._select_nearest_option(quote.as_of)
-            await self._attempt_emit()
+        symbol = quote.option_symbol
+        matches = self._symbol_matches.get(symbol)
+        if matches is None:
+            matches = self._symbol_matches[symbol] = symbol.startswith(
+                self.equity_symbol
+            )
+        if not matches:
+            return
+        self._buffer_option(quote)
+        if not within_trading_window(quote.as_of):
+            # The cached selection did not see this quote; rescan next time.
+            self._nearest = None
+            return
+        self._latest_option = self._select_nearest_option(quote)
+        await self._attempt_emit()
 
     async def _attempt_emit(self) -> None:
-        if not self._latest_equity:
+        equity = self._latest_equity
+        if not equity:
             return
-        normalized = NormalizedTick(
-            as_of=self._latest_equity.as_of.replace(microsecond=0),
-            equity=self._latest_equity,
-            option=self._latest_option,  # Can be None
-        )
-        print(f"📊 Normalizer: Emitting normalized tick with VWAP={self._latest_equity.session_vwap}, MA9={self._latest_equity.ma9}")
-        print(f"📊 Normalizer: About to call emit callback: {self.emit}")
-        print(f"📊 Normalizer: Callback type: {type(self.emit)}")
-        if hasattr(self.emit, '__name__'):
-            print(f"📊 Normalizer: Callback method name: {self.emit.__name__}")
-        if hasattr(self.emit, '__self__'):
-            print(f"📊 Normalizer: Callback self type: {type(self.emit.__self__)}")
-        try:
-            result = self.emit(normalized)
-            print(f"📊 Normalizer: Emit call result: {result}")
-            if asyncio.iscoroutine(result):
-                print(f"📊 Normalizer: Awaiting coroutine...")
-                await result
-                print(f"📊 Normalizer: Successfully awaited emit callback")
-            else:
-                print(f"📊 Normalizer: Emit callback returned non-coroutine: {result}")
-                if hasattr(result, '__await__'):
-                    print(f"📊 Normalizer: Result has __await__, awaiting...")
-                    await result
-                    print(f"📊 Normalizer: Successfully awaited result with __await__")
-        except Exception as e:
-            print(f"📊 Normalizer: Error calling emit callback: {e}")
-            import traceback
-            traceback.print_exc()
+        normalized = self._scratch
+        if normalized is None:
+            normalized = NormalizedTick(
+                as_of=equity.as_of,
+                equity=equity,
+                option=self._latest_option,  # Can be None
+            )
+            if self.reuse_tick:
+                self._scratch = normalized
+        else:
+            normalized.as_of = equity.as_of
+            normalized.equity = equity
+            normalized.option = self._latest_option
+        await self.emit(normalized)
 
-    def _select_nearest_option(self, now: datetime) -> Optional[OptionQuote]:
-        same_day_quotes = [
-            quote for quote in self._option_buffer if quote.expiry.date() == now.date()
-        ]
-        if not same_day_quotes:
+    def _buffer_option(self, quote: OptionQuote) -> None:
+        expiry = quote.expiry.date()
+        bucket = self._options_by_expiry.get(expiry)
+        if bucket is None:
+            bucket = self._options_by_expiry[expiry] = deque(maxlen=20)
+        elif (
+            len(bucket) == bucket.maxlen
+            and self._nearest is not None
+            and bucket[0] is self._nearest[2]
+        ):
+            # The cached nearest quote is about to be evicted.
+            self._nearest = None
+        bucket.append(quote)
+
+    def _select_nearest_option(self, quote: OptionQuote) -> Optional[OptionQuote]:
+        session_day = quote.as_of.date()
+        bucket = self._options_by_expiry.get(session_day)
+        if not bucket:
             return None
-        underlying_price = self._latest_equity.price if self._latest_equity else None
-        if underlying_price is None:
-            return same_day_quotes[-1]
-        return min(
-            same_day_quotes,
-            key=lambda q: abs(q.strike - underlying_price),
-        )
+        if self._latest_equity is None:
+            return bucket[-1]
+        underlying_price = self._latest_equity.price
+        cached = self._nearest
+        if cached is None or cached[0] != session_day or cached[1] != underlying_price:
+            if cached is not None and cached[0] != session_day:
+                self._drop_expired(session_day)
+            # Oldest quote wins ties, as in a scan of the buffer in order.
+            nearest = min(bucket, key=lambda q: abs(q.strike - underlying_price))
+        elif quote.expiry.date() == session_day and abs(
+            quote.strike - underlying_price
+        ) < abs(cached[2].strike - underlying_price):
+            nearest = quote
+        else:
+            nearest = cached[2]
+        self._nearest = (session_day, underlying_price, nearest)
+        return nearest
+
+    def _drop_expired(self, session_day: date) -> None:
+        for expiry in [day for day in self._options_by_expiry if day < session_day]:
+            del self._options_by_expiry[expiry]
+        # Yesterday's contracts will not quote again; keep the symbol memo bounded.
+        self._symbol_matches.clear()
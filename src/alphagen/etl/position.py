@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Callable, Coroutine, Iterable
+import asyncio
+from typing import Callable, Coroutine, Iterable, Optional
+
+import structlog
 
 from alphagen.core.events import PositionSnapshot, PositionState, TradeExecution
 from alphagen.core.time_utils import now_est
@@ -15,40 +17,88 @@ class PositionCalculator:
         emit: Callable[[PositionState], Coroutine[None, None, None]],
     ) -> None:
         self._emit = emit
+        self._logger = structlog.get_logger("alphagen.position")
         self._snapshots: dict[str, PositionSnapshot] = {}
         self._open_intents: dict[str, TradeExecution] = {}
+        # Broker snapshots overlaid on synthesized positions for open intents.
+        self._merged: dict[str, PositionSnapshot] = {}
+        self._market_value_sum = 0.0
+        # Pending emit shared by executions registered in the same loop pass,
+        # held until it finishes; ``_dirty`` asks it to emit once more.
+        self._flush_task: Optional[asyncio.Task[None]] = None
+        self._dirty = False
 
     async def update_from_broker(self, snapshots: Iterable[PositionSnapshot]) -> None:
         for snapshot in snapshots:
             self._snapshots[snapshot.symbol] = snapshot
+            self._set_merged(snapshot)
         await self._emit_state()
 
     async def register_execution(self, execution: TradeExecution) -> None:
-        symbol = execution.intent.option_symbol
-        if execution.intent.action.upper().startswith("BUY"):
+        intent = execution.intent
+        symbol = intent.option_symbol
+        if intent.is_buy:
             self._open_intents.pop(symbol, None)
+            if symbol not in self._snapshots:
+                self._drop_merged(symbol)
         else:
             self._open_intents[symbol] = execution
-        await self._emit_state()
+            if symbol not in self._snapshots:
+                self._set_merged(
+                    PositionSnapshot(
+                        symbol=symbol,
+                        quantity=(
+                            -intent.quantity if intent.is_sell else intent.quantity
+                        ),
+                        average_price=execution.fill_price,
+                        market_value=-execution.fill_price * intent.quantity,
+                        as_of=execution.as_of,
+                    )
+                )
+        self._schedule_emit()
+
+    def _set_merged(self, snapshot: PositionSnapshot) -> None:
+        previous = self._merged.get(snapshot.symbol)
+        if previous is not None:
+            self._market_value_sum -= previous.market_value
+        self._merged[snapshot.symbol] = snapshot
+        self._market_value_sum += snapshot.market_value
+
+    def _drop_merged(self, symbol: str) -> None:
+        previous = self._merged.pop(symbol, None)
+        if previous is not None:
+            self._market_value_sum -= previous.market_value
+
+    async def flush(self) -> None:
+        """Wait for any pending coalesced emit, e.g. before shutting down."""
+        task = self._flush_task
+        if task is not None:
+            # Failures were already logged by _on_flush_done.
+            await asyncio.gather(task, return_exceptions=True)
+
+    def _schedule_emit(self) -> None:
+        self._dirty = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush())
+            self._flush_task.add_done_callback(self._on_flush_done)
+
+    async def _flush(self) -> None:
+        # Executions registered while an emit is in flight get one more emit.
+        while self._dirty:
+            self._dirty = False
+            await self._emit_state()
+
+    def _on_flush_done(self, task: asyncio.Task[None]) -> None:
+        if self._flush_task is task:
+            self._flush_task = None
+        if not task.cancelled() and task.exception() is not None:
+            self._logger.error("position_emit_failed", error=str(task.exception()))
 
     async def _emit_state(self) -> None:
-        merged = defaultdict(lambda: PositionSnapshot("UNK", 0, 0.0, 0.0, now_est()))
-        for symbol, snapshot in self._snapshots.items():
-            merged[symbol] = snapshot
-        for symbol, execution in self._open_intents.items():
-            if symbol not in merged:
-                merged[symbol] = PositionSnapshot(
-                    symbol=symbol,
-                    quantity=-execution.intent.quantity
-                    if execution.intent.action.lower().startswith("sell")
-                    else execution.intent.quantity,
-                    average_price=execution.fill_price,
-                    market_value=-execution.fill_price * execution.intent.quantity,
-                    as_of=execution.as_of,
-                )
         await self._emit(
             PositionState(
                 as_of=now_est(),
-                symbols=dict(merged),
+                symbols=dict(self._merged),
+                market_value_sum=self._market_value_sum,
             )
         )
@@ -3,18 +3,44 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import queue
 import threading
+import time
+from collections import deque
+from concurrent.futures import Future
 import tkinter as tk
-from tkinter import ttk, scrolledtext
-from typing import Optional
+from tkinter import ttk
+from typing import Callable, Optional
 
 import structlog
 
+from alphagen.config import CONFIG
+from alphagen.core.event_loop import install_uvloop
 from alphagen.core.events import EquityTick, NormalizedTick, OptionQuote
 from alphagen.market_data.base import StreamCallbacks
+from alphagen.schwab_oauth_client import InvalidTokenError, run_oauth_setup
 from alphagen.visualization.simple_gui_chart import SimpleGUChart
 from alphagen.etl.normalizer import Normalizer
 
+# Console writes are buffered and applied to the Text widget at most this often.
+CONSOLE_FLUSH_MS = 50
+# How often the Tk thread applies widget updates queued by the asyncio thread.
+UI_DRAIN_MS = 16
+# Scrollback rows kept in the console; older rows are trimmed on flush.
+CONSOLE_MAX_LINES = 5000
+CONSOLE_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+
+
+def console_level(name: str) -> int:
+    """Console threshold for a configured level name; unknown names mean info."""
+    return CONSOLE_LEVELS.get(name.lower(), logging.INFO)
+
 
 class DebugGUI:
     """GUI Debug Application with streaming data and chart controls."""
@@ -38,15 +64,29 @@ class DebugGUI:
 
         # Components
         self.gui_chart: Optional[SimpleGUChart] = None
-        self.console_text: Optional[scrolledtext.ScrolledText] = None
+        self.console_tree: Optional[ttk.Treeview] = None
         self.normalizer: Optional[Normalizer] = None
 
+        # Pending (level, message) console lines awaiting the next flush
+        self._log_buffer: deque[tuple[str, str]] = deque()
+        # Widget updates from the asyncio thread, applied on the Tk thread
+        self._ui_queue: queue.SimpleQueue[Callable[[], None]] = queue.SimpleQueue()
+        # Messages below this level are dropped; raw feed lines log at debug,
+        # so LOG_LEVEL=DEBUG shows them
+        self._console_min_level = console_level(CONFIG.logging.level)
+        # Token errors repeat until re-auth; report them once per stream start
+        self._token_error_shown = False
+
         # Async event loop
         self.loop: Optional[asyncio.AbstractEventLoop] = None
         self.app_task: Optional[asyncio.Task] = None
+        # Set (on the loop thread) to let _run_app return
+        self._stop_event: Optional[asyncio.Event] = None
 
         self._setup_ui()
         self._setup_async_loop()
+        self.root.after(UI_DRAIN_MS, self._drain_ui_queue)
+        self.root.after(CONSOLE_FLUSH_MS, self._console_flush_tick)
 
         # Auto-start features for better UX
         self._auto_start_features()
@@ -75,10 +115,7 @@ class DebugGUI:
             # Start chart first (warm-up)
             if self.view_chart_active.get():
                 self._log_to_console("🚀 Auto-starting chart...", "info")
-                if self.loop and self.loop.is_running():
-                    asyncio.run_coroutine_threadsafe(self._start_chart_and_warmup(), self.loop)
-                else:
-                    self._start_chart_sync()
+                self._start_chart(warm_up=True)
 
             # Start streaming after chart is ready
             if self.stream_data_active.get():
@@ -288,29 +325,46 @@ class DebugGUI:
         style.configure("Large.TLabelframe", font=("Arial", 12, "bold"))
         style.configure("Large.TLabelframe.Label", font=("Arial", 12, "bold"))
 
-        # Console text widget with better styling - increased height for visibility
-        self.console_text = scrolledtext.ScrolledText(
-            console_frame,
-            height=20,  # Increased from 15 to 20 for better visibility
-            state=tk.DISABLED,
-            wrap=tk.WORD,
-            bg="#1e1e1e",  # Dark background
-            fg="#ffffff",  # White text
-            insertbackground="#ffffff",  # White cursor
-            selectbackground="#404040",  # Dark selection background
-            selectforeground="#ffffff",  # White selection text
+        # Console rows live in a Treeview, which only renders the visible rows
+        style.configure(
+            "Console.Treeview",
+            background="#1e1e1e",  # Dark background
+            fieldbackground="#1e1e1e",
+            foreground="#ffffff",  # White text
             font=("Consolas", 11),  # Monospace font for better readability
         )
-        self.console_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
+        style.map("Console.Treeview", background=[("selected", "#404040")])
+        self.console_tree = ttk.Treeview(
+            console_frame,
+            columns=("ts", "lvl", "msg"),
+            show="headings",
+            height=20,
+            style="Console.Treeview",
+        )
+        self.console_tree.heading("ts", text="Time")
+        self.console_tree.heading("lvl", text="Level")
+        self.console_tree.heading("msg", text="Message")
+        self.console_tree.column("ts", width=80, stretch=False)
+        self.console_tree.column("lvl", width=80, stretch=False)
+        self.console_tree.column("msg", width=900)
+        self.console_tree.grid(
+            row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(5, 0), pady=5
+        )
+        console_scroll = ttk.Scrollbar(
+            console_frame, orient=tk.VERTICAL, command=self.console_tree.yview
+        )
+        console_scroll.grid(row=0, column=1, sticky=(tk.N, tk.S), pady=5)
+        self.console_tree.configure(yscrollcommand=console_scroll.set)
 
-        # Configure text tags for different log levels with better contrast
-        self.console_text.tag_configure("info", foreground="#00ff00")  # Bright green
-        self.console_text.tag_configure("warning", foreground="#ffaa00")  # Orange
-        self.console_text.tag_configure("error", foreground="#ff4444")  # Bright red
-        self.console_text.tag_configure("debug", foreground="#888888")  # Gray
+        # Row tags for different log levels with better contrast
+        self.console_tree.tag_configure("info", foreground="#00ff00")  # Bright green
+        self.console_tree.tag_configure("warning", foreground="#ffaa00")  # Orange
+        self.console_tree.tag_configure("error", foreground="#ff4444")  # Bright red
+        self.console_tree.tag_configure("debug", foreground="#888888")  # Gray
 
     def _setup_async_loop(self):
         """Set up the async event loop in a separate thread."""
+        install_uvloop()
 
         def run_loop():
             self.loop = asyncio.new_event_loop()
@@ -321,14 +375,57 @@ class DebugGUI:
         self.loop_thread.start()
 
     def _log_to_console(self, message: str, level: str = "info"):
-        """Log a message to the console."""
-        if not self.console_text:
+        """Queue a message for the console; safe to call from any thread."""
+        if not self.console_tree:
+            return
+        if CONSOLE_LEVELS.get(level, logging.INFO) < self._console_min_level:
+            return
+
+        self._log_buffer.append((level, message))
+
+    def _run_in_ui(self, func: Callable[..., None], *args) -> None:
+        """Queue ``func(*args)`` to run on the Tk thread."""
+        self._ui_queue.put(lambda: func(*args))
+
+    def _drain_ui_queue(self):
+        """Apply queued widget updates; reschedules itself on the Tk thread."""
+        while True:
+            try:
+                update = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                update()
+            except Exception as e:  # pylint: disable=broad-except
+                self._log_to_console(f"UI update error: {e}", "error")
+        self.root.after(UI_DRAIN_MS, self._drain_ui_queue)
+
+    def _console_flush_tick(self):
+        """Flush the console buffer; reschedules itself on the Tk thread."""
+        self._flush_console()
+        self.root.after(CONSOLE_FLUSH_MS, self._console_flush_tick)
+
+    def _flush_console(self):
+        """Append all queued console messages as rows, trimming old ones."""
+        tree = self.console_tree
+        if not self._log_buffer or not tree:
             return
 
-        self.console_text.config(state=tk.NORMAL)
-        self.console_text.insert(tk.END, f"[{level.upper()}] {message}\n", level)
-        self.console_text.see(tk.END)
-        self.console_text.config(state=tk.DISABLED)
+        # One timestamp per flush; rows are at most CONSOLE_FLUSH_MS stale
+        stamp = time.strftime("%H:%M:%S")
+        insert = tree.insert
+        item = ""
+        while self._log_buffer:
+            level, message = self._log_buffer.popleft()
+            item = insert(
+                "", tk.END, values=(stamp, level.upper(), message), tags=(level,)
+            )
+
+        rows = tree.get_children()
+        excess = len(rows) - CONSOLE_MAX_LINES
+        if excess > 0:
+            tree.delete(*rows[:excess])
+        tree.see(item)
 
     def _on_stream_toggle(self):
         """Handle stream data checkbox toggle."""
@@ -343,11 +440,7 @@ class DebugGUI:
         """Handle view chart checkbox toggle."""
         if self.view_chart_active.get():
             self._log_to_console("Starting live chart...", "info")
-            if self.loop and self.loop.is_running():
-                asyncio.run_coroutine_threadsafe(self._start_chart(), self.loop)
-            else:
-                # Fallback for when no loop is running
-                self._start_chart_sync()
+            self._start_chart()
         else:
             self._log_to_console("Stopping live chart...", "info")
             self._stop_chart()
@@ -362,52 +455,36 @@ class DebugGUI:
     def _start_streaming(self):
         """Start the data streaming."""
         if self.loop and not self.app_task:
+            self._token_error_shown = False
             self.app_task = asyncio.run_coroutine_threadsafe(self._run_app(), self.loop)
             self.status_label.config(text="Status: Streaming")
 
     def _stop_streaming(self):
         """Stop the data streaming."""
         if self.app_task:
-            self.app_task.cancel()
+            stop_event, self._stop_event = self._stop_event, None
+            if stop_event and self.loop:
+                self.loop.call_soon_threadsafe(stop_event.set)
+            else:
+                self.app_task.cancel()
             self.app_task = None
             self.status_label.config(text="Status: Stopped")
 
-    async def _start_chart(self):
-        """Start the live chart."""
-        if not self.gui_chart:
-            # Create embedded chart in the GUI
-            self.gui_chart = SimpleGUChart(self.chart_frame)
-            # Set initial time scale
-            self.gui_chart.set_time_scale(self.time_scale.get())
-            # Load historical data from database (async)
-            await self.gui_chart.load_historical_data()
-            self._log_to_console("Live chart created", "info")
-
-        # Always initialize normalizer when showing chart
-        if not self.normalizer:
-            self.normalizer = Normalizer(emit=self._handle_normalized_tick)
-            self._log_to_console("Normalizer initialized", "info")
-
-        # Show the chart
-        if self.gui_chart:
-            self.gui_chart.show()
-            self._log_to_console("Live chart shown", "info")
-
-    async def _start_chart_and_warmup(self) -> None:
-        """Start chart and warm it up."""
-        await self._start_chart()
-        self._warm_up_chart()
+    def _start_chart(self, warm_up: bool = False) -> None:
+        """Create (once) and show the live chart; runs on the Tk thread.
 
-    def _start_chart_sync(self) -> None:
-        """Start chart synchronously (fallback when no asyncio loop)."""
+        The chart's widgets are only touched here and in ``_run_in_ui``
+        callbacks. History is read from the database off the Tk thread and
+        plotted back here, with the optional warm-up data after it.
+        """
         try:
+            created = False
             if not self.gui_chart:
                 # Create embedded chart in the GUI
                 self.gui_chart = SimpleGUChart(self.chart_frame)
                 # Set initial time scale
                 self.gui_chart.set_time_scale(self.time_scale.get())
-                # Load historical data synchronously (without await)
-                # This will work since the chart loading is now synchronous for the main operations
+                created = True
                 self._log_to_console("Live chart created", "info")
 
             # Always initialize normalizer when showing chart
@@ -416,33 +493,44 @@ class DebugGUI:
                 self._log_to_console("Normalizer initialized", "info")
 
             # Show the chart
-            if self.gui_chart:
-                self.gui_chart.show()
-                self._log_to_console("Live chart shown", "info")
-
-            # Load historical data in a separate thread to avoid blocking UI
-            import threading
-            def load_data():
-                try:
-                    asyncio.run(self.gui_chart.load_historical_data())
-                    self._log_to_console("Historical data loaded", "info")
-                except Exception as e:
-                    self._log_to_console(f"Error loading historical data: {e}", "error")
-
-            data_thread = threading.Thread(target=load_data, daemon=True)
-            data_thread.start()
+            self.gui_chart.show()
+            self._log_to_console("Live chart shown", "info")
+
+            if created:
+                self._load_historical_data(warm_up)
+            elif warm_up:
+                self._warm_up_chart()
 
         except Exception as e:
             self._log_to_console(f"Error starting chart: {e}", "error")
 
-    async def _load_historical_data_async(self) -> None:
-        """Load historical data asynchronously."""
-        if self.gui_chart:
-            await self.gui_chart.load_historical_data()
-            self._log_to_console("Historical data loaded", "info")
-            # Force a plot update after loading historical data
-            self.gui_chart._update_plot()
-            self._log_to_console("Chart updated with historical data", "info")
+    def _load_historical_data(self, warm_up: bool) -> None:
+        """Read chart history off the Tk thread and plot it back on it."""
+        if self.loop and self.loop.is_running():
+            asyncio.run_coroutine_threadsafe(
+                self._read_historical_data(warm_up), self.loop
+            )
+        else:
+            # Fallback for when no loop is running: read on a worker thread
+            threading.Thread(
+                target=asyncio.run,
+                args=(self._read_historical_data(warm_up),),
+                daemon=True,
+            ).start()
+
+    async def _read_historical_data(self, warm_up: bool) -> None:
+        """Read chart history from the database and queue it for the Tk thread."""
+        columns = await SimpleGUChart.read_historical_columns()
+        self._run_in_ui(self._show_historical_data, columns, warm_up)
+
+    def _show_historical_data(self, columns, warm_up: bool) -> None:
+        """Plot history read by ``_read_historical_data`` (Tk thread)."""
+        if not self.gui_chart:
+            return
+        self.gui_chart.load_historical_columns(columns)
+        self._log_to_console("Historical data loaded", "info")
+        if warm_up:
+            self._warm_up_chart()
 
     def _stop_chart(self):
         """Stop the live chart."""
@@ -454,6 +542,7 @@ class DebugGUI:
 
     async def _run_app(self):
         """Run the Alpha-Gen application."""
+        self._stop_event = stop_event = asyncio.Event()
         try:
             from alphagen.app import AlphaGenApp
 
@@ -470,10 +559,13 @@ class DebugGUI:
 
             # Start market data provider
             await app._market_data.start(callbacks)
-
-            # Keep running until cancelled
-            while True:
-                await asyncio.sleep(1)
+            try:
+                # Idle without waking the loop until streaming is stopped
+                await stop_event.wait()
+            finally:
+                # Close the stream on stop and on cancellation alike
+                await app._market_data.stop()
+            self._log_to_console("App stopped", "info")
 
         except asyncio.CancelledError:
             self._log_to_console("App stopped", "info")
@@ -483,7 +575,8 @@ class DebugGUI:
 
     async def _handle_equity_tick(self, tick: EquityTick):
         """Handle equity tick data."""
-        self._log_to_console(f"Equity: {tick.symbol} = ${tick.price:.2f}", "info")
+        if self._console_min_level <= logging.DEBUG:
+            self._log_to_console(f"Equity: {tick.symbol} = ${tick.price:.2f}", "debug")
 
         # Feed to normalizer if chart is active
         if self.normalizer:
@@ -491,10 +584,12 @@ class DebugGUI:
 
     async def _handle_option_quote(self, quote: OptionQuote):
         """Handle option quote data."""
-        self._log_to_console(
-            f"Option: {quote.option_symbol} bid=${quote.bid:.2f} ask=${quote.ask:.2f}",
-            "info",
-        )
+        if self._console_min_level <= logging.DEBUG:
+            self._log_to_console(
+                f"Option: {quote.option_symbol} "
+                f"bid=${quote.bid:.2f} ask=${quote.ask:.2f}",
+                "debug",
+            )
 
         # Feed to normalizer if chart is active
         if self.normalizer:
@@ -502,35 +597,46 @@ class DebugGUI:
 
     async def _handle_normalized_tick(self, tick: NormalizedTick):
         """Handle normalized tick data for charting."""
+        self._run_in_ui(self._show_normalized_tick, tick)
+
+    def _show_normalized_tick(self, tick: NormalizedTick):
+        """Update metrics and chart for a normalized tick (Tk thread)."""
         # Update metrics display
         self.current_price.set(f"${tick.equity.price:.2f}")
         self.current_vwap.set(f"${tick.equity.session_vwap:.2f}")
         self.current_ma9.set(f"${tick.equity.ma9:.2f}")
         
         # Log to console with info level for visibility
-        self._log_to_console(
-            f"✓ Price=${tick.equity.price:.2f} | VWAP=${tick.equity.session_vwap:.2f} | MA9=${tick.equity.ma9:.2f}",
-            "info",
-        )
+        if self._console_min_level <= logging.INFO:
+            self._log_to_console(
+                f"✓ Price=${tick.equity.price:.2f} | VWAP=${tick.equity.session_vwap:.2f} | MA9=${tick.equity.ma9:.2f}",
+                "info",
+            )
         
         if self.gui_chart:
             self.gui_chart.handle_tick(tick)
 
     async def _handle_stream_error(self, error: Exception):
         """Handle stream errors."""
-        error_msg = str(error)
-        if "token_invalid" in error_msg or "InvalidTokenError" in error_msg:
+        if isinstance(error, InvalidTokenError):
+            if self._token_error_shown:
+                return
+            self._token_error_shown = True
             self._log_to_console("❌ OAuth token is invalid or expired!", "error")
             self._log_to_console(
                 "Please click 'Setup OAuth' to re-authenticate", "warning"
             )
             # Stop streaming on token error
-            if self.stream_data_active.get():
-                self.stream_data_active.set(False)
-                self._stop_streaming()
+            self._run_in_ui(self._stop_streaming_on_token_error)
         else:
             self._log_to_console(f"Stream error: {error}", "error")
 
+    def _stop_streaming_on_token_error(self):
+        """Untick Stream Data and stop streaming (Tk thread)."""
+        if self.stream_data_active.get():
+            self.stream_data_active.set(False)
+            self._stop_streaming()
+
     def _create_async_callback(self, async_func):
         """Create an async callback that can be awaited."""
 
@@ -572,42 +678,36 @@ class DebugGUI:
 
     def _setup_oauth(self):
         """Setup OAuth for Schwab API."""
+        if not self.loop:
+            self._log_to_console("❌ OAuth setup error: event loop not running", "error")
+            return
         self._log_to_console("Starting OAuth setup...", "info")
-        try:
-            import subprocess
-            import sys
-            from pathlib import Path
-
-            # Run the OAuth setup script
-            script_path = (
-                Path(__file__).parent.parent.parent
-                / "scripts"
-                / "setup"
-                / "setup_schwab_oauth.py"
-            )
-            result = subprocess.run(
-                [sys.executable, str(script_path)], capture_output=True, text=True
-            )
-
-            if result.returncode == 0:
-                self._log_to_console("✅ OAuth setup completed successfully!", "info")
-            else:
-                self._log_to_console(f"❌ OAuth setup failed: {result.stderr}", "error")
+        # Runs on the asyncio loop; the outcome is reported on the Tk thread
+        future = asyncio.run_coroutine_threadsafe(run_oauth_setup(), self.loop)
+        future.add_done_callback(lambda done: self._run_in_ui(self._oauth_done, done))
 
+    def _oauth_done(self, future: Future[bool]):
+        """Report the OAuth setup outcome (Tk thread)."""
+        try:
+            succeeded = future.result()
         except Exception as e:
             self._log_to_console(f"❌ OAuth setup error: {e}", "error")
+            return
+        if succeeded:
+            self._log_to_console("✅ OAuth setup completed successfully!", "info")
+        else:
+            self._log_to_console("❌ OAuth setup failed, see logs for details", "error")
 
     def _clear_console(self):
         """Clear the console output."""
-        if self.console_text:
-            self.console_text.config(state=tk.NORMAL)
-            self.console_text.delete(1.0, tk.END)
-            self.console_text.config(state=tk.DISABLED)
+        if self.console_tree:
+            self._log_buffer.clear()
+            self.console_tree.delete(*self.console_tree.get_children())
             self._log_to_console("Console cleared", "info")
 
     def _export_logs(self):
         """Export console logs to file."""
-        if not self.console_text:
+        if not self.console_tree:
             return
 
         try:
@@ -621,8 +721,12 @@ class DebugGUI:
             )
 
             if filename:
+                self._flush_console()
+                tree = self.console_tree
                 with open(filename, "w") as f:
-                    f.write(self.console_text.get(1.0, tk.END))
+                    for item in tree.get_children():
+                        stamp, level, message = tree.item(item, "values")
+                        f.write(f"{stamp} [{level}] {message}\n")
                 self._log_to_console(f"Logs exported to: {filename}", "info")
 
         except Exception as e:
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
-from alphagen.config import MarketDataSource, load_app_config
+from alphagen.config import CONFIG, AppConfig, MarketDataSource
 from alphagen.market_data.base import MarketDataProvider
 from alphagen.market_data.schwab_stream import SchwabMarketDataProvider
 
 
-def create_market_data_provider() -> MarketDataProvider:
-    cfg = load_app_config()
-    if cfg.market_data_source != MarketDataSource.SCHWAB:
+def create_market_data_provider(config: AppConfig | None = None) -> MarketDataProvider:
+    config = config or CONFIG
+    source = config.market_data_source
+    if source == MarketDataSource.POLYGON:
         raise RuntimeError("Polygon market data is currently disabled")
-    return SchwabMarketDataProvider()
+    if source != MarketDataSource.SCHWAB:
+        raise RuntimeError(
+            f"Unknown market data source {source!r}; only 'schwab' is supported"
+        )
+    return SchwabMarketDataProvider(config)
@@ -9,23 +9,27 @@ from typing import Optional
 import structlog
 import websockets
 
-from alphagen.config import load_app_config
+from alphagen.config import CONFIG, AppConfig
 from alphagen.core.events import EquityTick, OptionQuote
 from alphagen.core.time_utils import to_est
 from alphagen.market_data.base import MarketDataProvider, StreamCallbacks
-from alphagen.schwab_oauth_client import SchwabOAuthClient
+from alphagen.schwab_oauth_client import InvalidTokenError, SchwabOAuthClient
+
+POLL_INTERVAL_SECONDS = 5.0
+MAX_ERROR_BACKOFF_SECONDS = 30.0
 
 
 class SchwabMarketDataProvider(MarketDataProvider):
     """Schwab streaming market data provider using WebSockets."""
 
-    def __init__(self) -> None:
+    def __init__(self, config: AppConfig | None = None) -> None:
         self._logger = structlog.get_logger("alphagen.market_data.schwab")
         self._callbacks: Optional[StreamCallbacks] = None
         self._websocket: Optional[websockets.WebSocketServerProtocol] = None
         self._task: Optional[asyncio.Task[None]] = None
-        self._client = SchwabOAuthClient.create()
-        self._config = load_app_config()
+        # Providers share one client; stop() releases this reference
+        self._client = SchwabOAuthClient.shared()
+        self._config = config or CONFIG
 
     async def start(self, callbacks: StreamCallbacks) -> None:
         """Start the Schwab streaming data provider."""
@@ -43,7 +47,9 @@ class SchwabMarketDataProvider(MarketDataProvider):
             await self._websocket.close()
             self._websocket = None
 
-        await self._client.close()
+        if self._client:
+            await self._client.release()
+            self._client = None
 
     async def _stream_data(self) -> None:
         """Main streaming loop for Schwab market data."""
@@ -65,22 +71,36 @@ class SchwabMarketDataProvider(MarketDataProvider):
 
         # Subscribe to QQQ equity data
         equity_symbol = self._config.polygon.equity_ticker
+        allow_mock_fallback = self._config.features.allow_mock_fallback
+        backoff = POLL_INTERVAL_SECONDS
 
         while True:
             try:
                 # Get real market data from Schwab
                 await self._fetch_real_market_data(equity_symbol)
-
-                # Poll every 5 seconds
-                await asyncio.sleep(5)
+                backoff = POLL_INTERVAL_SECONDS
+                await asyncio.sleep(POLL_INTERVAL_SECONDS)
 
             except asyncio.CancelledError:
                 break
+            except InvalidTokenError as e:
+                # Report it, then keep polling slowly so a refreshed token
+                # resumes data; callbacks decide how often to alert on it
+                backoff = MAX_ERROR_BACKOFF_SECONDS
+                self._logger.error(
+                    "schwab_token_invalid", error=str(e), retry_in=backoff
+                )
+                await self._callbacks.on_error(e)
+                await asyncio.sleep(backoff)
             except Exception as e:
-                self._logger.warning("schwab_poll_error", error=str(e))
-                # Fall back to mock data if real data fails
-                await self._generate_mock_data(equity_symbol)
-                await asyncio.sleep(10)  # Wait longer on error
+                backoff = min(backoff * 2, MAX_ERROR_BACKOFF_SECONDS)
+                self._logger.warning(
+                    "schwab_poll_error", error=str(e), retry_in=backoff
+                )
+                # Mock data is opt-in so outages do not feed fake ticks downstream
+                if allow_mock_fallback:
+                    await self._generate_mock_data(equity_symbol)
+                await asyncio.sleep(backoff)
 
     async def _fetch_real_market_data(self, symbol: str) -> None:
         """Fetch real market data from Schwab API."""
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Awaitable, Callable
+from typing import Awaitable, Callable, Optional
 
 import structlog
 
@@ -26,45 +26,62 @@ class OptionMonitor:
         self._on_quote = on_quote
         self._interval = interval_seconds
         self._logger = structlog.get_logger("alphagen.option_monitor")
-        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._symbols: set[str] = set()
+        # Wakes the poller: set by track() and by the interval timer.
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
 
     def track(self, symbol: str) -> None:
-        if symbol in self._tasks:
+        if symbol in self._symbols:
             return
         self._logger.info("option_monitor_track", symbol=symbol)
-        task = asyncio.create_task(self._poll(symbol), name=f"option-monitor-{symbol}")
-        self._tasks[symbol] = task
+        self._symbols.add(symbol)
+        self._wake.set()
+        if self._task is None:
+            self._task = asyncio.create_task(self._poll(), name="option-monitor")
 
     def untrack(self, symbol: str) -> None:
-        task = self._tasks.pop(symbol, None)
-        if not task:
+        if symbol not in self._symbols:
             return
         self._logger.info("option_monitor_untrack", symbol=symbol)
-        task.cancel()
+        self._symbols.discard(symbol)
 
     async def shutdown(self) -> None:
-        tasks = list(self._tasks.values())
-        if not tasks:
+        task, self._task = self._task, None
+        self._symbols.clear()
+        if not task:
             return
-        for task in tasks:
-            task.cancel()
-        await asyncio.gather(*tasks, return_exceptions=True)
-        self._tasks.clear()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
 
-    async def _poll(self, symbol: str) -> None:
+    async def _poll(self) -> None:
+        """Refresh every tracked symbol with one bulk request per interval."""
+        loop = asyncio.get_running_loop()
         try:
             while True:
+                self._wake.clear()
+                if not self._symbols:
+                    await self._wake.wait()
+                    continue
+                symbols = list(self._symbols)
                 try:
-                    quote = await self._client.fetch_option_quote(symbol)
-                    if quote:
-                        await self._on_quote(quote)
+                    quotes = await self._client.fetch_option_quotes(symbols)
+                    for quote in quotes:
+                        # Skip symbols untracked while the request was in flight.
+                        if quote.option_symbol in self._symbols:
+                            await self._on_quote(quote)
                 except asyncio.CancelledError:  # pragma: no cover - cooperative cancel
                     raise
                 except Exception as exc:  # pylint: disable=broad-except
                     self._logger.warning(
-                        "option_monitor_error", symbol=symbol, error=str(exc)
+                        "option_monitor_error", symbols=symbols, error=str(exc)
                     )
-                await asyncio.sleep(self._interval)
+                # A timer handle rather than wait_for, which wraps a task per interval.
+                timer = loop.call_later(self._interval, self._wake.set)
+                try:
+                    await self._wake.wait()
+                finally:
+                    timer.cancel()
         except asyncio.CancelledError:
-            self._logger.debug("option_monitor_task_cancelled", symbol=symbol)
+            self._logger.debug("option_monitor_task_cancelled")
             raise
@@ -3,27 +3,105 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import sys
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Any, Awaitable, Callable, Optional, TypeVar, Union
 
+import orjson
+from pydantic import BaseModel, Discriminator, Tag, TypeAdapter
 import websockets
 from websockets.client import WebSocketClientProtocol
 
-from alphagen.config import DEFAULT_EQUITY_TICKER, load_app_config
+from alphagen.config import CONFIG, DEFAULT_EQUITY_TICKER, EST, AppConfig
 from alphagen.core.events import EquityTick, OptionQuote
-from alphagen.core.time_utils import to_est
 from alphagen.market_data.base import MarketDataProvider, StreamCallbacks
 
 
+class _EquityAggregate(BaseModel):
+    """Polygon ``XA`` entry; the symbol and start time are required."""
+
+    ev: str
+    sym: str
+    c: float = 0.0
+    vw: float = 0.0
+    ma: float = 0.0
+    s: int
+
+
+class _OptionQuoteEntry(BaseModel):
+    """Polygon ``Q`` entry; the symbol and quote time are required."""
+
+    ev: str
+    sym: str
+    k: float = 0.0
+    bp: float = 0.0
+    ap: float = 0.0
+    x: int = 0
+    t: int
+
+
+class _OtherEvent(BaseModel):
+    """Status and any other non-data entry; only ``ev`` is read."""
+
+    ev: str
+
+
+# Polygon frames are small JSON arrays: skip per-message deflate and cap frames
+# well below the 1 MiB default while leaving room for bursty option batches.
+_WS_CONNECT_OPTIONS = {"ping_interval": 10, "max_size": 2**18, "compression": None}
+
+# Parsed events waiting for their callback. Parsing never awaits the consumer:
+# when a queue is full its oldest event is dropped instead.
+_EVENT_QUEUE_SIZE = 1024
+
+T = TypeVar("T")
+
+
+def _messages(model: type[BaseModel], event: str) -> TypeAdapter[list[Any]]:
+    """Adapter validating ``event`` entries as ``model`` and others by ``ev`` only.
+
+    A malformed data entry fails validation instead of being filled in with
+    defaults, while status entries in the same frame still parse.
+    """
+
+    def tag(entry: Any) -> str:
+        ev = entry.get("ev") if isinstance(entry, dict) else getattr(entry, "ev", None)
+        return event if ev == event else "other"
+
+    entry_type = Annotated[
+        Union[Annotated[model, Tag(event)], Annotated[_OtherEvent, Tag("other")]],
+        Discriminator(tag),
+    ]
+    return TypeAdapter(list[entry_type])
+
+
+# Built once so each frame is validated straight from JSON without a dict pass.
+_EQUITY_MESSAGES = _messages(_EquityAggregate, "XA")
+_OPTION_MESSAGES = _messages(_OptionQuoteEntry, "Q")
+
+
+def _text_frame(payload: dict[str, Any]) -> str:
+    """Serialize an outbound control message with orjson, as a text frame."""
+    # websockets sends bytes as a binary frame, so decode to keep text frames.
+    return orjson.dumps(payload).decode()
+
+
 class PolygonMarketDataProvider(MarketDataProvider):
-    def __init__(self, ticker: str = DEFAULT_EQUITY_TICKER) -> None:
-        self._cfg = load_app_config().polygon
+    def __init__(
+        self, ticker: str = DEFAULT_EQUITY_TICKER, config: AppConfig | None = None
+    ) -> None:
+        self._cfg = (config or CONFIG).polygon
         self._ticker = ticker
         self._equity_ws: Optional[WebSocketClientProtocol] = None
         self._options_ws: Optional[WebSocketClientProtocol] = None
         self._callbacks: Optional[StreamCallbacks] = None
         self._tasks: list[asyncio.Task[None]] = []
+        self._equity_queue: asyncio.Queue[EquityTick] = asyncio.Queue(
+            maxsize=_EVENT_QUEUE_SIZE
+        )
+        self._option_queue: asyncio.Queue[OptionQuote] = asyncio.Queue(
+            maxsize=_EVENT_QUEUE_SIZE
+        )
 
     async def start(self, callbacks: StreamCallbacks) -> None:
         self._callbacks = callbacks
@@ -31,6 +109,12 @@ class PolygonMarketDataProvider(MarketDataProvider):
         self._tasks = [
             asyncio.create_task(self._consume_equity()),
             asyncio.create_task(self._consume_options()),
+            asyncio.create_task(
+                self._dispatch(self._equity_queue, callbacks.on_equity_tick)
+            ),
+            asyncio.create_task(
+                self._dispatch(self._option_queue, callbacks.on_option_quote)
+            ),
         ]
 
     async def stop(self) -> None:
@@ -44,58 +128,85 @@ class PolygonMarketDataProvider(MarketDataProvider):
             await self._options_ws.close()
 
     async def _connect_streams(self) -> None:
-        auth_payload = json.dumps({"action": "auth", "params": self._cfg.api_key})
+        auth_payload = _text_frame({"action": "auth", "params": self._cfg.api_key})
         self._equity_ws = await websockets.connect(
-            self._cfg.stock_ws_url, ping_interval=10
+            self._cfg.stock_ws_url, **_WS_CONNECT_OPTIONS
         )
         await self._equity_ws.send(auth_payload)
         await self._equity_ws.send(
-            json.dumps({"action": "subscribe", "params": f"XA.{self._ticker}"})
+            _text_frame({"action": "subscribe", "params": f"XA.{self._ticker}"})
         )
 
         self._options_ws = await websockets.connect(
-            self._cfg.options_ws_url, ping_interval=10
+            self._cfg.options_ws_url, **_WS_CONNECT_OPTIONS
         )
         await self._options_ws.send(auth_payload)
         await self._options_ws.send(
-            json.dumps({"action": "subscribe", "params": f"Q.{self._ticker}"})
+            _text_frame({"action": "subscribe", "params": f"Q.{self._ticker}"})
         )
 
     async def _consume_equity(self) -> None:
         assert self._callbacks and self._equity_ws
+        # Bound once so the per-entry loop does no global or attribute lookups.
+        # Epoch timestamps are built directly in EST rather than converted.
+        validate = _EQUITY_MESSAGES.validate_json
+        intern = sys.intern
+        from_timestamp = datetime.fromtimestamp
+        enqueue = self._enqueue
+        queue = self._equity_queue
         try:
             async for raw in self._equity_ws:
-                data = json.loads(raw)
-                for entry in data:
-                    if entry.get("ev") != "XA":
+                for entry in validate(raw):
+                    if entry.ev != "XA":
                         continue
                     tick = EquityTick(
-                        symbol=entry["sym"],
-                        price=float(entry.get("c", 0.0)),
-                        session_vwap=float(entry.get("vw", 0.0)),
-                        ma9=float(entry.get("ma", 0.0)),
-                        as_of=to_est(datetime.fromtimestamp(entry["s"] / 1000)),
+                        symbol=intern(entry.sym),
+                        price=entry.c,
+                        session_vwap=entry.vw,
+                        ma9=entry.ma,
+                        as_of=from_timestamp(entry.s * 0.001, EST),
                     )
-                    await self._callbacks.on_equity_tick(tick)
+                    enqueue(queue, tick)
         except Exception as exc:  # pylint: disable=broad-except
             await self._callbacks.on_error(exc)
 
     async def _consume_options(self) -> None:
         assert self._callbacks and self._options_ws
+        validate = _OPTION_MESSAGES.validate_json
+        intern = sys.intern
+        from_timestamp = datetime.fromtimestamp
+        enqueue = self._enqueue
+        queue = self._option_queue
         try:
             async for raw in self._options_ws:
-                data = json.loads(raw)
-                for entry in data:
-                    if entry.get("ev") != "Q":
+                for entry in validate(raw):
+                    if entry.ev != "Q":
                         continue
                     quote = OptionQuote(
-                        option_symbol=entry["sym"],
-                        strike=float(entry.get("k", 0.0)),
-                        bid=float(entry.get("bp", 0.0)),
-                        ask=float(entry.get("ap", 0.0)),
-                        expiry=datetime.fromtimestamp(entry.get("x", 0) / 1000),
-                        as_of=to_est(datetime.fromtimestamp(entry["t"] / 1000)),
+                        option_symbol=intern(entry.sym),
+                        strike=entry.k,
+                        bid=entry.bp,
+                        ask=entry.ap,
+                        expiry=from_timestamp(entry.x * 0.001, EST),
+                        as_of=from_timestamp(entry.t * 0.001, EST),
                     )
-                    await self._callbacks.on_option_quote(quote)
+                    enqueue(queue, quote)
         except Exception as exc:  # pylint: disable=broad-except
             await self._callbacks.on_error(exc)
+
+    @staticmethod
+    def _enqueue(queue: asyncio.Queue[T], item: T) -> None:
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(item)
+
+    async def _dispatch(
+        self, queue: asyncio.Queue[T], callback: Callable[[T], Awaitable[None]]
+    ) -> None:
+        assert self._callbacks
+        while True:
+            item = await queue.get()
+            try:
+                await callback(item)
+            except Exception as exc:  # pylint: disable=broad-except
+                await self._callbacks.on_error(exc)
@@ -2,28 +2,40 @@
 
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, timedelta
 
 from sqlalchemy import text
 
 from alphagen.storage import get_engine
 
 
+_DAILY_PNL_SELECT = (
+    "SELECT DATE(as_of) as trade_date, "
+    "SUM(pnl_contrib) as realized_pnl, "
+    "COUNT(*) as trade_count "
+    "FROM executionrow "
+)
+_DAILY_PNL_GROUP = "GROUP BY DATE(as_of) ORDER BY trade_date DESC"
+# Built once; text() parses bind parameters on construction.
+_DAILY_PNL_ALL = text(_DAILY_PNL_SELECT + _DAILY_PNL_GROUP)
+# A half-open range on the raw column lets the planner use the as_of index.
+_DAILY_PNL_ONE = text(
+    _DAILY_PNL_SELECT + "WHERE as_of >= :start AND as_of < :end " + _DAILY_PNL_GROUP
+)
+
+
 async def fetch_daily_pnl(trade_date: date | None = None) -> list[dict[str, float]]:
     engine = get_engine()
-    base_sql = (
-        "SELECT DATE(as_of) as trade_date, "
-        "SUM(pnl_contrib) as realized_pnl, "
-        "COUNT(*) as trade_count "
-        "FROM executionrow "
-    )
-    params: dict[str, str] = {}
     if trade_date:
-        base_sql += "WHERE DATE(as_of) = :trade_date "
-        params["trade_date"] = trade_date.isoformat()
-    base_sql += "GROUP BY DATE(as_of) ORDER BY trade_date DESC"
-    stmt = text(base_sql)
+        stmt = _DAILY_PNL_ONE
+        params = {
+            "start": trade_date.isoformat(),
+            "end": (trade_date + timedelta(days=1)).isoformat(),
+        }
+    else:
+        stmt = _DAILY_PNL_ALL
+        params = {}
     async with engine.connect() as conn:
         result = await conn.execute(stmt, params)
-        rows = [dict(row._mapping) for row in result]
+        rows = [dict(row) for row in result.mappings()]
     return rows
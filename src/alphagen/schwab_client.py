@@ -2,21 +2,168 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Iterable
+import asyncio
+import importlib.util
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from time import monotonic
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable
 
 import httpx
+import orjson
 import structlog
 
-from alphagen.config import load_app_config
+from alphagen.config import CONFIG, EST
 from alphagen.core.events import (
     OptionQuote,
     PositionSnapshot,
     TradeExecution,
     TradeIntent,
 )
-from alphagen.core.time_utils import to_est
+from alphagen.core.time_utils import now_est, to_est
+
+try:  # Optional incremental JSON parser (``fast`` extra)
+    import ijson
+except ImportError:  # pragma: no cover - exercised when ijson is absent
+    ijson = None
+
+try:  # Optional on-disk cache for replayed positions (``backtest`` extra)
+    import diskcache
+except ImportError:  # pragma: no cover - exercised when diskcache is absent
+    diskcache = None
+
+
+# Orders in flight at once when closing positions, to stay under the broker's
+# request rate limit.
+MAX_CONCURRENT_ORDERS = 8
+
+# HTTP/2 needs the optional ``h2`` package (``httpx[http2]``); fall back to
+# HTTP/1.1 keep-alive without it.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=32, max_connections=64, keepalive_expiry=30
+)
+HTTP_TIMEOUT = httpx.Timeout(10, connect=3)
+# Connection failures only, so an order is never sent twice.
+HTTP_CONNECT_RETRIES = 2
+
+# Pooled HTTP clients handed out by SchwabClient.create(), keyed by base URL and
+# API key, and how many SchwabClient instances currently hold each one.
+_http_clients: dict[tuple[str, str | None], httpx.AsyncClient] = {}
+_http_client_refs: dict[tuple[str, str | None], int] = {}
+
+# Distinct option symbols kept by a client's quote cache.
+QUOTE_CACHE_MAX_SIZE = 256
+
+
+class QuoteCache:
+    """Short-lived LRU cache of option quotes keyed by option symbol."""
+
+    def __init__(self, ttl: float, max_size: int = QUOTE_CACHE_MAX_SIZE) -> None:
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, OptionQuote]] = OrderedDict()
+
+    def get(self, option_symbol: str) -> OptionQuote | None:
+        entry = self._entries.get(option_symbol)
+        if entry is None:
+            return None
+        stored_at, quote = entry
+        if monotonic() - stored_at >= self._ttl:
+            del self._entries[option_symbol]
+            return None
+        self._entries.move_to_end(option_symbol)
+        return quote
+
+    def put(self, option_symbol: str, quote: OptionQuote) -> None:
+        if self._ttl <= 0:
+            return
+        self._entries[option_symbol] = (monotonic(), quote)
+        self._entries.move_to_end(option_symbol)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
+class PositionsDiskCache:
+    """Positions snapshots persisted on disk for ``ttl`` seconds.
+
+    Meant for backtests and strategy development, where repeated runs hit
+    identical broker state. Entries are keyed on the account and the current
+    ``ttl``-sized time bucket. A non-positive TTL, or a missing ``diskcache``
+    package, disables it.
+    """
+
+    def __init__(self, directory: str, ttl: float) -> None:
+        self._ttl = ttl
+        self._disk = (
+            diskcache.Cache(directory) if ttl > 0 and diskcache is not None else None
+        )
+
+    def _key(self, account_id: str) -> tuple[str, int]:
+        return account_id, int(time.time() // self._ttl)
+
+    def get(self, account_id: str) -> list[PositionSnapshot] | None:
+        if self._disk is None:
+            return None
+        rows = self._disk.get(self._key(account_id))
+        if rows is None:
+            return None
+        return [PositionSnapshot(**row) for row in rows]
+
+    def put(self, account_id: str, snapshots: list[PositionSnapshot]) -> None:
+        if self._disk is None:
+            return
+        self._disk.set(
+            self._key(account_id),
+            [asdict(snapshot) for snapshot in snapshots],
+            expire=self._ttl,
+        )
+
+    def close(self) -> None:
+        if self._disk is not None:
+            self._disk.close()
+
+
+async def submit_orders(
+    submit_order: Callable[[TradeIntent], Awaitable[TradeExecution]],
+    intents: Iterable[TradeIntent],
+    logger: structlog.BoundLogger,
+) -> list[TradeExecution]:
+    """Submit ``intents`` concurrently, at most MAX_CONCURRENT_ORDERS at a time.
+
+    Results keep the order of the intents. An order that raises is logged and
+    reported as a ``failed`` execution, so one rejection does not hide the
+    orders that went through.
+    """
+    intents = list(intents)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_ORDERS)
+
+    async def submit(intent: TradeIntent) -> TradeExecution:
+        async with semaphore:
+            return await submit_order(intent)
+
+    results = await asyncio.gather(
+        *(submit(intent) for intent in intents), return_exceptions=True
+    )
+    executions: list[TradeExecution] = []
+    for intent, result in zip(intents, results):
+        if isinstance(result, BaseException):
+            logger.error(
+                "submit_order_error", symbol=intent.option_symbol, error=str(result)
+            )
+            result = TradeExecution(
+                order_id="error",
+                status="failed",
+                fill_price=0.0,
+                pnl_contrib=0.0,
+                as_of=now_est(),
+                intent=intent,
+            )
+        executions.append(result)
+    return executions
 
 
 @dataclass
@@ -24,41 +171,113 @@ class SchwabClient:
     _client: httpx.AsyncClient
     _account_id: str
     _logger: structlog.BoundLogger = structlog.get_logger("alphagen.schwab")
+    # Key into the shared HTTP client pool when ``_client`` came from create().
+    _pool_key: tuple[str, str | None] | None = field(default=None, repr=False)
+    # Set by the first close(); later calls must not release the pool again.
+    _closed: bool = field(default=False, init=False, repr=False)
+    _quote_cache: QuoteCache = field(init=False, repr=False)
+    _positions_cache: PositionsDiskCache = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        cfg = CONFIG.schwab
+        self._quote_cache = QuoteCache(cfg.quote_cache_ttl)
+        self._positions_cache = PositionsDiskCache(
+            cfg.positions_cache_dir, cfg.positions_cache_ttl
+        )
 
     @classmethod
     def create(cls) -> "SchwabClient":
-        cfg = load_app_config().schwab
-        headers = {
-            "Authorization": f"Bearer {cfg.api_key}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        """Build a client on the HTTP pool shared by its base URL and API key."""
+        cfg = CONFIG.schwab
         base_url = cfg.base_url or "https://api.schwabapi.com"
-        client = httpx.AsyncClient(base_url=base_url, headers=headers, timeout=30)
-        return cls(client, cfg.account_id)
+        key = (base_url, cfg.api_key)
+        client = _http_clients.get(key)
+        if client is None or client.is_closed:
+            headers = {
+                "Authorization": f"Bearer {cfg.api_key}",
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            }
+            transport = httpx.AsyncHTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                limits=HTTP_LIMITS,
+                retries=HTTP_CONNECT_RETRIES,
+            )
+            client = _http_clients[key] = httpx.AsyncClient(
+                base_url=base_url,
+                headers=headers,
+                timeout=HTTP_TIMEOUT,
+                transport=transport,
+            )
+            _http_client_refs[key] = 0
+        _http_client_refs[key] += 1
+        return cls(client, cfg.account_id, _pool_key=key)
 
     async def close(self) -> None:
+        """Release the HTTP client, closing it once no other instance holds it.
+
+        Safe to call more than once; only the first call releases anything.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._positions_cache.close()
+        key, self._pool_key = self._pool_key, None
+        if key is not None and _http_clients.get(key) is self._client:
+            _http_client_refs[key] -= 1
+            if _http_client_refs[key] > 0:
+                return
+            del _http_clients[key], _http_client_refs[key]
         await self._client.aclose()
 
     async def fetch_positions(self) -> list[PositionSnapshot]:
+        cached = self._positions_cache.get(self._account_id)
+        if cached is not None:
+            return cached
         # Use the correct Schwab API v1 endpoint
         endpoint = f"/trader/v1/accounts/{self._account_id}/positions"
-        response = await self._client.get(endpoint)
-        response.raise_for_status()
-        payload = response.json()
         snapshots: list[PositionSnapshot] = []
-        for entry in payload.get("positions", []):
+        # Positions usually share one snapshot time, so parse each string once.
+        as_of_cache: dict[str, datetime] = {}
+        async for entry in self._position_entries(endpoint):
+            raw_as_of = entry["asOf"]
+            as_of = as_of_cache.get(raw_as_of)
+            if as_of is None:
+                as_of = as_of_cache[raw_as_of] = to_est(
+                    datetime.fromisoformat(raw_as_of)
+                )
             snapshots.append(
                 PositionSnapshot(
-                    symbol=entry["symbol"],
+                    symbol=sys.intern(entry["symbol"]),
                     quantity=int(entry["quantity"]),
                     average_price=float(entry["averagePrice"]),
                     market_value=float(entry["marketValue"]),
-                    as_of=to_est(datetime.fromisoformat(entry["asOf"])),
+                    as_of=as_of,
                 )
             )
+        self._positions_cache.put(self._account_id, snapshots)
         return snapshots
 
+    async def _position_entries(self, endpoint: str) -> AsyncIterator[dict[str, Any]]:
+        """Yield raw position entries from the positions endpoint.
+
+        With ijson installed the body is parsed while it streams in, so large
+        accounts are never buffered whole; otherwise it is read and decoded
+        in one go.
+        """
+        if ijson is None:
+            response = await self._client.get(endpoint)
+            response.raise_for_status()
+            for entry in orjson.loads(response.content).get("positions", []):
+                yield entry
+            return
+        async with self._client.stream("GET", endpoint) as response:
+            response.raise_for_status()
+            async for entry in ijson.items_async(
+                _ResponseReader(response), "positions.item", use_float=True
+            ):
+                yield entry
+
     async def submit_order(self, intent: TradeIntent) -> TradeExecution:
         endpoint = f"/trader/v1/accounts/{self._account_id}/orders"
         order_payload = {
@@ -69,65 +288,101 @@ class SchwabClient:
             "price": intent.limit_price,
             "stopPrice": intent.stop_loss,
         }
-        response = await self._client.post(endpoint, json=order_payload)
+        # The client's default headers already declare a JSON body.
+        response = await self._client.post(
+            endpoint, content=orjson.dumps(order_payload)
+        )
         response.raise_for_status()
-        order_id = response.json().get("orderId", "unknown")
+        order_id = orjson.loads(response.content).get("orderId", "unknown")
         return TradeExecution(
             order_id=order_id,
             status="submitted",
             fill_price=intent.limit_price,
             pnl_contrib=0.0,
-            as_of=to_est(datetime.now(timezone.utc)),
+            as_of=now_est(),
             intent=intent,
         )
 
     async def close_positions(
         self, intents: Iterable[TradeIntent]
     ) -> list[TradeExecution]:
-        executions: list[TradeExecution] = []
-        for intent in intents:
-            exec_result = await self.submit_order(intent)
-            executions.append(exec_result)
-        return executions
+        return await submit_orders(self.submit_order, intents, self._logger)
 
     async def fetch_option_quote(self, option_symbol: str) -> OptionQuote | None:
+        cached = self._quote_cache.get(option_symbol)
+        if cached is not None:
+            return cached
         endpoint = f"/marketdata/v1/quotes/{option_symbol}"
         response = await self._client.get(endpoint)
         response.raise_for_status()
-        payload = response.json()
-        quote_payload = (
-            payload.get(option_symbol) or payload.get("quotes", {}).get(option_symbol)
-            if isinstance(payload.get("quotes"), dict)
-            else None
-        )
+        payload = orjson.loads(response.content)
+        quote_payload = payload.get(option_symbol)
+        if quote_payload is None:
+            quotes = payload.get("quotes")
+            if isinstance(quotes, dict):
+                quote_payload = quotes.get(option_symbol)
         if not quote_payload:
             return None
-        bid = float(quote_payload.get("bidPrice") or 0.0)
-        ask = float(quote_payload.get("askPrice") or 0.0)
-        strike = float(quote_payload.get("strikePrice") or 0.0)
-        quote_time = quote_payload.get("quoteTimeInLong") or quote_payload.get(
-            "quoteTime"
-        )
-        as_of = (
-            to_est(datetime.fromtimestamp(quote_time / 1000, tz=timezone.utc))
-            if quote_time
-            else to_est(datetime.now(timezone.utc))
-        )
-        expiry_raw = quote_payload.get("expirationDate") or quote_payload.get(
-            "optionExpirationDate"
-        )
-        if expiry_raw:
-            try:
-                expiry = datetime.fromisoformat(expiry_raw.replace("Z", "+00:00"))
-            except ValueError:
-                expiry = datetime.now(timezone.utc)
-        else:
-            expiry = datetime.now(timezone.utc)
-        return OptionQuote(
-            option_symbol=option_symbol,
-            strike=strike,
-            bid=bid,
-            ask=ask,
-            expiry=expiry,
-            as_of=as_of,
+        quote = _parse_option_quote(option_symbol, quote_payload)
+        self._quote_cache.put(option_symbol, quote)
+        return quote
+
+    async def fetch_option_quotes(self, option_symbols: list[str]) -> list[OptionQuote]:
+        """Fetch quotes for several option symbols in one request."""
+        if not option_symbols:
+            return []
+        response = await self._client.get(
+            "/marketdata/v1/quotes", params={"symbols": ",".join(option_symbols)}
         )
+        response.raise_for_status()
+        payload = orjson.loads(response.content)
+        quotes: list[OptionQuote] = []
+        now = now_est()
+        for option_symbol in option_symbols:
+            quote_payload = payload.get(option_symbol)
+            if quote_payload:
+                quotes.append(_parse_option_quote(option_symbol, quote_payload, now))
+        return quotes
+
+
+class _ResponseReader:
+    """Async file-like view of a streamed response body, as ijson expects."""
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            # ijson probes with read(0) to tell bytes from text streams
+            return b""
+        return await anext(self._chunks, b"")
+
+
+def _parse_option_quote(
+    option_symbol: str, quote_payload: dict, now: datetime | None = None
+) -> OptionQuote:
+    """Build a quote; ``now`` stands in for missing times, shared across a batch."""
+    if now is None:
+        now = now_est()
+    get = quote_payload.get
+    bid = float(get("bidPrice") or 0.0)
+    ask = float(get("askPrice") or 0.0)
+    strike = float(get("strikePrice") or 0.0)
+    quote_time = get("quoteTimeInLong") or get("quoteTime")
+    as_of = datetime.fromtimestamp(quote_time * 0.001, EST) if quote_time else now
+    expiry_raw = get("expirationDate") or get("optionExpirationDate")
+    if expiry_raw:
+        try:
+            expiry = datetime.fromisoformat(expiry_raw.replace("Z", "+00:00"))
+        except ValueError:
+            expiry = now
+    else:
+        expiry = now
+    return OptionQuote(
+        option_symbol=option_symbol,
+        strike=strike,
+        bid=bid,
+        ask=ask,
+        expiry=expiry,
+        as_of=as_of,
+    )
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, timezone
+import asyncio
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Callable, Iterable, TypeVar
 
+import orjson
 import structlog
 
 try:
@@ -56,7 +62,13 @@ except ImportError:
         """Create a client from token file (mock implementation)."""
         return Client(session_cache=token_path)
 
-from alphagen.config import load_app_config
+try:
+    # The browser login flow comes from schwab-py, the dependency pyproject pins
+    from schwab.auth import client_from_login_flow
+except ImportError:
+    client_from_login_flow = None
+
+from alphagen.config import CONFIG
 from alphagen.core.events import (
     EquityTick,
     OptionQuote,
@@ -64,7 +76,43 @@ from alphagen.core.events import (
     TradeExecution,
     TradeIntent,
 )
-from alphagen.core.time_utils import to_est
+from alphagen.core.time_utils import now_est
+from alphagen.schwab_client import (
+    PositionsDiskCache,
+    QuoteCache,
+    submit_orders,
+)
+
+
+T = TypeVar("T")
+
+# schwab-api is synchronous; its calls run on this bounded pool shared by all
+# clients so a burst of requests cannot stall the event loop or spawn threads.
+_API_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="schwab-api")
+# Quote fan-out may occupy this many of those workers, so an order or position
+# request is never queued behind a long list of quotes.
+MAX_CONCURRENT_QUOTES = 3
+
+
+def _response_payload(response: Any) -> Any:
+    """Decode a schwab-api Response with orjson; decoded payloads pass through."""
+    content = getattr(response, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        return orjson.loads(content)
+    if hasattr(response, "json"):
+        return response.json()
+    if hasattr(response, "text"):
+        return orjson.loads(response.text)
+    return response
+
+
+class InvalidTokenError(RuntimeError):
+    """Raised when Schwab rejects the OAuth token as invalid or expired."""
+
+
+# Client handed out by SchwabOAuthClient.shared() and its live reference count.
+_shared_client: "SchwabOAuthClient | None" = None
+_shared_refs = 0
 
 
 @dataclass
@@ -74,11 +122,20 @@ class SchwabOAuthClient:
     _client: Client
     _account_id: str
     _logger: structlog.BoundLogger = structlog.get_logger("alphagen.schwab_oauth")
+    _quote_cache: QuoteCache = field(init=False, repr=False)
+    _positions_cache: PositionsDiskCache = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        cfg = CONFIG.schwab
+        self._quote_cache = QuoteCache(cfg.quote_cache_ttl)
+        self._positions_cache = PositionsDiskCache(
+            cfg.positions_cache_dir, cfg.positions_cache_ttl
+        )
 
     @classmethod
     def create(cls) -> "SchwabOAuthClient | None":
         """Create Schwab client with OAuth2 authentication."""
-        cfg = load_app_config().schwab
+        cfg = CONFIG.schwab
         logger = structlog.get_logger("alphagen.schwab_oauth")
 
         # Check if required settings are available
@@ -115,11 +172,43 @@ class SchwabOAuthClient:
 
         return cls(client, cfg.account_id)
 
+    @classmethod
+    def shared(cls) -> "SchwabOAuthClient | None":
+        """Return the process-wide client, creating it on first use.
+
+        Every call takes a reference that must be dropped with ``release()``.
+        """
+        global _shared_client, _shared_refs
+        if _shared_client is None:
+            _shared_client = cls.create()
+            if _shared_client is None:
+                return None
+        _shared_refs += 1
+        return _shared_client
+
+    async def release(self) -> None:
+        """Drop a reference taken by ``shared()``, closing on the last one."""
+        global _shared_client, _shared_refs
+        if self is not _shared_client:
+            await self.close()
+            return
+        _shared_refs -= 1
+        if _shared_refs <= 0:
+            _shared_client = None
+            _shared_refs = 0
+            await self.close()
+
+    async def _run_blocking(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking schwab-api call on the shared worker pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_API_EXECUTOR, func, *args)
+
     async def close(self) -> None:
         """Close the client connection."""
         if self._client:
             # schwab-py client doesn't have an explicit close method
             pass
+        self._positions_cache.close()
 
     async def fetch_positions(self) -> list[PositionSnapshot]:
         """Fetch current positions from Schwab."""
@@ -131,24 +220,27 @@ class SchwabOAuthClient:
             # Return empty list instead of mock data
             return []
 
+        cached = self._positions_cache.get(self._account_id)
+        if cached is not None:
+            return cached
+
         try:
             # Use schwab-py client to get account information
-            account_info = self._client.get_account(self._account_id)
+            account_info = await self._run_blocking(
+                self._client.get_account, self._account_id
+            )
 
             # Handle case where get_account returns a Response object
-            if hasattr(account_info, "json"):
-                account_info = account_info.json()
-            elif hasattr(account_info, "text"):
-                import json
-
-                account_info = json.loads(account_info.text)
+            account_info = _response_payload(account_info)
 
             snapshots: list[PositionSnapshot] = []
             if isinstance(account_info, dict) and "securitiesAccount" in account_info:
                 positions = account_info["securitiesAccount"].get("positions", [])
+                # One fetch is one snapshot; stamp every position alike.
+                as_of = now_est()
                 for position in positions:
                     instrument = position.get("instrument", {})
-                    symbol = instrument.get("symbol", "UNKNOWN")
+                    symbol = sys.intern(instrument.get("symbol", "UNKNOWN"))
 
                     # Calculate net quantity (long - short)
                     long_qty = float(position.get("longQuantity", 0))
@@ -165,7 +257,7 @@ class SchwabOAuthClient:
                             quantity=net_qty,
                             average_price=average_price,
                             market_value=market_value,
-                            as_of=to_est(datetime.now(timezone.utc)),
+                            as_of=as_of,
                         )
                     )
             else:
@@ -176,6 +268,7 @@ class SchwabOAuthClient:
                 # Return empty list if we can't parse the account info
                 return []
 
+            self._positions_cache.put(self._account_id, snapshots)
             self._logger.info("positions_fetched", count=len(snapshots))
             return snapshots
 
@@ -194,7 +287,7 @@ class SchwabOAuthClient:
                 status="failed",
                 fill_price=0.0,
                 pnl_contrib=0.0,
-                as_of=to_est(datetime.now(timezone.utc)),
+                as_of=now_est(),
                 intent=intent,
             )
 
@@ -218,7 +311,9 @@ class SchwabOAuthClient:
                 ],
             }
 
-            order_response = self._client.place_order(self._account_id, order_spec)
+            order_response = await self._run_blocking(
+                self._client.place_order, self._account_id, order_spec
+            )
             order_id = order_response.get("order_id", "unknown")
 
             return TradeExecution(
@@ -226,7 +321,7 @@ class SchwabOAuthClient:
                 status="submitted",
                 fill_price=intent.limit_price,
                 pnl_contrib=0.0,
-                as_of=to_est(datetime.now(timezone.utc)),
+                as_of=now_est(),
                 intent=intent,
             )
 
@@ -237,26 +332,22 @@ class SchwabOAuthClient:
                 status="failed",
                 fill_price=0.0,
                 pnl_contrib=0.0,
-                as_of=to_est(datetime.now(timezone.utc)),
+                as_of=now_est(),
                 intent=intent,
             )
 
     async def close_positions(
         self, intents: Iterable[TradeIntent]
     ) -> list[TradeExecution]:
-        """Close multiple positions."""
-        executions: list[TradeExecution] = []
-        for intent in intents:
-            exec_result = await self.submit_order(intent)
-            executions.append(exec_result)
-        return executions
+        """Close multiple positions, submitting the orders concurrently."""
+        return await submit_orders(self.submit_order, intents, self._logger)
 
     async def _refresh_token_if_needed(self) -> bool:
         """Refresh OAuth token if it's expired."""
         try:
             # Check if token is expired and refresh if needed
             if hasattr(self._client, "ensure_valid_access_token"):
-                self._client.ensure_valid_access_token()
+                await self._run_blocking(self._client.ensure_valid_access_token)
                 return True
             return True
         except Exception as e:
@@ -281,7 +372,7 @@ class SchwabOAuthClient:
                 return None
 
             # Use schwab-py client to get equity quote
-            quote_response = self._client.get_quote(symbol)
+            quote_response = await self._run_blocking(self._client.get_quote, symbol)
         except Exception as e:
             # Check if it's a token error
             error_msg = str(e)
@@ -291,8 +382,8 @@ class SchwabOAuthClient:
                     msg="OAuth token is invalid or expired. Please re-authenticate.",
                     error=error_msg
                 )
-                # Re-raise to allow upper layers to handle
-                raise
+                # Re-raise as a typed error so upper layers need no string checks
+                raise InvalidTokenError(error_msg) from e
             # For other errors, log and return None
             self._logger.error("fetch_equity_quote_error", symbol=symbol, error=error_msg)
             return None
@@ -300,18 +391,17 @@ class SchwabOAuthClient:
         try:
 
             # Handle Response object
-            if hasattr(quote_response, "json"):
-                quote_data = quote_response.json()
-            else:
-                quote_data = quote_response
+            quote_data = _response_payload(quote_response)
 
-            # Debug logging
-            self._logger.debug(
-                "schwab_quote_response",
-                symbol=symbol,
-                response_type=type(quote_data).__name__,
-            )
-            if isinstance(quote_data, dict):
+            # Debug logging; skip building the field lists when it is filtered
+            debug = self._logger.is_enabled_for(logging.DEBUG)
+            if debug:
+                self._logger.debug(
+                    "schwab_quote_response",
+                    symbol=symbol,
+                    response_type=type(quote_data).__name__,
+                )
+            if debug and isinstance(quote_data, dict):
                 self._logger.debug("schwab_quote_keys", keys=list(quote_data.keys()))
 
             # Parse the response to extract quote data
@@ -325,12 +415,13 @@ class SchwabOAuthClient:
 
             if quote_info:
                 # Debug: log available fields
-                self._logger.debug(
-                    "quote_info_fields",
-                    fields=list(quote_info.keys())
-                    if isinstance(quote_info, dict)
-                    else "not_dict",
-                )
+                if debug:
+                    self._logger.debug(
+                        "quote_info_fields",
+                        fields=list(quote_info.keys())
+                        if isinstance(quote_info, dict)
+                        else "not_dict",
+                    )
 
                 # Extract price data from the 'quote' field
                 quote_data = quote_info.get("quote", {})
@@ -338,12 +429,13 @@ class SchwabOAuthClient:
                     # Fallback to direct fields
                     quote_data = quote_info
 
-                self._logger.debug(
-                    "quote_data_fields",
-                    fields=list(quote_data.keys())
-                    if isinstance(quote_data, dict)
-                    else "not_dict",
-                )
+                if debug:
+                    self._logger.debug(
+                        "quote_data_fields",
+                        fields=list(quote_data.keys())
+                        if isinstance(quote_data, dict)
+                        else "not_dict",
+                    )
 
                 last_price = quote_data.get("lastPrice", 0.0)
                 bid_price = quote_data.get("bidPrice", 0.0)
@@ -366,7 +458,7 @@ class SchwabOAuthClient:
 
                 # For now, use mock VWAP and MA9 - in production these would be calculated
                 # from historical data or real-time calculations
-                current_time = to_est(datetime.now(timezone.utc))
+                current_time = now_est()
 
                 return EquityTick(
                     symbol=symbol,
@@ -410,12 +502,19 @@ class SchwabOAuthClient:
             )
             return None
 
+        cached = self._quote_cache.get(option_symbol)
+        if cached is not None:
+            return cached
+
         try:
             # Use schwab-py client to get option quote
-            quote_response = self._client.get_option_chain(
-                option_symbol,
-                contract_type="CALL",  # or "PUT"
-                include_quotes=True,
+            quote_response = await self._run_blocking(
+                partial(
+                    self._client.get_option_chain,
+                    option_symbol,
+                    contract_type="CALL",  # or "PUT"
+                    include_quotes=True,
+                )
             )
 
             # Parse the response to extract quote data
@@ -426,7 +525,7 @@ class SchwabOAuthClient:
                     for strike, contracts in strikes.items():
                         for contract in contracts:
                             if contract["symbol"] == option_symbol:
-                                return OptionQuote(
+                                quote = OptionQuote(
                                     option_symbol=option_symbol,
                                     strike=float(contract["strikePrice"]),
                                     bid=float(contract["bid"] or 0.0),
@@ -436,8 +535,10 @@ class SchwabOAuthClient:
                                             "Z", "+00:00"
                                         )
                                     ),
-                                    as_of=to_est(datetime.now(timezone.utc)),
+                                    as_of=now_est(),
                                 )
+                                self._quote_cache.put(option_symbol, quote)
+                                return quote
 
             return None
 
@@ -447,6 +548,21 @@ class SchwabOAuthClient:
             )
             return None
 
+    async def fetch_option_quotes(self, option_symbols: list[str]) -> list[OptionQuote]:
+        """Fetch quotes for several option symbols.
+
+        schwab-py exposes option quotes per chain, so this fans out to
+        ``fetch_option_quote`` and drops symbols without a quote.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUOTES)
+
+        async def fetch(symbol: str) -> OptionQuote | None:
+            async with semaphore:
+                return await self.fetch_option_quote(symbol)
+
+        quotes = await asyncio.gather(*(fetch(symbol) for symbol in option_symbols))
+        return [quote for quote in quotes if quote is not None]
+
     def save_token(self, token_path: str) -> None:
         """Save the OAuth2 token to a file."""
         if self._client and hasattr(self._client, "save_token"):
@@ -466,3 +582,41 @@ class SchwabOAuthClient:
         except Exception as e:
             self._logger.warning("token_validation_failed", error=str(e))
             return False
+
+
+async def run_oauth_setup() -> bool:
+    """Run the Schwab OAuth2 login flow and save the token file.
+
+    The login flow blocks on the browser round-trip, so it runs in a worker
+    thread and callers on the event loop stay responsive.
+    """
+    cfg = CONFIG.schwab
+    logger = structlog.get_logger("alphagen.schwab_oauth")
+
+    if client_from_login_flow is None:
+        logger.error("oauth_setup_unavailable", msg="schwab-py is not installed")
+        return False
+    if not cfg.api_key or not cfg.api_secret or not cfg.callback_url:
+        logger.error(
+            "oauth_setup_settings_missing",
+            api_key=bool(cfg.api_key),
+            api_secret=bool(cfg.api_secret),
+            callback_url=bool(cfg.callback_url),
+        )
+        return False
+
+    try:
+        await asyncio.to_thread(
+            client_from_login_flow,
+            api_key=cfg.api_key,
+            app_secret=cfg.api_secret,
+            callback_url=cfg.callback_url,
+            token_path=cfg.token_path,
+            interactive=False,
+        )
+    except Exception as e:
+        logger.error("oauth_setup_failed", error=str(e))
+        return False
+
+    logger.info("oauth_setup_complete", path=cfg.token_path)
+    return True
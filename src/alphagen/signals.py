@@ -2,13 +2,53 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import Callable, Coroutine, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Coroutine, Iterable, Optional
 
-from alphagen.config import TRADE_COOLDOWN
+import numpy as np
+
+from alphagen.config import EST, TRADE_COOLDOWN
 from alphagen.core.events import CooldownState, NormalizedTick, Signal
 from alphagen.core.time_utils import now_est
 
+# Row layout accepted by SignalEngine.handle_batch; as_of is naive UTC.
+TICK_BATCH_DTYPE = np.dtype(
+    [
+        ("as_of", "datetime64[us]"),
+        ("vwap", "f8"),
+        ("ma9", "f8"),
+        ("option_symbol", "U32"),
+        ("option_mid", "f8"),
+    ]
+)
+
+
+def _to_datetime64(moment: datetime) -> np.datetime64:
+    return np.datetime64(moment.astimezone(timezone.utc).replace(tzinfo=None), "us")
+
+
+def _from_datetime64(value: np.datetime64) -> datetime:
+    return value.item().replace(tzinfo=timezone.utc).astimezone(EST)
+
+
+def tick_batch(ticks: Iterable[NormalizedTick]) -> np.ndarray:
+    """Pack normalized ticks into a ``TICK_BATCH_DTYPE`` array.
+
+    Ticks without an option quote are dropped, as ``handle_tick`` ignores them.
+    """
+    rows = [
+        (
+            _to_datetime64(tick.as_of),
+            tick.equity.session_vwap,
+            tick.equity.ma9,
+            tick.option.option_symbol,
+            tick.option.mid(),
+        )
+        for tick in ticks
+        if tick.option
+    ]
+    return np.array(rows, dtype=TICK_BATCH_DTYPE)
+
 
 class SignalEngine:
     def __init__(
@@ -55,6 +95,53 @@ class SignalEngine:
         self._cooldown_state = CooldownState(until=cooldown_until)
         self._last_diff = diff
 
+    async def handle_batch(self, ticks: np.ndarray) -> None:
+        """Evaluate a time-ordered ``TICK_BATCH_DTYPE`` array in one pass.
+
+        Emits the same signals as feeding each row to ``handle_tick``, but only
+        the crossing rows are visited in Python, which suits historical replay.
+        """
+        if ticks.size == 0:
+            return
+        diff = ticks["vwap"] - ticks["ma9"]
+        prev = np.empty_like(diff)
+        prev[1:] = diff[:-1]
+        prev[0] = np.nan if self._last_diff is None else self._last_diff
+        crossed = (diff == 0) | (np.sign(diff) * np.sign(prev) < 0)
+        if self._last_diff is None:
+            crossed[0] = False
+        candidates = np.flatnonzero(crossed)
+        times = ticks["as_of"]
+        candidate_times = times[candidates]
+        cooldown = np.timedelta64(self._cooldown_duration, "us")
+
+        until = times[0]
+        if self._cooldown_state.active(_from_datetime64(times[0])):
+            until = _to_datetime64(self._cooldown_state.until)
+        pos = int(np.searchsorted(candidate_times, until))
+        while pos < candidates.size:
+            index = candidates[pos]
+            now = _from_datetime64(times[index])
+            cooldown_until = now + self._cooldown_duration
+            rationale = (
+                "VWAP/MA9 crossover detected "
+                f"(diff={diff[index]:.4f}, prev={prev[index]:.4f})"
+            )
+            await self._emit(
+                Signal(
+                    as_of=now,
+                    action="SELL_TO_OPEN" if diff[index] > 0 else "SELL_PUT_TO_OPEN",
+                    option_symbol=str(ticks["option_symbol"][index]),
+                    reference_price=float(ticks["option_mid"][index]),
+                    rationale=rationale,
+                    cooldown_until=cooldown_until,
+                )
+            )
+            self._cooldown_state = CooldownState(until=cooldown_until)
+            until = times[index] + cooldown
+            pos = max(pos + 1, int(np.searchsorted(candidate_times, until)))
+        self._last_diff = float(diff[-1])
+
     def clear_cooldown(self) -> None:
         self._cooldown_state = CooldownState.expired()
 
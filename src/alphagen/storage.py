@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import AsyncIterator, TYPE_CHECKING
-
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from typing import Any, AsyncIterator, TYPE_CHECKING
+
+import structlog
+from sqlalchemy import Connection, Index, Table, insert, inspect
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.schema import CreateTable
 from sqlmodel import Field, SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.alphagen.config import load_app_config
+from src.alphagen.config import CONFIG
 
 
 class EquityTickRow(SQLModel, table=True):
@@ -20,18 +28,21 @@ class EquityTickRow(SQLModel, table=True):
     price: float
     session_vwap: float
     ma9: float
-    as_of: datetime
+    as_of: datetime = Field(index=True)
 
 
 class OptionQuoteRow(SQLModel, table=True):
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        Index("ix_optionquoterow_option_symbol_as_of", "option_symbol", "as_of"),
+        {"extend_existing": True},
+    )
     id: int | None = Field(default=None, primary_key=True)
     option_symbol: str
     strike: float
     bid: float
     ask: float
     expiry: datetime
-    as_of: datetime
+    as_of: datetime = Field(index=True)
 
 
 class PositionSnapshotRow(SQLModel, table=True):
@@ -41,13 +52,16 @@ class PositionSnapshotRow(SQLModel, table=True):
     quantity: int
     average_price: float
     market_value: float
-    as_of: datetime
+    as_of: datetime = Field(index=True)
 
 
 class NormalizedTickRow(SQLModel, table=True):
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        Index("ix_normalizedtickrow_option_symbol_as_of", "option_symbol", "as_of"),
+        {"extend_existing": True},
+    )
     id: int | None = Field(default=None, primary_key=True)
-    as_of: datetime
+    as_of: datetime = Field(index=True)
     equity_symbol: str
     equity_price: float
     session_vwap: float
@@ -59,18 +73,24 @@ class NormalizedTickRow(SQLModel, table=True):
 
 
 class SignalRow(SQLModel, table=True):
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        Index("ix_signalrow_option_symbol_as_of", "option_symbol", "as_of"),
+        {"extend_existing": True},
+    )
     id: int | None = Field(default=None, primary_key=True)
     action: str
     option_symbol: str
     reference_price: float
     rationale: str
-    as_of: datetime
+    as_of: datetime = Field(index=True)
     cooldown_until: datetime
 
 
 class TradeIntentRow(SQLModel, table=True):
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        Index("ix_tradeintentrow_option_symbol_as_of", "option_symbol", "as_of"),
+        {"extend_existing": True},
+    )
     id: int | None = Field(default=None, primary_key=True)
     action: str
     option_symbol: str
@@ -78,7 +98,7 @@ class TradeIntentRow(SQLModel, table=True):
     limit_price: float
     stop_loss: float
     take_profit: float
-    as_of: datetime
+    as_of: datetime = Field(index=True)
 
 
 class ExecutionRow(SQLModel, table=True):
@@ -88,29 +108,53 @@ class ExecutionRow(SQLModel, table=True):
     status: str
     fill_price: float
     pnl_contrib: float
-    as_of: datetime
+    as_of: datetime = Field(index=True)
     intent_id: int | None = Field(default=None)
 
 
 _engine: AsyncEngine | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
 
 
 def get_engine() -> AsyncEngine:
     global _engine
     if _engine is None:
-        database_url = load_app_config().storage.database_url
+        database_url = CONFIG.storage.database_url
         _engine = create_async_engine(database_url, echo=False, future=True)
     return _engine
 
 
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Return the session factory bound once to the shared engine."""
+    global _session_factory
+    if _session_factory is None:
+        # Rows are not read back after commit, so skip the reload on access.
+        _session_factory = async_sessionmaker(
+            get_engine(), class_=AsyncSession, expire_on_commit=False
+        )
+    return _session_factory
+
+
+def _create_schema(connection: Connection) -> None:
+    existing = set(inspect(connection).get_table_names())
+    for table in SQLModel.metadata.sorted_tables:
+        if table.name not in existing:
+            connection.execute(CreateTable(table))
+    # Indexes are checked one by one rather than left to create_all, so
+    # databases created before an index was declared pick it up too.
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
 async def init_models() -> None:
     async with get_engine().begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.run_sync(_create_schema)
 
 
 @asynccontextmanager
 async def session_scope() -> AsyncIterator[AsyncSession]:
-    session = AsyncSession(get_engine())
+    session = get_session_factory()()
     try:
         yield session
         await session.commit()
@@ -121,6 +165,156 @@ async def session_scope() -> AsyncIterator[AsyncSession]:
         await session.close()
 
 
+# --- Batched writes ------------------------------------------------------
+# Attempts per batch before its rows are dropped, and the pause before the
+# first retry, doubled after each further failure.
+WRITE_ATTEMPTS = 5
+RETRY_BACKOFF = 0.1
+
+
+class BulkWriter:
+    """Coalesces queued rows into one commit and one INSERT per table per batch.
+
+    A batch is written once ``max_batch`` rows are waiting, or
+    ``flush_interval`` seconds after its first row arrived. A batch that fails
+    is retried with backoff while newer rows wait in the queue; after
+    ``WRITE_ATTEMPTS`` failures its rows are dropped and logged.
+    """
+
+    def __init__(self, max_batch: int = 200, flush_interval: float = 0.05) -> None:
+        self._max_batch = max_batch
+        self._flush_interval = flush_interval
+        self._queue: asyncio.Queue[SQLModel] = asyncio.Queue()
+        self._pending: list[SQLModel] = []
+        self._task: asyncio.Task[None] | None = None
+        # The batch being written; shielded so stopping the flusher waits on it.
+        self._writing: asyncio.Future[None] | None = None
+        self._logger = structlog.get_logger("alphagen.storage")
+
+    @property
+    def running(self) -> bool:
+        task = self._task
+        return (
+            task is not None
+            and not task.done()
+            and task.get_loop() is asyncio.get_running_loop()
+        )
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._flusher())
+
+    def enqueue(self, *rows: SQLModel) -> None:
+        for row in rows:
+            self._queue.put_nowait(row)
+
+    async def stop(self) -> None:
+        """Stop the flusher and write any rows still queued.
+
+        A batch already being written, retries included, is finished rather
+        than cancelled.
+        """
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        if self._writing is not None:
+            await asyncio.gather(self._writing, return_exceptions=True)
+        while self._pending or not self._queue.empty():
+            await self._flush_pending()
+
+    def _take(self, limit: int) -> list[SQLModel]:
+        rows: list[SQLModel] = []
+        while len(rows) < limit and not self._queue.empty():
+            rows.append(self._queue.get_nowait())
+        return rows
+
+    async def _flusher(self) -> None:
+        while True:
+            self._pending.append(await self._queue.get())
+            if self._queue.qsize() < self._max_batch - 1:
+                # Give the batch time to fill before paying for a commit
+                await asyncio.sleep(self._flush_interval)
+            await self._flush_pending()
+
+    async def _flush_pending(self) -> None:
+        self._pending.extend(self._take(self._max_batch - len(self._pending)))
+        rows, self._pending = self._pending, []
+        self._writing = asyncio.ensure_future(self._write(rows))
+        await asyncio.shield(self._writing)
+
+    async def _write(self, rows: list[SQLModel]) -> None:
+        delay = RETRY_BACKOFF
+        for attempt in range(1, WRITE_ATTEMPTS + 1):
+            try:
+                async with session_scope() as session:
+                    for table, values in _rows_by_table(rows).items():
+                        await session.exec(insert(table), params=values)
+                return
+            except Exception as exc:  # pylint: disable=broad-except
+                if attempt == WRITE_ATTEMPTS:
+                    # A bad row must not block every later write
+                    self._logger.error(
+                        "bulk_write_dropped",
+                        rows=len(rows),
+                        attempts=attempt,
+                        error=str(exc),
+                    )
+                    return
+                self._logger.warning(
+                    "bulk_write_failed",
+                    rows=len(rows),
+                    attempt=attempt,
+                    retry_in=delay,
+                    error=str(exc),
+                )
+                await asyncio.sleep(delay)
+                delay *= 2
+
+
+def _rows_by_table(rows: list[SQLModel]) -> dict[Table, list[dict[str, Any]]]:
+    """Column values per table, for Core INSERTs that bypass the unit of work.
+
+    Rows are append-only, so ``id`` is left for the database to assign.
+    """
+    grouped: dict[Table, list[dict[str, Any]]] = {}
+    for row in rows:
+        grouped.setdefault(type(row).__table__, []).append(
+            row.model_dump(exclude={"id"})
+        )
+    return grouped
+
+
+_bulk_writer: BulkWriter | None = None
+
+
+def start_bulk_writer() -> BulkWriter:
+    """Route the insert helpers through a batching writer on the running loop."""
+    global _bulk_writer
+    if _bulk_writer is None or not _bulk_writer.running:
+        _bulk_writer = BulkWriter()
+        _bulk_writer.start()
+    return _bulk_writer
+
+
+async def stop_bulk_writer() -> None:
+    """Flush and detach the batching writer; helpers write directly again."""
+    global _bulk_writer
+    writer, _bulk_writer = _bulk_writer, None
+    if writer is not None:
+        await writer.stop()
+
+
+async def _persist(*rows: SQLModel) -> None:
+    writer = _bulk_writer
+    if writer is not None and writer.running:
+        writer.enqueue(*rows)
+        return
+    async with session_scope() as session:
+        for row in rows:
+            session.add(row)
+
+
 # --- Persistence helpers -------------------------------------------------
 if TYPE_CHECKING:
     from alphagen.core.events import (
@@ -135,47 +329,45 @@ if TYPE_CHECKING:
 
 
 async def insert_equity_tick(tick: "EquityTick") -> None:
-    async with session_scope() as session:
-        session.add(
-            EquityTickRow(
-                symbol=tick.symbol,
-                price=tick.price,
-                session_vwap=tick.session_vwap,
-                ma9=tick.ma9,
-                as_of=tick.as_of,
-            )
+    await _persist(
+        EquityTickRow(
+            symbol=tick.symbol,
+            price=tick.price,
+            session_vwap=tick.session_vwap,
+            ma9=tick.ma9,
+            as_of=tick.as_of,
         )
+    )
 
 
 async def insert_option_quote(quote: "OptionQuote") -> None:
-    async with session_scope() as session:
-        session.add(
-            OptionQuoteRow(
-                option_symbol=quote.option_symbol,
-                strike=quote.strike,
-                bid=quote.bid,
-                ask=quote.ask,
-                expiry=quote.expiry,
-                as_of=quote.as_of,
-            )
+    await _persist(
+        OptionQuoteRow(
+            option_symbol=quote.option_symbol,
+            strike=quote.strike,
+            bid=quote.bid,
+            ask=quote.ask,
+            expiry=quote.expiry,
+            as_of=quote.as_of,
         )
+    )
 
 
 async def insert_signal(signal: "Signal") -> None:
-    async with session_scope() as session:
-        session.add(
-            SignalRow(
-                action=signal.action,
-                option_symbol=signal.option_symbol,
-                reference_price=signal.reference_price,
-                rationale=signal.rationale,
-                as_of=signal.as_of,
-                cooldown_until=signal.cooldown_until,
-            )
+    await _persist(
+        SignalRow(
+            action=signal.action,
+            option_symbol=signal.option_symbol,
+            reference_price=signal.reference_price,
+            rationale=signal.rationale,
+            as_of=signal.as_of,
+            cooldown_until=signal.cooldown_until,
         )
+    )
 
 
 async def insert_trade_intent(intent: "TradeIntent") -> int:
+    # Written immediately: callers need the generated primary key.
     async with session_scope() as session:
         row = TradeIntentRow(
             action=intent.action,
@@ -194,48 +386,47 @@ async def insert_trade_intent(intent: "TradeIntent") -> int:
 async def insert_execution(
     execution: "TradeExecution", intent_id: int | None = None
 ) -> None:
-    async with session_scope() as session:
-        session.add(
-            ExecutionRow(
-                order_id=execution.order_id,
-                status=execution.status,
-                fill_price=execution.fill_price,
-                pnl_contrib=execution.pnl_contrib,
-                as_of=execution.as_of,
-                intent_id=intent_id,
-            )
+    await _persist(
+        ExecutionRow(
+            order_id=execution.order_id,
+            status=execution.status,
+            fill_price=execution.fill_price,
+            pnl_contrib=execution.pnl_contrib,
+            as_of=execution.as_of,
+            intent_id=intent_id,
         )
+    )
 
 
 async def insert_positions(positions: list["PositionSnapshot"]) -> None:
     if not positions:
         return
-    async with session_scope() as session:
-        for snapshot in positions:
-            session.add(
-                PositionSnapshotRow(
-                    symbol=snapshot.symbol,
-                    quantity=snapshot.quantity,
-                    average_price=snapshot.average_price,
-                    market_value=snapshot.market_value,
-                    as_of=snapshot.as_of,
-                )
+    await _persist(
+        *(
+            PositionSnapshotRow(
+                symbol=snapshot.symbol,
+                quantity=snapshot.quantity,
+                average_price=snapshot.average_price,
+                market_value=snapshot.market_value,
+                as_of=snapshot.as_of,
             )
+            for snapshot in positions
+        )
+    )
 
 
 async def insert_normalized_tick(tick: "NormalizedTick") -> None:
-    async with session_scope() as session:
-        option = tick.option
-        session.add(
-            NormalizedTickRow(
-                as_of=tick.as_of,
-                equity_symbol=tick.equity.symbol,
-                equity_price=tick.equity.price,
-                session_vwap=tick.equity.session_vwap,
-                ma9=tick.equity.ma9,
-                option_symbol=option.option_symbol if option else None,
-                option_strike=option.strike if option else None,
-                option_bid=option.bid if option else None,
-                option_ask=option.ask if option else None,
-            )
+    option = tick.option
+    await _persist(
+        NormalizedTickRow(
+            as_of=tick.as_of,
+            equity_symbol=tick.equity.symbol,
+            equity_price=tick.equity.price,
+            session_vwap=tick.equity.session_vwap,
+            ma9=tick.equity.ma9,
+            option_symbol=option.option_symbol if option else None,
+            option_strike=option.strike if option else None,
+            option_bid=option.bid if option else None,
+            option_ask=option.ask if option else None,
         )
+    )
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Callable, Coroutine
 
-from alphagen.config import load_app_config
+from alphagen.config import CONFIG
 from alphagen.core.events import Signal, TradeIntent
 
 
@@ -14,17 +14,21 @@ class TradeGenerator:
         emit: Callable[[TradeIntent], Coroutine[None, None, None]],
     ) -> None:
         self._emit = emit
-        self._risk = load_app_config().risk
+        self._risk = CONFIG.risk
+        # Risk settings are fixed for the run; fold them into per-signal factors.
+        self._stop_factor = 1.0 + self._risk.stop_loss_multiple
+        self._take_profit_factor = 1.0 - self._risk.take_profit_multiple
+        self._quantity = self._risk.max_position_size
 
     async def handle_signal(self, signal: Signal) -> None:
         credit = signal.reference_price
-        stop_price = credit * (1 + self._risk.stop_loss_multiple)
-        take_profit_price = max(credit * (1 - self._risk.take_profit_multiple), 0.01)
+        stop_price = credit * self._stop_factor
+        take_profit_price = max(credit * self._take_profit_factor, 0.01)
         intent = TradeIntent(
             as_of=signal.as_of,
             action=signal.action,
             option_symbol=signal.option_symbol,
-            quantity=self._risk.max_position_size,
+            quantity=self._quantity,
             limit_price=credit,
             stop_loss=stop_price,
             take_profit=take_profit_price,
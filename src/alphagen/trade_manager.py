@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Callable, Coroutine, Dict, Optional
+from datetime import date, datetime
+from typing import Any, Callable, Coroutine, Dict, Optional
 
 from alphagen.core.events import (
     NormalizedTick,
@@ -13,11 +14,14 @@ from alphagen.core.events import (
     TradeIntent,
 )
 from alphagen.config import OPTION_CONTRACT_MULTIPLIER
-from alphagen.core.time_utils import session_bounds
+from alphagen.core.time_utils import session_bounds, to_est
 from alphagen.option_monitor import OptionMonitor
 from alphagen.schwab_client import SchwabClient
 import structlog
 
+# Tasks submitting queued orders; orders for one symbol still run in sequence.
+ORDER_WORKERS = 4
+
 
 @dataclass
 class TradeManager:
@@ -30,16 +34,80 @@ class TradeManager:
         default_factory=lambda: structlog.get_logger("alphagen.trade_manager"),
         init=False,
     )
+    # Session close for the day of the last evaluated quote.
+    _session_date: date | None = field(default=None, init=False)
+    _session_end: datetime | None = field(default=None, init=False)
+    _order_queue: asyncio.Queue[TradeIntent] = field(
+        default_factory=asyncio.Queue, init=False
+    )
+    _order_workers: list[asyncio.Task[None]] = field(default_factory=list, init=False)
+    # Queued or in-flight orders per symbol, opens and closes alike, and the
+    # lock ordering them. A lock lives while its symbol has any such order.
+    _pending_orders: Dict[str, int] = field(default_factory=dict, init=False)
+    _symbol_locks: Dict[str, asyncio.Lock] = field(default_factory=dict, init=False)
 
     async def handle_intent(self, intent: TradeIntent) -> None:
+        """Queue an intent for submission without waiting on the broker.
+
+        Use ``drain()`` to wait until queued orders have been submitted.
+        """
         symbol = intent.option_symbol
-        if self._open_positions and symbol not in self._open_positions:
+        busy = self._open_positions.keys() | self._pending_orders.keys()
+        if busy and symbol not in busy:
             self._logger.warning(
                 "single_position_rule_blocked",
-                existing=list(self._open_positions.keys()),
+                existing=sorted(busy),
                 incoming=symbol,
             )
             return
+        self._reserve(symbol)
+        if not self._order_workers:
+            self._order_workers = [
+                asyncio.create_task(self._order_worker(), name=f"order-worker-{n}")
+                for n in range(ORDER_WORKERS)
+            ]
+        self._order_queue.put_nowait(intent)
+
+    async def drain(self) -> None:
+        """Wait until every queued intent has been submitted."""
+        await self._order_queue.join()
+
+    async def shutdown(self) -> None:
+        workers, self._order_workers = self._order_workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _order_worker(self) -> None:
+        while True:
+            intent = await self._order_queue.get()
+            symbol = intent.option_symbol
+            try:
+                # No await before the lock: same-symbol intents keep queue order.
+                async with self._symbol_locks[symbol]:
+                    await self._submit_intent(intent)
+            except Exception as exc:  # pylint: disable=broad-except
+                self._logger.error("order_submit_failed", symbol=symbol, error=str(exc))
+            finally:
+                self._release(symbol)
+                self._order_queue.task_done()
+
+    def _reserve(self, symbol: str) -> None:
+        """Count an order against ``symbol`` before it waits for the lock."""
+        self._pending_orders[symbol] = self._pending_orders.get(symbol, 0) + 1
+        if symbol not in self._symbol_locks:
+            self._symbol_locks[symbol] = asyncio.Lock()
+
+    def _release(self, symbol: str) -> None:
+        remaining = self._pending_orders[symbol] - 1
+        if remaining:
+            self._pending_orders[symbol] = remaining
+        else:
+            del self._pending_orders[symbol]
+            del self._symbol_locks[symbol]
+
+    async def _submit_intent(self, intent: TradeIntent) -> None:
+        symbol = intent.option_symbol
         if symbol in self._open_positions:
             await self._close_position(symbol, reason="rollover")
         execution = await self.schwab_client.submit_order(intent)
@@ -49,9 +117,15 @@ class TradeManager:
             self.option_monitor.track(symbol)
 
     async def handle_tick(self, tick: NormalizedTick) -> None:
-        if not tick.option:
+        option = tick.option
+        if not option:
             return
-        await self.update_option_quote(tick.option)
+        # Inlined update_option_quote: most ticks have no open position to
+        # evaluate, so they finish without awaiting anything.
+        symbol = option.option_symbol
+        self._last_quotes[symbol] = option
+        if symbol in self._open_positions:
+            await self._evaluate_exits(symbol, option.mid(), option.as_of)
 
     async def update_option_quote(self, quote: OptionQuote) -> None:
         symbol = quote.option_symbol
@@ -63,7 +137,13 @@ class TradeManager:
     async def _evaluate_exits(self, symbol: str, price: float, as_of: datetime) -> None:
         execution = self._open_positions[symbol]
         entry_intent = execution.intent
-        _, end = session_bounds(as_of)
+        # Sessions are EST days; by evening the UTC date is already tomorrow
+        as_of_est = to_est(as_of)
+        day = as_of_est.date()
+        if day != self._session_date:
+            _, self._session_end = session_bounds(as_of_est)
+            self._session_date = day
+        end = self._session_end
         reason: str | None = None
         if price <= entry_intent.take_profit:
             reason = "take-profit"
@@ -73,11 +153,41 @@ class TradeManager:
             reason = "session-close"
         if reason is None:
             return
-        await self._close_position(symbol, price=price, reason=reason)
+        await self._close_exclusive(symbol, execution, price=price, reason=reason)
 
     async def close_all(self, reason: str = "manual") -> None:
-        for symbol in list(self._open_positions.keys()):
-            await self._close_position(symbol, reason=reason)
+        await self.drain()
+        symbols = list(self._open_positions)
+        results = await asyncio.gather(
+            *(self._close_exclusive(symbol, reason=reason) for symbol in symbols),
+            return_exceptions=True,
+        )
+        # One failed close must not abort the others or hide which ones failed
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, BaseException):
+                self._logger.error(
+                    "close_position_failed", symbol=symbol, error=str(result)
+                )
+
+    async def _close_exclusive(
+        self,
+        symbol: str,
+        entry: TradeExecution | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Close ``symbol`` under its order lock, after any orders queued first.
+
+        With ``entry``, nothing is done if that position was closed or rolled
+        over while this close waited for the lock.
+        """
+        self._reserve(symbol)
+        try:
+            async with self._symbol_locks[symbol]:
+                if entry is not None and self._open_positions.get(symbol) is not entry:
+                    return
+                await self._close_position(symbol, **kwargs)
+        finally:
+            self._release(symbol)
 
     async def _close_position(
         self,
@@ -85,7 +195,9 @@ class TradeManager:
         price: Optional[float] = None,
         reason: str = "manual",
     ) -> None:
-        execution = self._open_positions.get(symbol)
+        """Submit the closing order; callers hold the symbol's lock."""
+        # Taken before the await so a concurrent exit finds nothing to close
+        execution = self._open_positions.pop(symbol, None)
         if not execution:
             return
         quote = self._last_quotes.get(symbol)
@@ -99,16 +211,20 @@ class TradeManager:
             stop_loss=0,
             take_profit=0,
         )
-        closing_execution = await self.schwab_client.submit_order(closing_intent)
+        try:
+            closing_execution = await self.schwab_client.submit_order(closing_intent)
+        except BaseException:
+            # The position is still open at the broker
+            self._open_positions[symbol] = execution
+            raise
         pnl = self._calculate_pnl(execution, closing_execution)
         closing_execution.pnl_contrib = pnl
         await self.emit_execution(closing_execution)
-        del self._open_positions[symbol]
         if self.option_monitor:
             self.option_monitor.untrack(symbol)
 
     def _calculate_pnl(self, entry: TradeExecution, exit_exec: TradeExecution) -> float:
         multiplier = OPTION_CONTRACT_MULTIPLIER
-        direction = -1 if entry.intent.action.upper().startswith("SELL") else 1
+        direction = entry.intent.direction
         per_contract = (exit_exec.fill_price - entry.fill_price) * direction
         return per_contract * entry.intent.quantity * multiplier
@@ -0,0 +1,228 @@
+"""Tick/signal history and artists shared by the matplotlib charts."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+import matplotlib.dates as mdates
+import numpy as np
+import structlog
+from matplotlib.collections import LineCollection, PathCollection
+from matplotlib.lines import Line2D
+
+from alphagen.visualization.limits import fit_axes
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+# Crossover markers kept on screen.
+SIGNAL_HISTORY = 64
+# Marker sizes: opening signals stand out from closing ones.
+OPEN_MARKER_SIZE = 80.0
+CLOSE_MARKER_SIZE = 50.0
+
+
+class _RingBuffer:
+    """Fixed-size VWAP/MA9 history kept as parallel NumPy arrays.
+
+    Times are stored as matplotlib date numbers, converted once on append, so
+    a redraw only slices the arrays instead of rebuilding them per frame. The
+    price range is kept up to date on append and only rescanned after an
+    evicted point held one of its bounds.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._times = np.empty(capacity)
+        self._vwap = np.empty(capacity)
+        self._ma9 = np.empty(capacity)
+        self._count = 0
+        self._low = float("inf")
+        self._high = float("-inf")
+        self._range_stale = False
+
+    def __len__(self) -> int:
+        return min(self._count, self._capacity)
+
+    def append(self, time: float, vwap: float, ma9: float) -> None:
+        idx = self._count % self._capacity
+        if self._count >= self._capacity and not self._range_stale:
+            evicted = (self._vwap[idx], self._ma9[idx])
+            self._range_stale = min(evicted) <= self._low or max(evicted) >= self._high
+        self._low = min(self._low, vwap, ma9)
+        self._high = max(self._high, vwap, ma9)
+        self._times[idx] = time
+        self._vwap[idx] = vwap
+        self._ma9[idx] = ma9
+        self._count += 1
+
+    def views(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return times, VWAP and MA9 oldest first.
+
+        These are views into the buffer until it wraps, then copies.
+        """
+        count = self._count
+        if count <= self._capacity:
+            return self._times[:count], self._vwap[:count], self._ma9[:count]
+        head = count % self._capacity
+
+        def ordered(array: np.ndarray) -> np.ndarray:
+            return np.concatenate((array[head:], array[:head])) if head else array
+
+        return ordered(self._times), ordered(self._vwap), ordered(self._ma9)
+
+    def price_range(self) -> tuple[float, float]:
+        """Return the lowest and highest VWAP/MA9 value held."""
+        if self._range_stale:
+            count = len(self)
+            vwap, ma9 = self._vwap[:count], self._ma9[:count]
+            self._low = float(min(vwap.min(), ma9.min()))
+            self._high = float(max(vwap.max(), ma9.max()))
+            self._range_stale = False
+        return self._low, self._high
+
+
+class _MarkerRing:
+    """Latest signal markers as ``(time, price, size)`` rows of one array.
+
+    Rows are overwritten in place once full; the scatter does not care about
+    order, so ``view`` hands out the filled rows without copying.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._rows = np.empty((capacity, 3))
+        self._count = 0
+
+    def __len__(self) -> int:
+        return min(self._count, self._capacity)
+
+    def append(self, time: float, price: float, size: float) -> None:
+        row = self._rows[self._count % self._capacity]
+        row[0] = time
+        row[1] = price
+        row[2] = size
+        self._count += 1
+
+    def view(self) -> np.ndarray:
+        return self._rows[: len(self)]
+
+
+class _BaseChart(ABC):
+    """VWAP/MA9 chart state shared by the live, simple and file charts.
+
+    Subclasses decide when a frame is drawn and implement ``_render`` for
+    their canvas; buffering and the artist updates live here.
+    """
+
+    def __init__(self, max_points: int, logger_name: str) -> None:
+        self._logger = structlog.get_logger(logger_name)
+        self._max_points = max_points
+        self._tick_buffer = _RingBuffer(max_points)
+        # Marker size is decided once per signal, on arrival.
+        self._signal_buffer = _MarkerRing(SIGNAL_HISTORY)
+        # Bumped on every recorded tick or signal so frames can skip no-ops.
+        self._revision = 0
+        self._running = False
+        self._fig: Optional[Figure] = None
+        self._ax: Optional[Axes] = None
+        # VWAP and MA9 segments, in that order.
+        self._lines: Optional[LineCollection] = None
+        self._scatter: Optional[PathCollection] = None
+
+    def _record_tick(self, as_of: datetime, vwap: float, ma9: float) -> None:
+        """Store one tick straight into the ring buffer columns."""
+        self._tick_buffer.append(mdates.date2num(as_of), vwap, ma9)
+        self._revision += 1
+
+    def _record_signal(self, as_of: datetime, price: float, action: str) -> None:
+        size = OPEN_MARKER_SIZE if action.endswith("OPEN") else CLOSE_MARKER_SIZE
+        self._signal_buffer.append(mdates.date2num(as_of), price, size)
+        self._revision += 1
+
+    def _markers(self) -> np.ndarray:
+        """Return the signal markers as an ``(N, 3)`` view of the ring."""
+        return self._signal_buffer.view()
+
+    def _create_artists(
+        self,
+        ax: "Axes",
+        linewidths: tuple[float, float],
+        label: str,
+        animated: bool,
+    ) -> None:
+        """Add the VWAP/MA9 collection, signal scatter, legend and time axis."""
+        self._ax = ax
+        # VWAP and MA9 share one collection, so a frame draws a single artist.
+        self._lines = LineCollection(
+            [np.empty((0, 2))] * 2,
+            colors=["#4caf50", "#2196f3"],
+            linewidths=linewidths,
+            animated=animated,
+        )
+        ax.add_collection(self._lines, autolim=False)
+        self._scatter = ax.scatter(
+            [], [], marker="x", color="#ffeb3b", s=60, label=label, animated=animated
+        )
+        ax.set_xlabel("Time (ET)")
+        ax.set_ylabel("Price ($)")
+        ax.legend(
+            handles=[
+                Line2D([], [], color="#4caf50", linewidth=linewidths[0], label="VWAP"),
+                Line2D([], [], color="#2196f3", linewidth=linewidths[1], label="MA9"),
+                self._scatter,
+            ],
+            loc="upper left",
+        )
+        ax.grid(True, linestyle="--", alpha=0.3)
+
+        # Set up time formatting with better spacing
+        ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M"))
+        ax.xaxis.set_major_locator(mdates.MinuteLocator(interval=5))  # Every 5 minutes
+        ax.xaxis.set_minor_locator(
+            mdates.MinuteLocator(interval=1)
+        )  # Minor every minute
+        ax.tick_params(axis="x", rotation=45)
+
+    def _draw(
+        self,
+        times: np.ndarray,
+        vwap: np.ndarray,
+        ma9: np.ndarray,
+        markers: np.ndarray,
+        price_range: Optional[tuple[float, float]] = None,
+    ) -> bool:
+        """Push the data into the artists; returns True when the limits moved.
+
+        ``price_range`` spans ``vwap`` and ``ma9``; charts drawing straight
+        from the ring buffer pass its tracked range instead of a rescan.
+        """
+        self._lines.set_segments(
+            [np.column_stack((times, vwap)), np.column_stack((times, ma9))]
+        )
+        self._scatter.set_offsets(markers[:, :2])
+        self._scatter.set_sizes(markers[:, 2])
+
+        if price_range is None:
+            price_range = (min(vwap.min(), ma9.min()), max(vwap.max(), ma9.max()))
+        low, high = price_range
+        x_low, x_high = times.min(), times.max()
+        if len(markers):
+            low = min(low, markers[:, 1].min())
+            high = max(high, markers[:, 1].max())
+            x_low = min(x_low, markers[:, 0].min())
+            x_high = max(x_high, markers[:, 0].max())
+        return fit_axes(self._ax, (x_low, x_high), (low, high))
+
+    @abstractmethod
+    def _render(
+        self,
+        times: np.ndarray,
+        vwap: np.ndarray,
+        ma9: np.ndarray,
+        markers: np.ndarray,
+    ) -> None:
+        """Draw one frame of the given data on this chart's canvas."""
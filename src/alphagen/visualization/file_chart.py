@@ -6,42 +6,47 @@ import matplotlib
 
 matplotlib.use("Agg")  # Use non-interactive backend
 import matplotlib.pyplot as plt
-from collections import deque
-from dataclasses import dataclass
+import queue
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Deque
+from typing import Optional, Tuple
 
-import structlog
+import numpy as np
 
 from alphagen.core.events import NormalizedTick, Signal
+from alphagen.visualization.base import _BaseChart
 
+# Minimum seconds between saved images. A save requested sooner marks the
+# chart dirty; the first tick after the interval, or stop(), saves it.
+SAVE_INTERVAL = 0.5
+# PNG zlib level: 1 encodes several times faster than the default 6.
+PNG_COMPRESS_LEVEL = 1
 
-@dataclass
-class _TickPoint:
-    timestamp: datetime
-    vwap: float
-    ma9: float
+# Copies of the times, VWAP, MA9 and marker arrays handed to the worker.
+_Snapshot = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
 
 
-@dataclass
-class _SignalPoint:
-    timestamp: datetime
-    price: float
-    action: str
-
-
-class FileChart:
+class FileChart(_BaseChart):
     """Chart that saves images to files instead of showing windows."""
 
     def __init__(self, output_dir: str = "charts", max_points: int = 100) -> None:
-        self._logger = structlog.get_logger("alphagen.file_chart")
-        self._max_points = max_points
-        self._tick_buffer: Deque[_TickPoint] = deque(maxlen=max_points)
-        self._signal_buffer: Deque[_SignalPoint] = deque(maxlen=64)
+        super().__init__(max_points, "alphagen.file_chart")
         self._output_dir = Path(output_dir)
         self._output_dir.mkdir(exist_ok=True)
-        self._running = False
+        self._last_save = float("-inf")
+        # Set when a save was throttled, so the latest data is not left unsaved.
+        self._dirty = False
+        # Images of one run go to their own directory. The sequence number is
+        # never reset, so a restart within the same second cannot overwrite.
+        self._run_dir: Optional[Path] = None
+        self._seq = 0
+        # Rendering happens on a worker thread; at most two snapshots wait and
+        # the oldest is dropped when a newer one arrives. The figure is built
+        # on the first render and reused for every image after it.
+        self._render_q: queue.Queue[Optional[_Snapshot]] = queue.Queue(maxsize=2)
+        self._worker: Optional[threading.Thread] = None
 
     def start(self) -> None:
         """Start the chart."""
@@ -49,6 +54,11 @@ class FileChart:
             return
 
         self._running = True
+        self._run_dir = None
+        self._worker = threading.Thread(
+            target=self._render_loop, name="file-chart-render", daemon=True
+        )
+        self._worker.start()
         self._logger.info("file_chart_started", output_dir=str(self._output_dir))
 
     def stop(self) -> None:
@@ -57,6 +67,15 @@ class FileChart:
             return
 
         self._running = False
+        if self._dirty:
+            self._save_chart(force=True)
+        if self._worker is not None:
+            self._enqueue(None)
+            self._worker.join()
+            self._worker = None
+        if self._fig is not None:
+            plt.close(self._fig)
+            self._fig = None
         self._logger.info("file_chart_stopped")
 
     def handle_tick(self, tick: NormalizedTick) -> None:
@@ -64,16 +83,12 @@ class FileChart:
         if not self._running:
             return
 
-        point = _TickPoint(
-            timestamp=tick.as_of,
-            vwap=tick.equity.session_vwap,
-            ma9=tick.equity.ma9,
-        )
-        self._tick_buffer.append(point)
-        self._logger.debug("chart_tick_added", vwap=point.vwap, ma9=point.ma9)
+        equity = tick.equity
+        self._record_tick(tick.as_of, equity.session_vwap, equity.ma9)
+        self._logger.debug("chart_tick_added", vwap=equity.session_vwap, ma9=equity.ma9)
 
-        # Update chart every 5 ticks
-        if len(self._tick_buffer) % 5 == 0:
+        # Update chart every 5 ticks, or as soon as a throttled save is due
+        if self._dirty or len(self._tick_buffer) % 5 == 0:
             self._save_chart()
 
     def handle_signal(self, signal: Signal) -> None:
@@ -81,12 +96,7 @@ class FileChart:
         if not self._running:
             return
 
-        marker = _SignalPoint(
-            timestamp=signal.as_of,
-            price=signal.reference_price,
-            action=signal.action,
-        )
-        self._signal_buffer.append(marker)
+        self._record_signal(signal.as_of, signal.reference_price, signal.action)
         self._logger.info(
             "chart_signal_added", action=signal.action, price=signal.reference_price
         )
@@ -94,61 +104,81 @@ class FileChart:
         # Save chart when signal occurs
         self._save_chart()
 
-    def _save_chart(self) -> None:
-        """Save the current chart to a file."""
+    def _setup_figure(self) -> None:
+        """Create the figure and the artists each save updates in place."""
+        plt.style.use("dark_background")
+        self._fig, ax = plt.subplots(figsize=(12, 8))
+        self._create_artists(ax, linewidths=(2, 2), label="Signals", animated=False)
+        ax.set_title("Alpha-Gen Live Trading Chart")
+        # Fixed margins with room for the rotated labels; a per-save tight
+        # bounding box would render every image twice.
+        self._fig.subplots_adjust(left=0.07, right=0.98, top=0.95, bottom=0.12)
+
+    def _save_chart(self, force: bool = False) -> None:
+        """Queue a render of the current chart, at most once per SAVE_INTERVAL.
+
+        A save inside the interval only marks the chart dirty; ``force`` skips
+        the interval check. Without a running worker the image is rendered in
+        the calling thread.
+        """
         if not self._tick_buffer:
             return
-
+        now = time.monotonic()
+        if not force and now - self._last_save < SAVE_INTERVAL:
+            self._dirty = True
+            return
+        self._dirty = False
+        self._last_save = now
+
+        times, vwap, ma9 = self._tick_buffer.views()
+        snapshot = (times.copy(), vwap.copy(), ma9.copy(), self._markers().copy())
+        if self._worker is None:
+            self._render(*snapshot)
+        else:
+            self._enqueue(snapshot)
+
+    def _enqueue(self, item: Optional[_Snapshot]) -> None:
+        """Put ``item`` on the render queue, dropping the oldest entry if full."""
         try:
-            plt.style.use("dark_background")
-            fig, ax = plt.subplots(figsize=(12, 8))
-
-            # Convert data to arrays
-            times = [t.timestamp for t in self._tick_buffer]
-            vwap_data = [t.vwap for t in self._tick_buffer]
-            ma9_data = [t.ma9 for t in self._tick_buffer]
-
-            # Plot lines
-            ax.plot(times, vwap_data, label="VWAP", color="#4caf50", linewidth=2)
-            ax.plot(times, ma9_data, label="MA9", color="#2196f3", linewidth=2)
-
-            # Plot signals
-            if self._signal_buffer:
-                signal_times = [s.timestamp for s in self._signal_buffer]
-                signal_prices = [s.price for s in self._signal_buffer]
-                ax.scatter(
-                    signal_times,
-                    signal_prices,
-                    marker="x",
-                    color="#ffeb3b",
-                    s=60,
-                    label="Signals",
-                )
-
-            ax.set_xlabel("Time (ET)")
-            ax.set_ylabel("Price ($)")
-            ax.set_title("Alpha-Gen Live Trading Chart")
-            ax.legend(loc="upper left")
-            ax.grid(True, linestyle="--", alpha=0.3)
-
-            # Format x-axis with better spacing
-            import matplotlib.dates as mdates
-
-            ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M"))
-            ax.xaxis.set_major_locator(
-                mdates.MinuteLocator(interval=5)
-            )  # Every 5 minutes
-            ax.xaxis.set_minor_locator(
-                mdates.MinuteLocator(interval=1)
-            )  # Minor every minute
-            ax.tick_params(axis="x", rotation=45)
-            plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
+            self._render_q.put_nowait(item)
+        except queue.Full:
+            try:
+                self._render_q.get_nowait()
+            except queue.Empty:
+                pass
+            self._render_q.put_nowait(item)
+
+    def _render_loop(self) -> None:
+        """Render queued snapshots until the ``None`` sentinel arrives."""
+        while (snapshot := self._render_q.get()) is not None:
+            self._render(*snapshot)
+
+    def _render(
+        self,
+        times: np.ndarray,
+        vwap: np.ndarray,
+        ma9: np.ndarray,
+        markers: np.ndarray,
+    ) -> None:
+        """Draw the data on the shared figure and save it to a file."""
+        try:
+            if self._fig is None:
+                self._setup_figure()
+            self._draw(times, vwap, ma9, markers)
 
             # Save to file
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = self._output_dir / f"trading_chart_{timestamp}.png"
-            plt.savefig(filename, dpi=150, bbox_inches="tight")
-            plt.close(fig)
+            if self._run_dir is None:
+                self._run_dir = self._output_dir / datetime.now().strftime(
+                    "run_%Y%m%d_%H%M%S"
+                )
+                self._run_dir.mkdir(exist_ok=True)
+            self._seq += 1
+            filename = self._run_dir / f"trading_chart_{self._seq:06d}.png"
+            self._fig.savefig(
+                filename,
+                dpi=100,
+                pil_kwargs={"compress_level": PNG_COMPRESS_LEVEL},
+            )
 
             self._logger.info("chart_saved", filename=str(filename))
 
@@ -0,0 +1,49 @@
+"""Axis-limit tracking for the blitted live charts."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
+# Smallest margin kept around the data: five minutes of time (matplotlib date
+# units are days) and one cent of price.
+TIME_MARGIN = 5 / (24 * 60)
+PRICE_MARGIN = 0.01
+
+
+def grow_limits(
+    current: tuple[float, float],
+    low: float,
+    high: float,
+    min_margin: float,
+    headroom: float = 0.1,
+) -> tuple[float, float] | None:
+    """Return new limits when ``low``..``high`` no longer fits in ``current``.
+
+    The new limits leave ``headroom`` of the data span on each side, so a
+    steadily growing series only forces a relayout every so often.
+    """
+    current_low, current_high = current
+    if current_low <= low and high <= current_high:
+        return None
+    margin = max((high - low) * headroom, min_margin)
+    return low - margin, high + margin
+
+
+def fit_axes(
+    ax: "Axes", x_range: tuple[float, float], y_range: tuple[float, float]
+) -> bool:
+    """Widen ``ax`` to fit the data ranges; returns True when its limits changed.
+
+    Blitted frames restore a cached background that includes the tick labels,
+    so callers must follow a change with a full ``canvas.draw()``.
+    """
+    x_limits = grow_limits(ax.get_xlim(), *x_range, TIME_MARGIN)
+    y_limits = grow_limits(ax.get_ylim(), *y_range, PRICE_MARGIN)
+    if x_limits is not None:
+        ax.set_xlim(x_limits)
+    if y_limits is not None:
+        ax.set_ylim(y_limits)
+    return x_limits is not None or y_limits is not None
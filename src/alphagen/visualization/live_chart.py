@@ -2,43 +2,44 @@
 
 from __future__ import annotations
 
+import time
 from collections import deque
-from dataclasses import dataclass
 from datetime import datetime
-from queue import Empty, Queue
-from threading import Thread
-from typing import Deque, Optional
+from threading import Lock, Thread
+from typing import Any, Deque, Optional
 
-import structlog
+import numpy as np
 
 from alphagen.core.events import NormalizedTick, Signal
+from alphagen.visualization.base import _BaseChart
 
+# Bounds in seconds on the wait between frames, which also services the GUI
+# event loop. Within them the wait follows twice the smoothed tick gap; the
+# upper bound stays under stop()'s two second join.
+MIN_FRAME_INTERVAL = 0.1
+MAX_FRAME_INTERVAL = 1.0
+# Seconds without a tick before the chart drops to the slowest frame rate.
+IDLE_AFTER = 5.0
+# Weight of the newest inter-arrival gap in its moving average.
+GAP_SMOOTHING = 0.1
 
-@dataclass
-class _TickPoint:
-    timestamp: datetime
-    vwap: float
-    ma9: float
 
-
-@dataclass
-class _SignalPoint:
-    timestamp: datetime
-    price: float
-    action: str
-
-
-class LiveChart:
+class LiveChart(_BaseChart):
     """Render VWAP and MA9 lines with crossover markers in real time."""
 
     def __init__(self, max_points: int = 600) -> None:
-        self._logger = structlog.get_logger("alphagen.live_chart")
-        self._max_points = max_points
-        self._tick_buffer: Deque[_TickPoint] = deque(maxlen=max_points)
-        self._signal_buffer: Deque[_SignalPoint] = deque(maxlen=64)
-        self._queue: Queue[Optional[tuple[str, object]]] = Queue()
+        super().__init__(max_points, "alphagen.live_chart")
+        # Filled by the event thread and swapped out whole by each frame. Ticks
+        # are (kind, as_of, vwap, ma9); signals are (kind, as_of, price, action).
+        self._pending: Deque[tuple[str, datetime, float, object]] = deque()
+        self._pending_lock = Lock()
+        # Monotonic arrival time of the last tick and the smoothed gap between
+        # ticks, both updated under the pending lock.
+        self._last_tick_at: Optional[float] = None
+        self._gap_ema = MAX_FRAME_INTERVAL / 2
         self._thread: Thread | None = None
-        self._running = False
+        # Canvas pixels without the animated artists, re-cached on every draw.
+        self._background: Optional[Any] = None
 
     def start(self) -> None:
         if self._running:
@@ -51,7 +52,6 @@ class LiveChart:
         if not self._running:
             return
         self._running = False
-        self._queue.put(None)
         if self._thread:
             await self._join_thread()
             self._thread = None
@@ -67,32 +67,28 @@ class LiveChart:
     def handle_tick(self, tick: NormalizedTick) -> None:
         if not self._running:
             self.start()
-        point = _TickPoint(
-            timestamp=tick.as_of,
-            vwap=tick.equity.session_vwap,
-            ma9=tick.equity.ma9,
-        )
-        self._queue.put(("tick", point))
+        item = ("tick", tick.as_of, tick.equity.session_vwap, tick.equity.ma9)
+        now = time.monotonic()
+        with self._pending_lock:
+            self._pending.append(item)
+            if self._last_tick_at is not None:
+                gap = now - self._last_tick_at
+                self._gap_ema += GAP_SMOOTHING * (gap - self._gap_ema)
+            self._last_tick_at = now
 
     def handle_signal(self, signal: Signal) -> None:
         if not self._running:
             self.start()
-        marker = _SignalPoint(
-            timestamp=signal.as_of,
-            price=signal.reference_price,
-            action=signal.action,
-        )
-        self._queue.put(("signal", marker))
+        item = ("signal", signal.as_of, signal.reference_price, signal.action)
+        with self._pending_lock:
+            self._pending.append(item)
 
     # --- internal helpers -------------------------------------------------
 
     def _run(self) -> None:
         try:
             import matplotlib
-            import matplotlib.dates as mdates
             import matplotlib.pyplot as plt
-            from matplotlib.animation import FuncAnimation
-            import numpy as np
 
             # Ensure we're using an interactive backend
             if not matplotlib.is_interactive():
@@ -109,76 +105,14 @@ class LiveChart:
             num="Alpha-Gen QQQ VWAP vs MA9",
             figsize=(10, 6),
         )
-        (line_vwap,) = ax.plot([], [], label="VWAP", color="#4caf50", linewidth=1.8)
-        (line_ma9,) = ax.plot([], [], label="MA9", color="#2196f3", linewidth=1.4)
-        scatter = ax.scatter([], [], marker="x", color="#ffeb3b", s=60, label="Cross")
-        ax.set_xlabel("Time (ET)")
-        ax.set_ylabel("Price ($)")
-        ax.legend(loc="upper left")
-        ax.grid(True, linestyle="--", alpha=0.3)
-
-        # Set up time formatting with better spacing
-        ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M"))
-        ax.xaxis.set_major_locator(mdates.MinuteLocator(interval=5))  # Every 5 minutes
-        ax.xaxis.set_minor_locator(
-            mdates.MinuteLocator(interval=1)
-        )  # Minor every minute
-        ax.tick_params(axis="x", rotation=45)
-
-        def update(_frame: int):
-            closing = False
-            while True:
-                try:
-                    item = self._queue.get_nowait()
-                except Empty:
-                    break
-                if item is None:
-                    closing = True
-                    break
-                kind, payload = item
-                if kind == "tick":
-                    self._tick_buffer.append(payload)  # type: ignore[arg-type]
-                elif kind == "signal":
-                    self._signal_buffer.append(payload)  # type: ignore[arg-type]
-
-            if closing:
-                plt.close(fig)
-                return (line_vwap,)
-
-            if not self._tick_buffer:
-                return (line_vwap,)
-
-            times = np.array(
-                [mdates.date2num(pt.timestamp) for pt in self._tick_buffer]
-            )
-            vwap = np.array([pt.vwap for pt in self._tick_buffer])
-            ma9 = np.array([pt.ma9 for pt in self._tick_buffer])
-
-            line_vwap.set_data(times, vwap)
-            line_ma9.set_data(times, ma9)
-
-            if self._signal_buffer:
-                signals_list = list(self._signal_buffer)
-                xs = np.array([mdates.date2num(sig.timestamp) for sig in signals_list])
-                ys = np.array([sig.price for sig in signals_list])
-                scatter.set_offsets(np.column_stack((xs, ys)))
-                sizes = np.array(
-                    [
-                        80.0 if sig.action.endswith("OPEN") else 50.0
-                        for sig in signals_list
-                    ]
-                )
-                scatter.set_sizes(sizes)
-            else:
-                scatter.set_offsets(np.empty((0, 2)))
-                scatter.set_sizes(np.empty((0,), dtype=float))
-
-            ax.relim()
-            ax.autoscale_view()
-            fig.autofmt_xdate()
-            return line_vwap, line_ma9, scatter
-
-        FuncAnimation(fig, update, interval=250, cache_frame_data=False)
+        self._fig = fig
+        # Animated artists are left out of full redraws and blitted per frame.
+        self._create_artists(ax, linewidths=(1.8, 1.4), label="Cross", animated=True)
+        # Room for the rotated time labels, reserved once; tick_params keeps
+        # the rotation for ticks created later.
+        fig.subplots_adjust(bottom=0.2)
+
+        fig.canvas.mpl_connect("draw_event", self._on_draw)
         try:
             self._logger.info(
                 "live_chart_displaying",
@@ -211,12 +145,71 @@ class LiveChart:
             fig.canvas.draw()
             fig.canvas.flush_events()
 
-            # Keep the chart alive
+            # Keep the chart alive. The pause is the only event source: it
+            # runs the GUI loop and paces frames, with no separate timer.
             while self._running:
-                plt.pause(0.1)
+                self._frame()
+                plt.pause(self._frame_interval())
 
         except Exception as e:
             self._logger.warning("chart_display_error", error=str(e))
         finally:
             self._running = False
+            plt.close(fig)
             self._logger.info("live_chart_closed")
+
+    def _frame(self) -> None:
+        """Apply pending events and redraw if any arrived."""
+        with self._pending_lock:
+            batch, self._pending = self._pending, deque()
+        if not batch:
+            return
+        for kind, as_of, value, extra in batch:
+            if kind == "tick":
+                self._record_tick(as_of, value, extra)  # type: ignore[arg-type]
+            elif kind == "signal":
+                self._record_signal(as_of, value, extra)  # type: ignore[arg-type]
+
+        if self._tick_buffer:
+            self._render(*self._tick_buffer.views(), self._markers())
+
+    def _frame_interval(self) -> float:
+        """Return the wait before the next frame, paced by the tick rate."""
+        with self._pending_lock:
+            last_tick_at, gap = self._last_tick_at, self._gap_ema
+        if last_tick_at is None or time.monotonic() - last_tick_at > IDLE_AFTER:
+            return MAX_FRAME_INTERVAL
+        return min(MAX_FRAME_INTERVAL, max(MIN_FRAME_INTERVAL, 2 * gap))
+
+    def _render(
+        self,
+        times: np.ndarray,
+        vwap: np.ndarray,
+        ma9: np.ndarray,
+        markers: np.ndarray,
+    ) -> None:
+        if self._draw(times, vwap, ma9, markers, self._tick_buffer.price_range()):
+            # New limits change the ticks, so re-render the background; the
+            # draw event re-caches it and puts the artists back on top.
+            self._fig.canvas.draw()
+        else:
+            self._blit()
+
+    def _on_draw(self, _event: object) -> None:
+        """Cache the freshly drawn background and composite the artists."""
+        self._background = self._fig.canvas.copy_from_bbox(self._fig.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self) -> None:
+        # Animated artists are skipped by full draws and drawn only here.
+        self._fig.draw_artist(self._lines)
+        self._fig.draw_artist(self._scatter)
+
+    def _blit(self) -> None:
+        """Repaint only the artists over the cached background."""
+        if self._background is None:
+            return
+        canvas = self._fig.canvas
+        canvas.restore_region(self._background)
+        self._draw_artists()
+        canvas.blit(self._fig.bbox)
@@ -4,48 +4,20 @@ from __future__ import annotations
 
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
-from collections import deque
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Deque, Optional
 
-import structlog
-from matplotlib.figure import Figure
-from matplotlib.axes import Axes
-from matplotlib.lines import Line2D
-from matplotlib.collections import PathCollection
+import numpy as np
+from matplotlib.artist import Artist
 
 from alphagen.core.events import NormalizedTick, Signal
+from alphagen.visualization.base import _BaseChart
 
 
-@dataclass
-class _TickPoint:
-    timestamp: datetime
-    vwap: float
-    ma9: float
-
-
-@dataclass
-class _SignalPoint:
-    timestamp: datetime
-    price: float
-    action: str
-
-
-class SimpleChart:
+class SimpleChart(_BaseChart):
     """Simple real-time chart that works on the main thread."""
 
     def __init__(self, max_points: int = 100) -> None:
-        self._logger = structlog.get_logger("alphagen.simple_chart")
-        self._max_points = max_points
-        self._tick_buffer: Deque[_TickPoint] = deque(maxlen=max_points)
-        self._signal_buffer: Deque[_SignalPoint] = deque(maxlen=64)
-        self._running = False
-        self._fig: Optional[Figure] = None
-        self._ax: Optional[Axes] = None
-        self._line_vwap: Optional[Line2D] = None
-        self._line_ma9: Optional[Line2D] = None
-        self._scatter: Optional[PathCollection] = None
+        super().__init__(max_points, "alphagen.simple_chart")
+        self._rendered_revision = -1
 
     def start(self) -> None:
         """Start the chart (non-blocking)."""
@@ -78,40 +50,18 @@ class SimpleChart:
                 figsize=(12, 8),
             )
 
-            (self._line_vwap,) = self._ax.plot(
-                [], [], label="VWAP", color="#4caf50", linewidth=2
-            )
-            (self._line_ma9,) = self._ax.plot(
-                [], [], label="MA9", color="#2196f3", linewidth=2
-            )
-            self._scatter = self._ax.scatter(
-                [], [], marker="x", color="#ffeb3b", s=60, label="Cross"
+            # Animated artists are left out of full redraws and blitted per frame.
+            self._create_artists(
+                self._ax, linewidths=(2, 2), label="Cross", animated=True
             )
-
-            self._ax.set_xlabel("Time (ET)")
-            self._ax.set_ylabel("Price ($)")
             self._ax.set_title("Alpha-Gen Live Trading Chart")
-            self._ax.legend(loc="upper left")
-            self._ax.grid(True, linestyle="--", alpha=0.3)
-
-            # Set up time formatting with better spacing
-            import matplotlib.dates as mdates
-
-            self._ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M"))
-            self._ax.xaxis.set_major_locator(
-                mdates.MinuteLocator(interval=5)
-            )  # Every 5 minutes
-            self._ax.xaxis.set_minor_locator(
-                mdates.MinuteLocator(interval=1)
-            )  # Minor every minute
-            self._ax.tick_params(axis="x", rotation=45)
 
             # Set up animation
             self._ani = animation.FuncAnimation(
                 self._fig,
                 self._update_chart,
                 interval=1000,  # Update every second
-                blit=False,
+                blit=True,
             )
 
             plt.show(block=False)  # Non-blocking show
@@ -121,60 +71,47 @@ class SimpleChart:
         except Exception as e:
             self._logger.error("chart_setup_failed", error=str(e))
 
-    def _update_chart(self, frame: int) -> None:
-        """Update the chart with new data."""
+    def _update_chart(self, frame: int) -> tuple[Artist, ...]:
+        """Update the chart with new data and return the artists to blit."""
         if not self._running or not self._tick_buffer:
-            return
+            return ()
+        # Nothing new: blit the artists as they are without rebuilding them.
+        if self._revision == self._rendered_revision:
+            return self._lines, self._scatter
 
         try:
-            # Convert data to arrays
-            times = [t.timestamp for t in self._tick_buffer]
-            vwap_data = [t.vwap for t in self._tick_buffer]
-            ma9_data = [t.ma9 for t in self._tick_buffer]
-
-            # Update lines
-            self._line_vwap.set_data(times, vwap_data)
-            self._line_ma9.set_data(times, ma9_data)
-
-            # Update signals
-            if self._signal_buffer:
-                signal_times = [s.timestamp for s in self._signal_buffer]
-                signal_prices = [s.price for s in self._signal_buffer]
-                self._scatter.set_offsets(list(zip(signal_times, signal_prices)))
-            else:
-                self._scatter.set_offsets([])
-
-            # Auto-scale
-            self._ax.relim()
-            self._ax.autoscale_view()
-
+            self._rendered_revision = self._revision
+            self._render(*self._tick_buffer.views(), self._markers())
         except Exception as e:
             self._logger.error("chart_update_failed", error=str(e))
+        return self._lines, self._scatter
+
+    def _render(
+        self,
+        times: np.ndarray,
+        vwap: np.ndarray,
+        ma9: np.ndarray,
+        markers: np.ndarray,
+    ) -> None:
+        # Only a change of limits needs the full redraw blitting avoids
+        if self._draw(times, vwap, ma9, markers, self._tick_buffer.price_range()):
+            self._fig.canvas.draw()
 
     def handle_tick(self, tick: NormalizedTick) -> None:
         """Handle incoming market data tick."""
         if not self._running:
             return
 
-        point = _TickPoint(
-            timestamp=tick.as_of,
-            vwap=tick.equity.session_vwap,
-            ma9=tick.equity.ma9,
-        )
-        self._tick_buffer.append(point)
-        self._logger.debug("chart_tick_added", vwap=point.vwap, ma9=point.ma9)
+        equity = tick.equity
+        self._record_tick(tick.as_of, equity.session_vwap, equity.ma9)
+        self._logger.debug("chart_tick_added", vwap=equity.session_vwap, ma9=equity.ma9)
 
     def handle_signal(self, signal: Signal) -> None:
         """Handle incoming trading signal."""
         if not self._running:
             return
 
-        marker = _SignalPoint(
-            timestamp=signal.as_of,
-            price=signal.reference_price,
-            action=signal.action,
-        )
-        self._signal_buffer.append(marker)
+        self._record_signal(signal.as_of, signal.reference_price, signal.action)
         self._logger.info(
             "chart_signal_added", action=signal.action, price=signal.reference_price
         )
@@ -10,11 +10,71 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
-from collections import deque
-from typing import Deque
+import numpy as np
 from sqlmodel import select
 
 from alphagen.core.events import NormalizedTick
+from alphagen.visualization.limits import TIME_MARGIN, grow_limits
+
+# Ticks are buffered immediately but the plot is rebuilt at most this often.
+REDRAW_INTERVAL_MS = 50
+
+
+class _TickColumns:
+    """The last ``maxlen`` ticks as time, price, VWAP and MA9 NumPy columns.
+
+    Each column is a contiguous row of one preallocated array and times are
+    stored as matplotlib date numbers, converted once on append, so a redraw
+    slices arrays instead of walking tick objects.
+    """
+
+    def __init__(self, maxlen: int) -> None:
+        self.maxlen = maxlen
+        self._columns = np.empty((4, maxlen))
+        self._count = 0
+
+    def __len__(self) -> int:
+        return min(self._count, self.maxlen)
+
+    def append(self, tick: NormalizedTick) -> None:
+        equity = tick.equity
+        self._columns[:, self._count % self.maxlen] = (
+            mdates.date2num(tick.as_of),
+            equity.price,
+            equity.session_vwap,
+            equity.ma9,
+        )
+        self._count += 1
+
+    def extend(self, columns: np.ndarray) -> None:
+        """Append ``(4, N)`` columns in one write; only the newest ``maxlen`` fit."""
+        columns = columns[:, -self.maxlen :]
+        slots = (self._count + np.arange(columns.shape[1])) % self.maxlen
+        self._columns[:, slots] = columns
+        self._count += columns.shape[1]
+
+    def clear(self) -> None:
+        self._count = 0
+
+    def columns(self) -> np.ndarray:
+        """Return a ``(4, N)`` array of the columns, oldest tick first.
+
+        This is a view into the buffer until it wraps, then a copy.
+        """
+        if self._count <= self.maxlen:
+            return self._columns[:, : self._count]
+        head = self._count % self.maxlen
+        if not head:
+            return self._columns
+        return np.concatenate((self._columns[:, head:], self._columns[:, :head]), 1)
+
+    def resized(self, maxlen: int) -> _TickColumns:
+        """Return a buffer of ``maxlen`` ticks holding the newest of these."""
+        resized = _TickColumns(maxlen)
+        kept = self.columns()[:, -maxlen:]
+        resized._columns[:, : kept.shape[1]] = kept
+        resized._count = kept.shape[1]
+        return resized
 
 
 class SimpleGUChart:
@@ -23,8 +83,9 @@ class SimpleGUChart:
     def __init__(self, parent_frame: tk.Widget, max_points: int = 4320):  # 3 days of minute data
         self.parent_frame = parent_frame
         self.max_points = max_points
-        self.data_buffer: Deque[NormalizedTick] = deque(maxlen=max_points)
+        self.data_buffer = _TickColumns(max_points)
         self.time_scale = "3day"  # Default to 3-day view
+        self._redraw_scheduled = False
 
         # Track min/max values for Y-axis scaling
         self.min_price = float("inf")
@@ -60,15 +121,16 @@ class SimpleGUChart:
         self.canvas = FigureCanvasTkAgg(self.fig, parent_frame)
         # Don't pack here - will be packed when shown in GUI
 
-        # Initialize plot
+        # Initialize plot. The lines are animated: full draws leave them out
+        # and updates blit them over the cached axes background.
         (self.line_price,) = self.ax.plot(
-            [], [], label="Price", color="#ff6b35", linewidth=2
+            [], [], label="Price", color="#ff6b35", linewidth=2, animated=True
         )
         (self.line_vwap,) = self.ax.plot(
-            [], [], label="VWAP", color="#4caf50", linewidth=2
+            [], [], label="VWAP", color="#4caf50", linewidth=2, animated=True
         )
         (self.line_ma9,) = self.ax.plot(
-            [], [], label="MA9", color="#2196f3", linewidth=2
+            [], [], label="MA9", color="#2196f3", linewidth=2, animated=True
         )
         self.ax.set_xlabel("Time")
         self.ax.set_ylabel("Price ($)")
@@ -88,13 +150,19 @@ class SimpleGUChart:
         # Add padding to prevent label cutoff
         self.fig.tight_layout(pad=2.0)
 
+        # Axes pixels without the lines, re-cached on every full draw, and the
+        # Y limits they were drawn with.
+        self._background = None
+        self._y_limits: tuple[float, float] | None = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
     def set_time_scale(self, scale: str) -> None:
         """Set the time scale for the chart."""
         if scale in self.scale_configs:
             self.time_scale = scale
             config = self.scale_configs[scale]
             # Update max points based on scale
-            self.data_buffer = deque(self.data_buffer, maxlen=config["max_points"])
+            self.data_buffer = self.data_buffer.resized(config["max_points"])
             self.ax.set_title(f"Alpha-Gen QQQ VWAP vs MA9 - {config['label']} Scale")
 
             # Update time axis formatting based on scale - limit to max 6 labels
@@ -127,99 +195,107 @@ class SimpleGUChart:
                 self.ax.xaxis.set_major_locator(mdates.AutoDateLocator(maxticks=6))
                 self.ax.xaxis.set_major_formatter(mdates.DateFormatter("%m/%d"))
 
+            # New tick labels: the cached background is stale
+            self._background = None
             self._update_plot()
 
     def handle_tick(self, tick: NormalizedTick) -> None:
         """Handle normalized tick data."""
+        if not self._append_tick(tick):
+            return
+        if not self._redraw_scheduled:
+            self._redraw_scheduled = True
+            self.parent_frame.after(REDRAW_INTERVAL_MS, self._redraw)
+
+    def _append_tick(self, tick: NormalizedTick) -> bool:
+        """Buffer ``tick`` and widen the price range; False if it was dropped."""
+        equity = tick.equity
+        # Zero prices would skew the chart, so they never reach the buffer
+        if equity.price <= 0:
+            return False
         self.data_buffer.append(tick)
+        self.min_price = min(
+            self.min_price, equity.price, equity.session_vwap, equity.ma9
+        )
+        self.max_price = max(
+            self.max_price, equity.price, equity.session_vwap, equity.ma9
+        )
+        return True
+
+    def _append_columns(self, columns: np.ndarray) -> None:
+        """Bulk version of ``_append_tick`` for ``(4, N)`` tick columns."""
+        columns = columns[:, columns[1] > 0]
+        if not columns.shape[1]:
+            return
+        self.data_buffer.extend(columns)
+        self.min_price = min(self.min_price, float(columns[1:].min()))
+        self.max_price = max(self.max_price, float(columns[1:].max()))
+
+    def _redraw(self) -> None:
+        """Plot every tick buffered since the last scheduled redraw."""
+        self._redraw_scheduled = False
         self._update_plot()
 
-    async def load_historical_data(self) -> None:
-        """Load last 3 days of historical data from database."""
+    @staticmethod
+    async def read_historical_columns() -> np.ndarray | None:
+        """Read the last 3 days of ticks from the database as ``(4, N)`` columns.
+
+        Touches no widgets, so it can run on the asyncio thread; hand the
+        result to ``load_historical_columns`` on the Tk thread.
+        """
         from alphagen.storage import session_scope
         from alphagen.storage import EquityTickRow
-        from alphagen.core.events import EquityTick, OptionQuote
 
         try:
             # Get last 3 days of data
             cutoff_time = datetime.now(timezone.utc) - timedelta(days=3)
 
             async with session_scope() as session:
-                # Query equity tick data from last 3 days
-                statement = select(EquityTickRow).where(
+                # Query only the plotted columns from the last 3 days
+                statement = select(
+                    EquityTickRow.as_of,
+                    EquityTickRow.price,
+                    EquityTickRow.session_vwap,
+                    EquityTickRow.ma9,
+                ).where(
                     EquityTickRow.as_of >= cutoff_time,
                     EquityTickRow.price > 0  # Filter out zero prices
                 ).order_by(EquityTickRow.as_of)
                 result = await session.exec(statement)
                 rows = result.all()
 
-                # Convert to NormalizedTick objects
-                for row in rows:
-                    equity_tick = EquityTick(
-                        symbol=row.symbol,
-                        price=row.price,
-                        session_vwap=row.session_vwap,
-                        ma9=row.ma9,
-                        as_of=row.as_of
-                    )
-
-                    # Create a dummy option quote (not needed for chart)
-                    option_quote = OptionQuote(
-                        option_symbol="DUMMY",
-                        strike=0.0,
-                        bid=0.0,
-                        ask=0.0,
-                        as_of=row.as_of,
-                        expiry=row.as_of
-                    )
-
-                    normalized_tick = NormalizedTick(
-                        as_of=row.as_of,
-                        equity=equity_tick,
-                        option=option_quote
-                    )
-
-                    self.data_buffer.append(normalized_tick)
-
-                self._update_plot()
-
         except Exception as e:
             print(f"Error loading historical data: {e}")
+            return None
+
+        if not rows:
+            return None
+        as_of, price, vwap, ma9 = zip(*rows)
+        return np.array((mdates.date2num(as_of), price, vwap, ma9))
+
+    def load_historical_columns(self, columns: np.ndarray | None) -> None:
+        """Plot columns from ``read_historical_columns``; call on the Tk thread."""
+        if columns is not None:
+            # Write the rows into the buffer as whole columns
+            self._append_columns(columns)
+        self._update_plot()
 
     def _update_plot(self) -> None:
         """Update the plot with current data."""
         if not self.data_buffer:
             return
 
-        # Extract data
-        times = [t.as_of for t in self.data_buffer]
-        price_values = [t.equity.price for t in self.data_buffer]
-        vwap_values = [t.equity.session_vwap for t in self.data_buffer]
-        ma9_values = [t.equity.ma9 for t in self.data_buffer]
-
-        # Filter out zero prices that would skew the chart
-        valid_data = [(t, p, v, m) for t, p, v, m in zip(times, price_values, vwap_values, ma9_values) if p > 0]
-
-        if not valid_data:
-            return
-
-        times, price_values, vwap_values, ma9_values = zip(*valid_data)
-
-        # Update min/max price tracking
-        all_prices = list(price_values) + list(vwap_values) + list(ma9_values)
-        if all_prices:
-            current_min = min(all_prices)
-            current_max = max(all_prices)
-            self.min_price = min(self.min_price, current_min)
-            self.max_price = max(self.max_price, current_max)
+        # Zero prices were dropped and the price range widened on insert
+        times, price_values, vwap_values, ma9_values = self.data_buffer.columns()
 
         # Update lines
         self.line_price.set_data(times, price_values)
         self.line_vwap.set_data(times, vwap_values)
         self.line_ma9.set_data(times, ma9_values)
+        limits_changed = self._fit_time_axis(times)
 
         # Set Y-axis limits with reasonable padding
-        if times and self.min_price != float("inf") and self.max_price != float("-inf"):
+        if self.min_price != float("inf") and self.max_price != float("-inf"):
             price_range = self.max_price - self.min_price
             if price_range > 0:
                 # Add 5% padding above and below
@@ -231,59 +307,96 @@ class SimpleGUChart:
                 y_min = round(y_min, 2)
                 y_max = round(y_max, 2)
 
-                self.ax.set_ylim(y_min, y_max)
-
-                # Set Y-axis ticks to reasonable increments
-                tick_range = y_max - y_min
-                if tick_range > 20:
-                    # Use $2 increments for very large ranges
-                    tick_step = 2.0
-                elif tick_range > 10:
-                    # Use $1 increments for large ranges
-                    tick_step = 1.0
-                elif tick_range > 2:
-                    # Use $0.50 increments for medium ranges
-                    tick_step = 0.50
-                elif tick_range > 0.5:
-                    # Use $0.10 increments for small ranges
-                    tick_step = 0.10
-                else:
-                    # Use $0.05 increments for very small ranges
-                    tick_step = 0.05
-
-                import numpy as np
-
-                ticks = np.arange(
-                    np.ceil(y_min / tick_step) * tick_step,
-                    np.floor(y_max / tick_step) * tick_step + tick_step,
-                    tick_step,
-                )
-                self.ax.set_yticks(ticks)
-
-                # Format Y-axis labels to show appropriate decimal places
-                if tick_step >= 1.0:
-                    self.ax.yaxis.set_major_formatter(
-                        plt.FuncFormatter(lambda x, p: f"${x:.0f}")
-                    )
-                elif tick_step >= 0.10:
-                    self.ax.yaxis.set_major_formatter(
-                        plt.FuncFormatter(lambda x, p: f"${x:.2f}")
-                    )
-                else:
-                    self.ax.yaxis.set_major_formatter(
-                        plt.FuncFormatter(lambda x, p: f"${x:.3f}")
+                # Unchanged limits keep the cached background valid
+                if (y_min, y_max) != self._y_limits:
+                    limits_changed = True
+                    self._y_limits = (y_min, y_max)
+                    self.ax.set_ylim(y_min, y_max)
+
+                    # Set Y-axis ticks to reasonable increments
+                    tick_range = y_max - y_min
+                    if tick_range > 20:
+                        # Use $2 increments for very large ranges
+                        tick_step = 2.0
+                    elif tick_range > 10:
+                        # Use $1 increments for large ranges
+                        tick_step = 1.0
+                    elif tick_range > 2:
+                        # Use $0.50 increments for medium ranges
+                        tick_step = 0.50
+                    elif tick_range > 0.5:
+                        # Use $0.10 increments for small ranges
+                        tick_step = 0.10
+                    else:
+                        # Use $0.05 increments for very small ranges
+                        tick_step = 0.05
+
+                    ticks = np.arange(
+                        np.ceil(y_min / tick_step) * tick_step,
+                        np.floor(y_max / tick_step) * tick_step + tick_step,
+                        tick_step,
                     )
+                    self.ax.set_yticks(ticks)
+
+                    # Format Y-axis labels to show appropriate decimal places
+                    if tick_step >= 1.0:
+                        self.ax.yaxis.set_major_formatter(
+                            plt.FuncFormatter(lambda x, p: f"${x:.0f}")
+                        )
+                    elif tick_step >= 0.10:
+                        self.ax.yaxis.set_major_formatter(
+                            plt.FuncFormatter(lambda x, p: f"${x:.2f}")
+                        )
+                    else:
+                        self.ax.yaxis.set_major_formatter(
+                            plt.FuncFormatter(lambda x, p: f"${x:.3f}")
+                        )
             else:
                 # Fallback to auto-scaling if no range
                 self.ax.relim()
                 self.ax.autoscale_view()
+                limits_changed = True
         else:
             # Auto-scale if no data yet
             self.ax.relim()
             self.ax.autoscale_view()
+            limits_changed = True
 
-        # Redraw
-        self.canvas.draw()
+        if limits_changed or self._background is None:
+            # Axes decorations changed: let Tk coalesce one full redraw, whose
+            # draw event re-caches the background
+            self.canvas.draw_idle()
+        else:
+            self._blit()
+
+    def _fit_time_axis(self, times: np.ndarray) -> bool:
+        """Widen the X limits to the buffered times; True when they changed."""
+        low, high = times.min(), times.max()
+        current = self.ax.get_xlim()
+        # Once old ticks scroll out of the buffer and leave half the view
+        # empty, refit from scratch: nothing fits an empty range.
+        if low - current[0] > (current[1] - current[0]) / 2:
+            current = (float("inf"), float("-inf"))
+        limits = grow_limits(current, low, high, TIME_MARGIN)
+        if limits is None:
+            return False
+        self.ax.set_xlim(limits)
+        return True
+
+    def _on_draw(self, _event: object) -> None:
+        """Cache the freshly drawn background and composite the lines."""
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_lines()
+
+    def _draw_lines(self) -> None:
+        for line in (self.line_price, self.line_vwap, self.line_ma9):
+            self.ax.draw_artist(line)
+
+    def _blit(self) -> None:
+        """Repaint only the lines over the cached axes background."""
+        self.canvas.restore_region(self._background)
+        self._draw_lines()
+        self.canvas.blit(self.ax.bbox)
 
     def show(self) -> None:
         """Show the chart in its parent frame."""
@@ -303,6 +416,7 @@ class SimpleGUChart:
         # Reset price tracking
         self.min_price = float("inf")
         self.max_price = float("-inf")
+        self._y_limits = None
 
         # Reset to auto-scaling
         self.ax.relim()
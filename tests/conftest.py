@@ -17,6 +17,18 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_time_utils_caches():
+    """Drop memoized session windows so patched market hours take effect."""
+    from alphagen.core import time_utils
+    from src.alphagen.core import time_utils as src_time_utils
+
+    for module in (time_utils, src_time_utils):
+        module._trading_window.cache_clear()
+        module._session_bounds_for_date.cache_clear()
+    yield
+
+
 @pytest.fixture
 def mock_equity_tick():
     """Create a mock equity tick for testing."""
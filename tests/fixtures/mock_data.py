@@ -3,6 +3,8 @@
 from datetime import datetime, timedelta
 from typing import List
 
+import numpy as np
+
 from src.alphagen.core.events import (
     EquityTick,
     OptionQuote,
@@ -121,6 +123,46 @@ def create_signal(
     )
 
 
+def create_tick_series(
+    count: int = 1000,
+    start: datetime = None,
+) -> List[NormalizedTick]:
+    """Create a replay series of normalized ticks for chart throughput tests.
+
+    Price paths are computed once as NumPy arrays so the per-tick loop only
+    builds event objects.
+    """
+    if start is None:
+        start = now_est()
+
+    steps = np.arange(count)
+    prices = 400.0 + steps * 0.5
+    vwaps = (prices * 0.99).tolist()
+    ma9s = (prices * 1.01).tolist()
+    bids = (5.50 + steps * 0.1).tolist()
+    asks = (5.75 + steps * 0.1).tolist()
+    prices = prices.tolist()
+
+    ticks: List[NormalizedTick] = []
+    for i in range(count):
+        timestamp = start + timedelta(seconds=i)
+        ticks.append(
+            create_normalized_tick(
+                equity_tick=create_equity_tick(
+                    price=prices[i],
+                    session_vwap=vwaps[i],
+                    ma9=ma9s[i],
+                    timestamp=timestamp,
+                ),
+                option_quote=create_option_quote(
+                    bid=bids[i], ask=asks[i], timestamp=timestamp
+                ),
+                timestamp=timestamp,
+            )
+        )
+    return ticks
+
+
 def create_crossover_scenario() -> List[NormalizedTick]:
     """Create a series of ticks that demonstrate a VWAP/MA9 crossover."""
     base_time = now_est()
@@ -303,6 +303,47 @@ class TestAlphaGenAppSimple:
                 execution
             )
 
+    @pytest.mark.asyncio
+    async def test_record_execution_reuses_stored_intent_id(self):
+        """Test _record_execution skips re-inserting an already stored intent."""
+        timestamp = datetime.now(timezone.utc)
+        intent = TradeIntent(
+            as_of=timestamp,
+            action="SELL_TO_OPEN",
+            option_symbol="QQQ241220C00400000",
+            quantity=1,
+            limit_price=1.0,
+            stop_loss=3.0,
+            take_profit=0.5,
+            db_id=7,
+        )
+        execution = TradeExecution(
+            order_id="12345",
+            status="submitted",
+            fill_price=1.0,
+            pnl_contrib=0.0,
+            as_of=timestamp,
+            intent=intent,
+        )
+
+        with (
+            patch.object(AlphaGenApp, "__init__", lambda x: None),
+            patch(
+                "src.alphagen.app.insert_trade_intent", new_callable=AsyncMock
+            ) as mock_insert_intent,
+            patch(
+                "src.alphagen.app.insert_execution", new_callable=AsyncMock
+            ) as mock_insert_execution,
+        ):
+            alpha_app = AlphaGenApp()
+            alpha_app._position_calculator = MagicMock()
+            alpha_app._position_calculator.register_execution = AsyncMock()
+
+            await alpha_app._record_execution(execution)
+
+            mock_insert_intent.assert_not_called()
+            mock_insert_execution.assert_called_once_with(execution, intent_id=7)
+
     @pytest.mark.asyncio
     async def test_on_position_state_simple(self):
         """Test _on_position_state method with simple mocking."""
@@ -366,3 +407,19 @@ class TestAlphaGenAppSimple:
 
             # Verify trade manager was called
             app._trade_manager.update_option_quote.assert_called_once_with(option_quote)
+
+    def test_configure_logging_filters_below_level(self):
+        """Test loggers drop calls below the configured level."""
+        import logging
+
+        import structlog
+
+        from src.alphagen.app import configure_logging
+
+        try:
+            configure_logging("warning")
+            logger = structlog.get_logger("alphagen.test")
+            assert not logger.is_enabled_for(logging.DEBUG)
+            assert logger.is_enabled_for(logging.WARNING)
+        finally:
+            structlog.reset_defaults()
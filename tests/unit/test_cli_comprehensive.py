@@ -47,6 +47,20 @@ class TestCLICommands:
         assert result.exit_code == 0
         mock_run_app.assert_called_once()
 
+    @patch("src.alphagen.cli.run_app")
+    def test_run_command_sets_positions_cache_ttl(self, mock_run_app, monkeypatch):
+        """Test the backtest positions cache is opt-in from the command line."""
+        from src.alphagen.cli import CONFIG
+
+        monkeypatch.setattr(CONFIG.schwab, "positions_cache_ttl", 0.0)
+        mock_run_app.return_value = None
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["run", "--positions-cache-ttl", "60"])
+
+        assert result.exit_code == 0
+        assert CONFIG.schwab.positions_cache_ttl == 60.0
+
     @patch("src.alphagen.cli.fetch_daily_pnl")
     def test_report_command_without_date(self, mock_fetch_daily_pnl):
         """Test report command without date parameter."""
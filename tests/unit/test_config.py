@@ -0,0 +1,46 @@
+"""Unit tests for configuration loading."""
+
+import pytest
+
+from src.alphagen import config
+from src.alphagen.config import AppConfig, load_app_config_fast
+
+
+def test_load_app_config_fast_reuses_validated_settings():
+    """Test an unchanged environment skips validation and reuses settings."""
+    first = load_app_config_fast()
+    second = load_app_config_fast()
+
+    assert isinstance(second, AppConfig)
+    assert second is not first
+    assert second.risk is first.risk
+    assert second == first
+
+
+def test_load_app_config_fast_revalidates_on_env_change(monkeypatch):
+    """Test changed environment variables trigger a validated reload."""
+    first = load_app_config_fast()
+    monkeypatch.setenv("RISK_MAX_POSITION_SIZE", "7")
+
+    reloaded = load_app_config_fast()
+
+    assert reloaded.risk is not first.risk
+    assert reloaded.risk.max_position_size == 7
+    assert config._validated_config[1] is reloaded
+
+
+def test_unsupported_market_data_source_fails_in_factory(monkeypatch):
+    """Test loading config accepts any source and the factory rejects it."""
+    from src.alphagen.market_data.factory import create_market_data_provider
+
+    monkeypatch.setenv("MARKET_DATA_SOURCE", "Polygon")
+    polygon = load_app_config_fast()
+    monkeypatch.setenv("MARKET_DATA_SOURCE", "carrier-pigeon")
+    unknown = load_app_config_fast()
+
+    assert polygon.market_data_source == "polygon"
+    assert unknown.market_data_source == "carrier-pigeon"
+    with pytest.raises(RuntimeError, match="Polygon market data"):
+        create_market_data_provider(polygon)
+    with pytest.raises(RuntimeError, match="carrier-pigeon"):
+        create_market_data_provider(unknown)
@@ -0,0 +1,323 @@
+"""Tests for the debug GUI console buffering."""
+
+import asyncio
+import itertools
+import logging
+import queue
+from collections import deque
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import pytest
+
+from src.alphagen.config import EST
+from src.alphagen.core.events import EquityTick
+
+from src.alphagen.gui.debug_app import (
+    CONSOLE_FLUSH_MS,
+    CONSOLE_MAX_LINES,
+    UI_DRAIN_MS,
+    DebugGUI,
+    InvalidTokenError,
+    console_level,
+)
+
+
+def _gui() -> DebugGUI:
+    """Build a DebugGUI without creating Tk widgets."""
+    gui = DebugGUI.__new__(DebugGUI)
+    gui.root = MagicMock()
+    gui.console_tree = MagicMock()
+    gui.console_tree.insert.side_effect = (f"I{n}" for n in itertools.count(1))
+    gui.console_tree.get_children.return_value = ("I1",)
+    gui._log_buffer = deque()
+    gui._ui_queue = queue.SimpleQueue()
+    gui._console_min_level = logging.INFO
+    gui._token_error_shown = False
+    gui._stop_event = None
+    gui.normalizer = None
+    return gui
+
+
+def test_log_to_console_only_buffers():
+    """Test logging never touches Tk, so it is safe from the asyncio thread."""
+    gui = _gui()
+
+    gui._log_to_console("first")
+    gui._log_to_console("second")
+
+    assert list(gui._log_buffer) == [("info", "first"), ("info", "second")]
+    gui.root.after.assert_not_called()
+    gui.console_tree.insert.assert_not_called()
+
+
+def test_console_flush_tick_flushes_and_reschedules():
+    """Test the periodic console flush writes pending lines and re-arms."""
+    gui = _gui()
+    gui._log_to_console("line")
+
+    gui._console_flush_tick()
+
+    gui.console_tree.insert.assert_called_once()
+    gui.root.after.assert_called_once_with(CONSOLE_FLUSH_MS, gui._console_flush_tick)
+
+
+def test_drain_ui_queue_runs_updates_on_tk_thread():
+    """Test queued widget updates are applied in order by the drain loop."""
+    gui = _gui()
+    calls = []
+    gui._run_in_ui(calls.append, 1)
+    gui._run_in_ui(calls.append, 2)
+
+    gui._drain_ui_queue()
+
+    assert calls == [1, 2]
+    gui.root.after.assert_called_once_with(UI_DRAIN_MS, gui._drain_ui_queue)
+
+
+def test_drain_ui_queue_reports_failed_updates():
+    """Test a failing update is logged and later updates still run."""
+    gui = _gui()
+    calls = []
+
+    def boom():
+        raise RuntimeError("bad widget")
+
+    gui._run_in_ui(boom)
+    gui._run_in_ui(calls.append, "ok")
+
+    gui._drain_ui_queue()
+
+    assert calls == ["ok"]
+    assert gui._log_buffer[-1] == ("error", "UI update error: bad widget")
+
+
+def test_flush_console_inserts_rows_by_level():
+    """Test a flush appends one tagged row per queued line."""
+    gui = _gui()
+    gui._log_to_console("a")
+    gui._log_to_console("oops", "error")
+
+    with patch("src.alphagen.gui.debug_app.time.strftime", return_value="10:00:00"):
+        gui._flush_console()
+
+    assert gui.console_tree.insert.call_args_list == [
+        call("", "end", values=("10:00:00", "INFO", "a"), tags=("info",)),
+        call("", "end", values=("10:00:00", "ERROR", "oops"), tags=("error",)),
+    ]
+    gui.console_tree.see.assert_called_once_with("I2")
+    assert not gui._log_buffer
+
+
+def test_flush_console_with_empty_buffer_is_noop():
+    """Test a flush without queued lines leaves the widget untouched."""
+    gui = _gui()
+
+    gui._flush_console()
+
+    gui.console_tree.insert.assert_not_called()
+    gui.console_tree.see.assert_not_called()
+
+
+def test_flush_console_trims_scrollback():
+    """Test rows beyond the scrollback cap are deleted from the top."""
+    gui = _gui()
+    rows = tuple(f"I{i}" for i in range(CONSOLE_MAX_LINES + 3))
+    gui.console_tree.get_children.return_value = rows
+    gui._log_to_console("line")
+
+    gui._flush_console()
+
+    gui.console_tree.delete.assert_called_once_with("I0", "I1", "I2")
+
+
+def test_flush_console_keeps_short_scrollback():
+    """Test nothing is trimmed while under the scrollback cap."""
+    gui = _gui()
+    gui._log_to_console("line")
+
+    gui._flush_console()
+
+    gui.console_tree.delete.assert_not_called()
+
+
+def test_clear_console_removes_rows_and_pending_lines():
+    """Test clearing drops both rendered rows and unflushed lines."""
+    gui = _gui()
+    gui._log_to_console("pending")
+
+    gui._clear_console()
+
+    gui.console_tree.delete.assert_called_once_with("I1")
+    assert list(gui._log_buffer) == [("info", "Console cleared")]
+
+
+def test_log_to_console_drops_messages_below_min_level():
+    """Test debug lines are discarded at the default info level."""
+    gui = _gui()
+
+    gui._log_to_console("noise", "debug")
+
+    assert not gui._log_buffer
+    gui.root.after.assert_not_called()
+
+
+def test_console_level_follows_configured_log_level():
+    """Test LOG_LEVEL picks the console threshold, so feed lines can be shown."""
+    assert console_level("DEBUG") == logging.DEBUG
+    assert console_level("warning") == logging.WARNING
+    assert console_level("verbose") == logging.INFO
+
+
+@pytest.mark.asyncio
+async def test_equity_tick_skips_formatting_when_filtered():
+    """Test raw equity ticks are only formatted when debug output is enabled."""
+    gui = _gui()
+    tick = EquityTick("QQQ", 400.0, 399.5, 398.0, datetime(2024, 1, 16, 10, tzinfo=EST))
+
+    with patch.object(gui, "_log_to_console") as log:
+        await gui._handle_equity_tick(tick)
+        log.assert_not_called()
+
+        gui._console_min_level = logging.DEBUG
+        await gui._handle_equity_tick(tick)
+        log.assert_called_once_with("Equity: QQQ = $400.00", "debug")
+
+
+@pytest.mark.asyncio
+async def test_normalized_tick_is_marshalled_to_ui_queue():
+    """Test normalized ticks update widgets only via the Tk-thread queue."""
+    gui = _gui()
+    gui.current_price = MagicMock()
+    gui.current_vwap = MagicMock()
+    gui.current_ma9 = MagicMock()
+    gui.gui_chart = None
+    tick = MagicMock()
+    tick.equity = EquityTick(
+        "QQQ", 400.0, 399.5, 398.0, datetime(2024, 1, 16, 10, tzinfo=EST)
+    )
+
+    await gui._handle_normalized_tick(tick)
+    gui.current_price.set.assert_not_called()
+
+    gui._drain_ui_queue()
+    gui.current_price.set.assert_called_once_with("$400.00")
+
+
+@pytest.mark.asyncio
+async def test_token_error_reported_once():
+    """Test repeated token errors produce one message and one stop request."""
+    gui = _gui()
+
+    for _ in range(3):
+        await gui._handle_stream_error(InvalidTokenError("token_invalid"))
+
+    assert [level for level, _ in gui._log_buffer] == ["error", "warning"]
+    assert gui._ui_queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_other_stream_errors_are_logged_each_time():
+    """Test errors that merely mention tokens are not treated as token errors."""
+    gui = _gui()
+
+    await gui._handle_stream_error(RuntimeError("token_invalid in payload"))
+    await gui._handle_stream_error(RuntimeError("timeout"))
+
+    assert list(gui._log_buffer) == [
+        ("error", "Stream error: token_invalid in payload"),
+        ("error", "Stream error: timeout"),
+    ]
+    assert gui._ui_queue.empty()
+
+
+def test_setup_oauth_runs_on_asyncio_loop():
+    """Test OAuth setup is scheduled on the loop instead of a subprocess."""
+    gui = _gui()
+    gui.loop = MagicMock()
+    future = MagicMock()
+
+    with (
+        patch(
+            "src.alphagen.gui.debug_app.run_oauth_setup", new_callable=MagicMock
+        ) as run_setup,
+        patch(
+            "src.alphagen.gui.debug_app.asyncio.run_coroutine_threadsafe",
+            return_value=future,
+        ) as schedule,
+    ):
+        gui._setup_oauth()
+
+    schedule.assert_called_once_with(run_setup.return_value, gui.loop)
+    done_callback = future.add_done_callback.call_args[0][0]
+    future.result.return_value = True
+    done_callback(future)
+    gui._drain_ui_queue()
+    assert gui._log_buffer[-1] == ("info", "✅ OAuth setup completed successfully!")
+
+
+def test_oauth_done_reports_errors():
+    """Test a failed OAuth setup future is reported on the console."""
+    gui = _gui()
+    future = MagicMock()
+    future.result.side_effect = RuntimeError("browser closed")
+
+    gui._oauth_done(future)
+
+    assert gui._log_buffer[-1] == ("error", "❌ OAuth setup error: browser closed")
+
+
+@pytest.mark.asyncio
+async def test_run_app_idles_until_stop_event():
+    """Test the app task waits on an event instead of polling with sleep."""
+    gui = _gui()
+    app = MagicMock()
+    app._market_data.start = AsyncMock()
+    app._market_data.stop = AsyncMock()
+
+    with patch("alphagen.app.AlphaGenApp", return_value=app):
+        task = asyncio.create_task(gui._run_app())
+        await asyncio.sleep(0)
+        assert not task.done()
+        app._market_data.start.assert_awaited_once()
+        app._market_data.stop.assert_not_awaited()
+
+        gui._stop_event.set()
+        await asyncio.wait_for(task, 1)
+
+    app._market_data.stop.assert_awaited_once()
+    assert gui._log_buffer[-1] == ("info", "App stopped")
+
+
+@pytest.mark.asyncio
+async def test_run_app_stops_market_data_when_cancelled():
+    """Test cancelling the app task still stops the market data stream."""
+    gui = _gui()
+    app = MagicMock()
+    app._market_data.start = AsyncMock()
+    app._market_data.stop = AsyncMock()
+
+    with patch("alphagen.app.AlphaGenApp", return_value=app):
+        task = asyncio.create_task(gui._run_app())
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.wait_for(task, 1)
+
+    app._market_data.stop.assert_awaited_once()
+    assert gui._log_buffer[-1] == ("info", "App stopped")
+
+
+def test_stop_streaming_signals_event_on_loop_thread():
+    """Test stopping hands the event set to the loop rather than cancelling."""
+    gui = _gui()
+    gui.loop = MagicMock()
+    gui.status_label = MagicMock()
+    task = gui.app_task = MagicMock()
+    stop_event = gui._stop_event = MagicMock()
+
+    gui._stop_streaming()
+
+    gui.loop.call_soon_threadsafe.assert_called_once_with(stop_event.set)
+    task.cancel.assert_not_called()
+    assert gui.app_task is None
+    assert gui._stop_event is None
@@ -0,0 +1,28 @@
+"""Tests for event loop setup."""
+
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.alphagen.core.event_loop import install_uvloop
+
+
+def test_install_uvloop_without_package():
+    """Test the default loop is kept when uvloop is not installed."""
+    with patch.dict(sys.modules, {"uvloop": None}), patch(
+        "asyncio.set_event_loop_policy"
+    ) as set_policy:
+        assert install_uvloop() is False
+        set_policy.assert_not_called()
+
+
+def test_install_uvloop_sets_policy():
+    """Test the uvloop policy is installed when the package is present."""
+    policy = object()
+    fake_uvloop = SimpleNamespace(EventLoopPolicy=lambda: policy)
+
+    with patch.dict(sys.modules, {"uvloop": fake_uvloop}), patch(
+        "asyncio.set_event_loop_policy"
+    ) as set_policy:
+        assert install_uvloop() is True
+        set_policy.assert_called_once_with(policy)
@@ -42,6 +42,23 @@ class TestEquityTick:
         assert tick.as_of.tzinfo == EST
         assert tick.as_of.replace(tzinfo=None) == naive_dt
 
+    def test_equity_tick_post_init_truncates_microseconds(self):
+        """Test that __post_init__ aligns timestamps to whole seconds."""
+        as_of = datetime(2024, 1, 15, 10, 0, 0, 654321, tzinfo=EST)
+        tick = EquityTick(
+            symbol="QQQ", price=400.0, session_vwap=399.5, ma9=398.0, as_of=as_of
+        )
+        naive_tick = EquityTick(
+            symbol="QQQ",
+            price=400.0,
+            session_vwap=399.5,
+            ma9=398.0,
+            as_of=as_of.replace(tzinfo=None),
+        )
+
+        assert tick.as_of == as_of.replace(microsecond=0)
+        assert naive_tick.as_of == as_of.replace(microsecond=0)
+
 
 class TestOptionQuote:
     """Test OptionQuote dataclass."""
@@ -195,6 +212,23 @@ class TestTradeIntent:
         assert intent.stop_loss == 3.00
         assert intent.take_profit == 2.20
 
+    def test_trade_intent_action_flags(self):
+        """Test buy/sell flags are derived from the action."""
+        as_of = datetime(2024, 1, 15, 10, 0, 0, tzinfo=EST)
+
+        def make(action):
+            return TradeIntent(as_of, action, "QQQ240119C00400000", 1, 2.60, 3.00, 2.20)
+
+        assert make("BUY_TO_CLOSE").is_buy
+        assert not make("BUY_TO_CLOSE").is_sell
+        assert make("sell_to_open").is_sell
+        assert not make("sell_to_open").is_buy
+        short = make("SHORT")
+        assert not short.is_buy and not short.is_sell
+        assert make("sell_to_open").direction == -1
+        assert make("BUY_TO_OPEN").direction == 1
+        assert short.direction == 1
+
 
 class TestTradeExecution:
     """Test TradeExecution dataclass."""
@@ -351,3 +385,10 @@ class TestPositionState:
         positions = PositionState(as_of=as_of, symbols={})
 
         assert positions.total_market_value() == 0.0
+
+    def test_position_state_total_market_value_precomputed(self):
+        """Test a stamped market value sum is returned as-is."""
+        as_of = datetime(2024, 1, 15, 10, 0, 0, tzinfo=EST)
+        positions = PositionState(as_of=as_of, symbols={}, market_value_sum=12.5)
+
+        assert positions.total_market_value() == 12.5
@@ -1,29 +1,32 @@
 """Comprehensive tests for file_chart module."""
 
+import threading
+
 import pytest
 from unittest.mock import Mock, patch
 from datetime import datetime
 
-from src.alphagen.visualization.file_chart import FileChart, _TickPoint
+from src.alphagen.visualization.file_chart import FileChart
+from tests.fixtures.mock_data import create_tick_series
 
 
 class TestFileChartComprehensive:
     """Comprehensive tests for FileChart."""
 
     @pytest.fixture
-    def file_chart(self):
+    def file_chart(self, tmp_path):
         """Create a FileChart instance."""
-        return FileChart()
+        return FileChart(output_dir=str(tmp_path))
 
     def test_save_chart_exception_handling(self, file_chart):
         """Test _save_chart handles exceptions properly."""
         # Add some data to the buffer so the method doesn't return early
-        file_chart._tick_buffer.append(
-            _TickPoint(timestamp=datetime.now(), vwap=100.0, ma9=99.0)
-        )
+        file_chart._record_tick(datetime.now(), 100.0, 99.0)
 
-        # Mock plt.savefig to raise an exception
-        with patch("matplotlib.pyplot.savefig", side_effect=Exception("Save failed")):
+        # Mock Figure.savefig to raise an exception
+        with patch(
+            "matplotlib.figure.Figure.savefig", side_effect=Exception("Save failed")
+        ):
             # Mock the logger
             file_chart._logger = Mock()
 
@@ -38,15 +41,13 @@ class TestFileChartComprehensive:
     def test_save_chart_success(self, file_chart):
         """Test _save_chart saves successfully."""
         # Add some data to the buffer so the method doesn't return early
-        file_chart._tick_buffer.append(
-            _TickPoint(timestamp=datetime.now(), vwap=100.0, ma9=99.0)
-        )
+        file_chart._record_tick(datetime.now(), 100.0, 99.0)
 
         # Mock the logger
         file_chart._logger = Mock()
 
-        # Mock plt.savefig
-        with patch("matplotlib.pyplot.savefig") as mock_savefig:
+        # Mock Figure.savefig
+        with patch("matplotlib.figure.Figure.savefig") as mock_savefig:
             # Should save successfully
             file_chart._save_chart()
 
@@ -58,3 +59,145 @@ class TestFileChartComprehensive:
             call_args = file_chart._logger.info.call_args
             assert call_args[0][0] == "chart_saved"
             assert "filename" in call_args[1]
+
+    def test_handle_tick_replay_series(self, file_chart):
+        """Test replaying a long tick series keeps the buffer bounded."""
+        ticks = create_tick_series(1000)
+        file_chart.start()
+
+        with patch.object(file_chart, "_save_chart") as mock_save:
+            for tick in ticks:
+                file_chart.handle_tick(tick)
+
+        assert len(file_chart._tick_buffer) == file_chart._max_points
+        assert file_chart._tick_buffer.views()[1][-1] == ticks[-1].equity.session_vwap
+        assert mock_save.call_count > 0
+
+    def test_save_chart_reuses_figure_and_throttles(self, file_chart):
+        """Test saves share one figure and bursts inside the interval coalesce."""
+        file_chart._record_tick(datetime.now(), 100.0, 99.0)
+
+        with (
+            patch("matplotlib.figure.Figure.savefig") as mock_savefig,
+            patch(
+                "src.alphagen.visualization.file_chart.time.monotonic",
+                side_effect=[10.0, 10.1, 10.6],
+            ),
+        ):
+            file_chart._save_chart()
+            fig = file_chart._fig
+            file_chart._save_chart()
+            file_chart._save_chart()
+
+        assert mock_savefig.call_count == 2
+        assert file_chart._fig is fig
+        assert mock_savefig.call_args.kwargs["pil_kwargs"] == {"compress_level": 1}
+        file_chart.start()
+        file_chart.stop()
+        assert file_chart._fig is None
+
+    def test_throttled_save_is_rendered_once_interval_expires(self, file_chart):
+        """Test a signal inside the interval is saved by the next due tick."""
+        tick = Mock()
+        tick.as_of = datetime.now()
+        tick.equity.session_vwap = 100.0
+        tick.equity.ma9 = 99.0
+        signal = Mock(as_of=datetime.now(), reference_price=100.0)
+        signal.action = "SELL_TO_OPEN"
+        file_chart._record_tick(datetime.now(), 100.0, 99.0)
+        file_chart._running = True
+
+        with (
+            patch("matplotlib.figure.Figure.savefig") as mock_savefig,
+            patch(
+                "src.alphagen.visualization.file_chart.time.monotonic",
+                side_effect=[10.0, 10.1, 10.2, 10.6],
+            ),
+        ):
+            file_chart._save_chart()
+            file_chart.handle_signal(signal)
+            assert file_chart._dirty
+            file_chart.handle_tick(tick)
+            assert mock_savefig.call_count == 1
+            file_chart.handle_tick(tick)
+
+        assert mock_savefig.call_count == 2
+        assert not file_chart._dirty
+
+    def test_stop_saves_throttled_chart(self, file_chart):
+        """Test stop() renders data whose save was throttled."""
+        file_chart._record_tick(datetime.now(), 100.0, 99.0)
+
+        with (
+            patch.object(file_chart, "_render") as mock_render,
+            patch(
+                "src.alphagen.visualization.file_chart.time.monotonic",
+                side_effect=[10.0, 10.1, 10.2],
+            ),
+        ):
+            file_chart.start()
+            file_chart._save_chart()
+            file_chart._record_tick(datetime.now(), 101.0, 99.5)
+            file_chart._save_chart()
+            file_chart.stop()
+
+        # The worker may coalesce the two snapshots; the last holds both ticks
+        vwap = mock_render.call_args.args[1]
+        assert list(vwap) == [100.0, 101.0]
+        assert not file_chart._dirty
+
+    def test_started_chart_renders_on_worker_thread(self, file_chart):
+        """Test saves after start() are rendered off the calling thread."""
+        file_chart._record_tick(datetime.now(), 100.0, 99.0)
+        threads = []
+
+        with patch(
+            "matplotlib.figure.Figure.savefig",
+            side_effect=lambda *args, **kwargs: threads.append(
+                threading.current_thread()
+            ),
+        ):
+            file_chart.start()
+            worker = file_chart._worker
+            file_chart._save_chart()
+            file_chart.stop()
+
+        assert threads == [worker]
+        assert not worker.is_alive()
+        assert file_chart._worker is None
+
+    def test_enqueue_drops_oldest_snapshot_when_full(self, file_chart):
+        """Test a full render queue keeps only the newest snapshots."""
+        for item in ("first", "second", "third"):
+            file_chart._enqueue(item)
+
+        queued = [file_chart._render_q.get_nowait() for _ in range(2)]
+        assert queued == ["second", "third"]
+
+    def test_saves_are_numbered_within_a_run_directory(self, file_chart):
+        """Test images get sequential names under one directory per run."""
+        file_chart._record_tick(datetime.now(), 100.0, 99.0)
+
+        with (
+            patch("matplotlib.figure.Figure.savefig") as mock_savefig,
+            patch(
+                "src.alphagen.visualization.file_chart.time.monotonic",
+                side_effect=[10.0, 11.0, 12.0],
+            ),
+        ):
+            file_chart._save_chart()
+            file_chart._save_chart()
+            first_run = file_chart._run_dir
+            file_chart.start()
+            file_chart.stop()
+            file_chart._save_chart()
+
+        names = [call.args[0].name for call in mock_savefig.call_args_list]
+        assert names == [
+            "trading_chart_000001.png",
+            "trading_chart_000002.png",
+            "trading_chart_000003.png",
+        ]
+        assert first_run.parent == file_chart._output_dir
+        assert first_run.name.startswith("run_")
+        assert mock_savefig.call_args_list[1].args[0].parent == first_run
@@ -0,0 +1,202 @@
+"""Unit tests for the normalizer ETL stage."""
+
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+from src.alphagen.config import EST
+from src.alphagen.core.events import EquityTick, OptionQuote
+from src.alphagen.etl.normalizer import Normalizer
+
+SESSION_TIME = datetime(2024, 12, 18, 10, 0, 0, 123456, tzinfo=EST)
+
+
+def _equity(price: float = 400.0, as_of: datetime = SESSION_TIME) -> EquityTick:
+    return EquityTick("QQQ", price, price - 1.0, price + 1.0, as_of)
+
+
+def _option(
+    strike: float, as_of: datetime = SESSION_TIME, symbol: str = "QQQ241218C00400000"
+) -> OptionQuote:
+    return OptionQuote(symbol, strike, 1.00, 1.10, as_of, as_of)
+
+
+@pytest.mark.asyncio
+async def test_ingest_equity_emits_normalized_tick():
+    """Test an equity tick inside the session emits a truncated normalized tick."""
+    emit = AsyncMock()
+    normalizer = Normalizer(emit=emit)
+
+    tick = _equity()
+    await normalizer.ingest_equity(tick)
+
+    emit.assert_awaited_once()
+    normalized = emit.call_args[0][0]
+    assert normalized.equity is tick
+    assert normalized.option is None
+    assert normalized.as_of == SESSION_TIME.replace(microsecond=0)
+
+
+@pytest.mark.asyncio
+async def test_ingest_equity_ignores_other_symbols():
+    """Test ticks for a different underlying are dropped."""
+    emit = AsyncMock()
+    normalizer = Normalizer(emit=emit)
+
+    await normalizer.ingest_equity(
+        EquityTick("SPY", 500.0, 499.0, 501.0, SESSION_TIME)
+    )
+
+    emit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_ingest_equity_outside_trading_window():
+    """Test ticks outside the trading window are dropped."""
+    emit = AsyncMock()
+    normalizer = Normalizer(emit=emit)
+
+    await normalizer.ingest_equity(_equity(as_of=SESSION_TIME.replace(hour=3)))
+
+    emit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_ingest_option_selects_nearest_strike():
+    """Test the option closest to the underlying price is attached."""
+    emit = AsyncMock()
+    normalizer = Normalizer(emit=emit)
+
+    await normalizer.ingest_equity(_equity(price=401.0))
+    await normalizer.ingest_option(_option(395.0))
+    await normalizer.ingest_option(_option(400.0))
+    await normalizer.ingest_option(_option(410.0))
+
+    assert emit.call_args[0][0].option.strike == 400.0
+
+
+@pytest.mark.asyncio
+async def test_ingest_option_ignores_other_expiries():
+    """Test options not expiring on the quote date are not selected."""
+    emit = AsyncMock()
+    normalizer = Normalizer(emit=emit)
+    tomorrow = SESSION_TIME + timedelta(days=1)
+
+    await normalizer.ingest_equity(_equity())
+    await normalizer.ingest_option(
+        OptionQuote("QQQ241219C00400000", 400.0, 1.00, 1.10, tomorrow, SESSION_TIME)
+    )
+
+    assert emit.call_args[0][0].option is None
+
+
+@pytest.mark.asyncio
+async def test_emit_errors_propagate():
+    """Test emit callback failures are not swallowed."""
+    emit = AsyncMock(side_effect=RuntimeError("boom"))
+    normalizer = Normalizer(emit=emit)
+
+    with pytest.raises(RuntimeError):
+        await normalizer.ingest_equity(_equity())
+
+
+@pytest.mark.asyncio
+async def test_nearest_option_follows_underlying_price():
+    """Test the nearest strike is re-selected after the underlying moves."""
+    emit = AsyncMock()
+    normalizer = Normalizer(emit=emit)
+
+    await normalizer.ingest_equity(_equity(price=400.0))
+    await normalizer.ingest_option(_option(400.0))
+    await normalizer.ingest_option(_option(405.0))
+    assert emit.call_args[0][0].option.strike == 400.0
+
+    await normalizer.ingest_equity(_equity(price=406.0))
+    await normalizer.ingest_option(_option(420.0))
+    assert emit.call_args[0][0].option.strike == 405.0
+
+
+@pytest.mark.asyncio
+async def test_nearest_option_rescans_after_eviction():
+    """Test an evicted nearest quote is no longer selected."""
+    emit = AsyncMock()
+    normalizer = Normalizer(emit=emit)
+
+    await normalizer.ingest_equity(_equity(price=400.0))
+    await normalizer.ingest_option(_option(400.0))
+    for offset in range(1, 21):
+        await normalizer.ingest_option(_option(400.0 + offset))
+
+    assert emit.call_args[0][0].option.strike == 401.0
+
+
+@pytest.mark.asyncio
+async def test_nearest_option_ties_keep_oldest_quote():
+    """Test equally close strikes keep the first buffered quote, cached or not."""
+    emit = AsyncMock()
+    normalizer = Normalizer(emit=emit)
+    first = _option(399.0)
+
+    await normalizer.ingest_equity(_equity(price=400.0))
+    await normalizer.ingest_option(first)
+    await normalizer.ingest_option(_option(401.0))
+    assert emit.call_args[0][0].option is first
+
+    # A quote buffered outside the window forces a full rescan of the bucket.
+    await normalizer.ingest_option(_option(500.0, as_of=SESSION_TIME.replace(hour=3)))
+    assert normalizer._nearest is None
+    await normalizer.ingest_option(_option(399.0))
+    assert emit.call_args[0][0].option is first
+
+
+def test_normalizer_state_is_slotted():
+    """Test the normalizer keeps its per-tick state in slots."""
+    normalizer = Normalizer(emit=AsyncMock())
+
+    assert not hasattr(normalizer, "__dict__")
+    assert normalizer._latest_equity is None
+    assert normalizer._options_by_expiry == {}
+
+
+@pytest.mark.asyncio
+async def test_reuse_tick_emits_same_object():
+    """Test reuse_tick refreshes a single NormalizedTick in place."""
+    emit = AsyncMock()
+    normalizer = Normalizer(emit=emit, reuse_tick=True)
+
+    await normalizer.ingest_equity(_equity(price=400.0))
+    first = emit.call_args[0][0]
+    later = _equity(price=401.0, as_of=SESSION_TIME + timedelta(seconds=1))
+    await normalizer.ingest_equity(later)
+
+    assert emit.call_args[0][0] is first
+    assert first.equity is later
+    assert first.as_of == later.as_of
+
+
+@pytest.mark.asyncio
+async def test_default_emits_fresh_ticks():
+    """Test each emit gets its own NormalizedTick unless reuse is enabled."""
+    emit = AsyncMock()
+    normalizer = Normalizer(emit=emit)
+
+    await normalizer.ingest_equity(_equity(price=400.0))
+    await normalizer.ingest_equity(_equity(price=401.0))
+
+    first, second = (call.args[0] for call in emit.call_args_list)
+    assert first is not second
+    assert first.equity.price == 400.0
+
+
+@pytest.mark.asyncio
+async def test_ingest_option_ignores_other_underlyings():
+    """Test quotes for other underlyings are dropped, including on repeats."""
+    emit = AsyncMock()
+    normalizer = Normalizer(emit=emit)
+
+    await normalizer.ingest_equity(_equity())
+    for _ in range(2):
+        await normalizer.ingest_option(_option(400.0, symbol="SPY241218C00400000"))
+
+    assert emit.await_count == 1
+    assert normalizer._options_by_expiry == {}
@@ -187,15 +187,16 @@ class TestOAuthClientCreation:
             patch(
                 "alphagen.schwab_oauth_client.client_from_token_file"
             ) as mock_token_file,
-            patch("alphagen.schwab_oauth_client.load_app_config") as mock_config,
+            patch("alphagen.schwab_oauth_client.CONFIG") as mock_config,
             patch("alphagen.schwab_oauth_client.Path") as mock_path,
         ):
             from unittest.mock import Mock
             # Mock valid config
-            mock_config.return_value.schwab.api_key = "test_key"
-            mock_config.return_value.schwab.api_secret = "test_secret"
-            mock_config.return_value.schwab.account_id = "test_account"
-            mock_config.return_value.schwab.token_path = "test_token.json"
+            mock_config.schwab.api_key = "test_key"
+            mock_config.schwab.api_secret = "test_secret"
+            mock_config.schwab.account_id = "test_account"
+            mock_config.schwab.token_path = "test_token.json"
+            mock_config.schwab.positions_cache_ttl = 0
 
             # Mock token file exists and client creation succeeds
             mock_path_instance = mock_path.return_value
@@ -211,11 +212,11 @@ class TestOAuthClientCreation:
 
     def test_client_creation_with_missing_config(self):
         """Test client creation with missing configuration."""
-        with patch("alphagen.schwab_oauth_client.load_app_config") as mock_config:
+        with patch("alphagen.schwab_oauth_client.CONFIG") as mock_config:
             # Mock missing config
-            mock_config.return_value.schwab.api_key = None
-            mock_config.return_value.schwab.api_secret = None
-            mock_config.return_value.schwab.account_id = None
+            mock_config.schwab.api_key = None
+            mock_config.schwab.api_secret = None
+            mock_config.schwab.account_id = None
 
             client = SchwabOAuthClient.create()
 
@@ -227,14 +228,15 @@ class TestOAuthClientCreation:
             patch(
                 "alphagen.schwab_oauth_client.client_from_token_file"
             ) as mock_token_file,
-            patch("alphagen.schwab_oauth_client.load_app_config") as mock_config,
+            patch("alphagen.schwab_oauth_client.CONFIG") as mock_config,
             patch("alphagen.schwab_oauth_client.Path") as mock_path,
         ):
             # Mock valid config
-            mock_config.return_value.schwab.api_key = "test_key"
-            mock_config.return_value.schwab.api_secret = "test_secret"
-            mock_config.return_value.schwab.account_id = "test_account"
-            mock_config.return_value.schwab.token_path = "test_token.json"
+            mock_config.schwab.api_key = "test_key"
+            mock_config.schwab.api_secret = "test_secret"
+            mock_config.schwab.account_id = "test_account"
+            mock_config.schwab.token_path = "test_token.json"
+            mock_config.schwab.positions_cache_ttl = 0
 
             # Mock token file exists but loading fails
             mock_path_instance = mock_path.return_value
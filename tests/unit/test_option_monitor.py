@@ -0,0 +1,106 @@
+"""Unit tests for the option quote monitor."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.alphagen.config import EST
+from src.alphagen.core.events import OptionQuote
+from src.alphagen.option_monitor import OptionMonitor
+
+
+def _quote(symbol: str) -> OptionQuote:
+    as_of = datetime(2024, 12, 18, 10, 0, 0, tzinfo=EST)
+    return OptionQuote(symbol, 400.0, 1.00, 1.10, as_of, as_of)
+
+
+def _client(*symbols: str) -> AsyncMock:
+    client = AsyncMock()
+    client.fetch_option_quotes.return_value = [_quote(s) for s in symbols]
+    return client
+
+
+@pytest.mark.asyncio
+async def test_tracked_symbols_share_one_request():
+    """Test all tracked symbols are refreshed with a single bulk fetch."""
+    client = _client("AAA", "BBB")
+    on_quote = AsyncMock()
+    monitor = OptionMonitor(client, on_quote, interval_seconds=60)
+
+    monitor.track("AAA")
+    monitor.track("BBB")
+    await asyncio.sleep(0)
+    await monitor.shutdown()
+
+    client.fetch_option_quotes.assert_awaited_once()
+    assert sorted(client.fetch_option_quotes.call_args[0][0]) == ["AAA", "BBB"]
+    assert [c.args[0].option_symbol for c in on_quote.call_args_list] == ["AAA", "BBB"]
+
+
+@pytest.mark.asyncio
+async def test_untracked_symbols_are_not_reported():
+    """Test quotes for symbols untracked mid-request are dropped."""
+    client = _client("AAA", "BBB")
+    on_quote = AsyncMock()
+    monitor = OptionMonitor(client, on_quote, interval_seconds=60)
+
+    monitor.track("AAA")
+    monitor.track("BBB")
+    monitor.untrack("BBB")
+    client.fetch_option_quotes.return_value = [_quote("AAA"), _quote("BBB")]
+    await asyncio.sleep(0)
+    await monitor.shutdown()
+
+    assert [c.args[0].option_symbol for c in on_quote.call_args_list] == ["AAA"]
+
+
+@pytest.mark.asyncio
+async def test_track_wakes_idle_poller():
+    """Test tracking a symbol after the set emptied triggers a fresh poll."""
+    client = _client("AAA")
+    monitor = OptionMonitor(client, AsyncMock(), interval_seconds=60)
+
+    monitor.track("AAA")
+    await asyncio.sleep(0)
+    monitor.untrack("AAA")
+    monitor.track("AAA")
+    for _ in range(3):
+        await asyncio.sleep(0)
+    await monitor.shutdown()
+
+    assert client.fetch_option_quotes.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_errors_keep_polling_alive():
+    """Test a failed bulk fetch is logged and does not stop the monitor."""
+    client = AsyncMock()
+    client.fetch_option_quotes.side_effect = RuntimeError("boom")
+    monitor = OptionMonitor(client, AsyncMock(), interval_seconds=0)
+
+    monitor.track("AAA")
+    for _ in range(5):
+        await asyncio.sleep(0)
+    task = monitor._task
+    await monitor.shutdown()
+
+    assert client.fetch_option_quotes.await_count >= 2
+    assert task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_interval_timer_repolls_without_extra_tasks():
+    """Test the poller re-polls on its interval timer from a single task."""
+    client = _client("AAA")
+    monitor = OptionMonitor(client, AsyncMock(), interval_seconds=0.01)
+
+    monitor.track("AAA")
+    tasks_before = len(asyncio.all_tasks())
+    await asyncio.sleep(0.05)
+    tasks_after = len(asyncio.all_tasks())
+    await monitor.shutdown()
+
+    assert client.fetch_option_quotes.await_count >= 2
+    assert tasks_after == tasks_before
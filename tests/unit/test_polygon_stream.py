@@ -0,0 +1,208 @@
+"""Unit tests for the Polygon websocket consumers."""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.alphagen.config import EST
+from src.alphagen.polygon_stream import PolygonMarketDataProvider
+
+
+class _FakeSocket:
+    def __init__(self, *frames: str) -> None:
+        self._frames = list(frames)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> str:
+        if not self._frames:
+            raise StopAsyncIteration
+        return self._frames.pop(0)
+
+
+def _provider(**sockets) -> tuple[PolygonMarketDataProvider, MagicMock]:
+    provider = PolygonMarketDataProvider()
+    callbacks = MagicMock()
+    callbacks.on_equity_tick = AsyncMock()
+    callbacks.on_option_quote = AsyncMock()
+    callbacks.on_error = AsyncMock()
+    provider._callbacks = callbacks
+    provider._equity_ws = sockets.get("equity")
+    provider._options_ws = sockets.get("options")
+    return provider, callbacks
+
+
+@pytest.mark.asyncio
+async def test_consume_equity_parses_aggregates():
+    """Test XA entries become equity ticks and status entries are skipped."""
+    frame = json.dumps(
+        [
+            {"ev": "status", "status": "auth_success"},
+            {"ev": "XA", "sym": "QQQ", "c": 401.5, "vw": 400, "s": 1734534000000},
+        ]
+    )
+    provider, callbacks = _provider(equity=_FakeSocket(frame))
+
+    await provider._consume_equity()
+
+    callbacks.on_error.assert_not_called()
+    callbacks.on_equity_tick.assert_not_called()
+    tick = provider._equity_queue.get_nowait()
+    assert provider._equity_queue.empty()
+    assert tick.symbol == "QQQ"
+    assert tick.price == 401.5
+    assert tick.session_vwap == 400.0
+    assert tick.ma9 == 0.0
+    assert tick.as_of.tzinfo == EST
+    # 1734534000000 ms is 2024-12-18 15:00 UTC, whatever the host timezone.
+    assert tick.as_of.isoformat() == "2024-12-18T10:00:00-05:00"
+
+
+@pytest.mark.asyncio
+async def test_consume_options_parses_quotes():
+    """Test Q entries become option quotes."""
+    frame = json.dumps(
+        [
+            {
+                "ev": "Q",
+                "sym": "O:QQQ241218C00400000",
+                "k": 400,
+                "bp": 1.1,
+                "ap": 1.2,
+                "x": 1734555600000,
+                "t": 1734534000000,
+            }
+        ]
+    )
+    provider, callbacks = _provider(options=_FakeSocket(frame))
+
+    await provider._consume_options()
+
+    quote = provider._option_queue.get_nowait()
+    assert quote.option_symbol == "O:QQQ241218C00400000"
+    assert quote.strike == 400.0
+    assert quote.mid() == pytest.approx(1.15)
+    assert quote.expiry.tzinfo == EST
+    assert quote.as_of.isoformat() == "2024-12-18T10:00:00-05:00"
+
+
+@pytest.mark.asyncio
+async def test_consume_equity_reports_malformed_frames():
+    """Test invalid payloads are routed to the error callback."""
+    provider, callbacks = _provider(equity=_FakeSocket("not json"))
+
+    await provider._consume_equity()
+
+    callbacks.on_error.assert_awaited_once()
+    assert provider._equity_queue.empty()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("missing", ["sym", "t"])
+async def test_consume_options_rejects_quotes_missing_fields(missing):
+    """Test a Q entry without its symbol or time is reported, not defaulted."""
+    entry = {"ev": "Q", "sym": "O:QQQ241218C00400000", "k": 400, "t": 1734534000000}
+    del entry[missing]
+    frame = json.dumps([{"ev": "status", "status": "connected"}, entry])
+    provider, callbacks = _provider(options=_FakeSocket(frame))
+
+    await provider._consume_options()
+
+    callbacks.on_error.assert_awaited_once()
+    assert provider._option_queue.empty()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("missing", ["sym", "s"])
+async def test_consume_equity_rejects_aggregates_missing_fields(missing):
+    """Test an XA entry without its symbol or start time is reported."""
+    entry = {"ev": "XA", "sym": "QQQ", "c": 401.5, "s": 1734534000000}
+    del entry[missing]
+    provider, callbacks = _provider(equity=_FakeSocket(json.dumps([entry])))
+
+    await provider._consume_equity()
+
+    callbacks.on_error.assert_awaited_once()
+    assert provider._equity_queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest_event():
+    """Test parsing never blocks on a slow consumer."""
+    frame = json.dumps(
+        [
+            {"ev": "XA", "sym": "QQQ", "c": price, "vw": 400, "s": 1734534000000}
+            for price in (401.0, 402.0, 403.0)
+        ]
+    )
+    provider, _ = _provider(equity=_FakeSocket(frame))
+    provider._equity_queue = asyncio.Queue(maxsize=2)
+
+    await provider._consume_equity()
+
+    prices = [provider._equity_queue.get_nowait().price for _ in range(2)]
+    assert prices == [402.0, 403.0]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_reports_callback_errors_and_continues():
+    """Test a failing callback is reported without stopping delivery."""
+    provider, callbacks = _provider()
+    delivered = []
+
+    async def on_item(item):
+        if item == "bad":
+            raise RuntimeError("boom")
+        delivered.append(item)
+
+    queue = asyncio.Queue()
+    for item in ("bad", "good"):
+        queue.put_nowait(item)
+    task = asyncio.create_task(provider._dispatch(queue, on_item))
+    await asyncio.sleep(0)
+    task.cancel()
+
+    assert delivered == ["good"]
+    callbacks.on_error.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_connect_streams_disables_compression():
+    """Test both sockets are opened without per-message deflate."""
+    provider = PolygonMarketDataProvider()
+    socket = AsyncMock()
+
+    with patch(
+        "src.alphagen.polygon_stream.websockets.connect",
+        new_callable=AsyncMock,
+        return_value=socket,
+    ) as connect:
+        await provider._connect_streams()
+
+    assert connect.await_count == 2
+    for connect_call in connect.await_args_list:
+        assert connect_call.kwargs["compression"] is None
+        assert connect_call.kwargs["max_size"] == 2**18
+        assert connect_call.kwargs["ping_interval"] == 10
+
+
+@pytest.mark.asyncio
+async def test_connect_streams_sends_auth_and_subscribe_as_text():
+    """Test control messages go out as JSON text frames."""
+    provider = PolygonMarketDataProvider(ticker="QQQ")
+    socket = AsyncMock()
+
+    with patch(
+        "src.alphagen.polygon_stream.websockets.connect",
+        new_callable=AsyncMock,
+        return_value=socket,
+    ):
+        await provider._connect_streams()
+
+    sent = [sent_call.args[0] for sent_call in socket.send.await_args_list]
+    assert all(isinstance(frame, str) for frame in sent)
+    assert [json.loads(frame)["params"] for frame in sent[1::2]] == ["XA.QQQ", "Q.QQQ"]
+    assert json.loads(sent[0])["action"] == "auth"
@@ -0,0 +1,173 @@
+"""Unit tests for the position calculator."""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.alphagen.core.events import PositionSnapshot, TradeExecution, TradeIntent
+from src.alphagen.core.time_utils import now_est
+from src.alphagen.etl.position import PositionCalculator
+
+SYMBOL = "QQQ241220C00400000"
+
+
+def _execution(action: str, symbol: str = SYMBOL, quantity: int = 2) -> TradeExecution:
+    as_of = now_est()
+    intent = TradeIntent(
+        as_of=as_of,
+        action=action,
+        option_symbol=symbol,
+        quantity=quantity,
+        limit_price=1.50,
+        stop_loss=4.50,
+        take_profit=0.75,
+    )
+    return TradeExecution(
+        order_id="order-1",
+        status="submitted",
+        fill_price=1.50,
+        pnl_contrib=0.0,
+        as_of=as_of,
+        intent=intent,
+    )
+
+
+async def _register(calculator: PositionCalculator, *executions) -> None:
+    for execution in executions:
+        await calculator.register_execution(execution)
+    # Let the coalesced emit run.
+    await asyncio.sleep(0)
+
+
+def _snapshot(symbol: str = SYMBOL, market_value: float = -300.0) -> PositionSnapshot:
+    return PositionSnapshot(symbol, -2, 1.50, market_value, now_est())
+
+
+@pytest.mark.asyncio
+async def test_sell_execution_synthesizes_short_position():
+    """Test an opening sell without a broker snapshot becomes a short position."""
+    emit = AsyncMock()
+    calculator = PositionCalculator(emit=emit)
+
+    await _register(calculator, _execution("SELL_TO_OPEN"))
+
+    state = emit.call_args[0][0]
+    position = state.symbols[SYMBOL]
+    assert position.quantity == -2
+    assert position.average_price == 1.50
+    assert position.market_value == -3.0
+
+
+@pytest.mark.asyncio
+async def test_buy_execution_closes_synthesized_position():
+    """Test a closing buy removes the synthesized position."""
+    emit = AsyncMock()
+    calculator = PositionCalculator(emit=emit)
+
+    await _register(calculator, _execution("SELL_TO_OPEN"))
+    await _register(calculator, _execution("BUY_TO_CLOSE"))
+
+    assert emit.call_args[0][0].symbols == {}
+
+
+@pytest.mark.asyncio
+async def test_broker_snapshot_takes_precedence():
+    """Test broker snapshots override synthesized positions."""
+    emit = AsyncMock()
+    calculator = PositionCalculator(emit=emit)
+    snapshot = _snapshot()
+
+    await _register(calculator, _execution("SELL_TO_OPEN"))
+    await calculator.update_from_broker([snapshot])
+    assert emit.call_args[0][0].symbols[SYMBOL] is snapshot
+
+    await _register(calculator, _execution("BUY_TO_CLOSE"))
+    assert emit.call_args[0][0].symbols[SYMBOL] is snapshot
+
+
+@pytest.mark.asyncio
+async def test_emitted_states_are_independent():
+    """Test later updates do not mutate previously emitted states."""
+    emit = AsyncMock()
+    calculator = PositionCalculator(emit=emit)
+
+    await calculator.update_from_broker([_snapshot("AAA")])
+    first_state = emit.call_args[0][0]
+    await calculator.update_from_broker([_snapshot("BBB")])
+
+    assert set(first_state.symbols) == {"AAA"}
+    assert set(emit.call_args[0][0].symbols) == {"AAA", "BBB"}
+
+
+@pytest.mark.asyncio
+async def test_running_market_value_matches_positions():
+    """Test the stamped market value total tracks replacements and removals."""
+    emit = AsyncMock()
+    calculator = PositionCalculator(emit=emit)
+
+    await calculator.update_from_broker(
+        [_snapshot("AAA", -100.0), _snapshot("BBB", -50.0)]
+    )
+    await calculator.update_from_broker([_snapshot("AAA", -80.0)])
+    await _register(calculator, _execution("SELL_TO_OPEN"))
+    state = emit.call_args[0][0]
+    assert state.market_value_sum == pytest.approx(-133.0)
+    assert state.total_market_value() == pytest.approx(
+        sum(pos.market_value for pos in state.symbols.values())
+    )
+
+    await _register(calculator, _execution("BUY_TO_CLOSE"))
+    assert emit.call_args[0][0].total_market_value() == pytest.approx(-130.0)
+
+
+@pytest.mark.asyncio
+async def test_execution_burst_emits_once():
+    """Test executions registered in one loop pass share a single emit."""
+    emit = AsyncMock()
+    calculator = PositionCalculator(emit=emit)
+
+    await _register(
+        calculator,
+        _execution("SELL_TO_OPEN", symbol="AAA"),
+        _execution("SELL_TO_OPEN", symbol="BBB"),
+        _execution("SELL_TO_OPEN", symbol="CCC"),
+    )
+
+    emit.assert_awaited_once()
+    assert set(emit.call_args[0][0].symbols) == {"AAA", "BBB", "CCC"}
+
+
+@pytest.mark.asyncio
+async def test_execution_during_emit_gets_another_emit():
+    """Test an execution registered mid-emit is included in a follow-up emit."""
+    release = asyncio.Event()
+    states = []
+
+    async def slow_emit(state):
+        states.append(state)
+        await release.wait()
+
+    calculator = PositionCalculator(emit=slow_emit)
+    await _register(calculator, _execution("SELL_TO_OPEN", symbol="AAA"))
+    await calculator.register_execution(_execution("SELL_TO_OPEN", symbol="BBB"))
+    release.set()
+    await calculator.flush()
+
+    assert [set(state.symbols) for state in states] == [{"AAA"}, {"AAA", "BBB"}]
+    assert calculator._flush_task is None
+
+
+@pytest.mark.asyncio
+async def test_emit_failure_is_logged_and_flush_returns():
+    """Test a failing coalesced emit is logged rather than left unobserved."""
+    calculator = PositionCalculator(emit=AsyncMock(side_effect=RuntimeError("down")))
+    calculator._logger = MagicMock()
+
+    await calculator.register_execution(_execution("SELL_TO_OPEN"))
+    await calculator.flush()
+    await asyncio.sleep(0)
+
+    calculator._logger.error.assert_called_once_with(
+        "position_emit_failed", error="down"
+    )
@@ -39,3 +39,30 @@ class TestReportsComprehensive:
             assert "trade_date" in item
             assert "realized_pnl" in item
             assert "trade_count" in item
+
+    @pytest.mark.asyncio
+    async def test_fetch_daily_pnl_for_date_uses_filtered_statement(self):
+        """Test a trade date selects the prepared filtered statement."""
+        from datetime import date
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from src.alphagen import reports
+
+        result = MagicMock()
+        result.mappings.return_value = [
+            {"trade_date": "2024-01-16", "realized_pnl": 1.5, "trade_count": 2}
+        ]
+        conn = AsyncMock()
+        conn.execute.return_value = result
+        engine = MagicMock()
+        engine.connect.return_value.__aenter__.return_value = conn
+
+        with patch.object(reports, "get_engine", return_value=engine):
+            rows = await reports.fetch_daily_pnl(date(2024, 1, 16))
+
+        conn.execute.assert_awaited_once_with(
+            reports._DAILY_PNL_ONE, {"start": "2024-01-16", "end": "2024-01-17"}
+        )
+        assert rows == [
+            {"trade_date": "2024-01-16", "realized_pnl": 1.5, "trade_count": 2}
+        ]
@@ -0,0 +1,350 @@
+"""Unit tests for the Schwab REST client wrapper."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.alphagen.schwab_client import SchwabClient
+
+
+def _client(handler) -> SchwabClient:
+    transport = httpx.MockTransport(handler)
+    return SchwabClient(
+        httpx.AsyncClient(base_url="https://api.test", transport=transport), "acct"
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_option_quotes_uses_one_request():
+    """Test several option symbols are quoted with a single call."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "AAA": {"bidPrice": 1.0, "askPrice": 1.2, "strikePrice": 400},
+                "BBB": {"bidPrice": 2.0, "askPrice": 2.4, "strikePrice": 405},
+            },
+        )
+
+    client = _client(handler)
+    quotes = await client.fetch_option_quotes(["AAA", "BBB", "CCC"])
+    await client.close()
+
+    assert len(requests) == 1
+    assert requests[0].url.params["symbols"] == "AAA,BBB,CCC"
+    assert [(q.option_symbol, q.strike, q.ask) for q in quotes] == [
+        ("AAA", 400.0, 1.2),
+        ("BBB", 405.0, 2.4),
+    ]
+    # Quotes without a timestamp share the batch's single fallback time.
+    assert quotes[0].as_of is quotes[1].as_of
+
+
+@pytest.mark.asyncio
+async def test_fetch_option_quotes_without_symbols():
+    """Test an empty symbol list does not hit the API."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("unexpected request")
+
+    client = _client(handler)
+    assert await client.fetch_option_quotes([]) == []
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_close_positions_submits_orders_concurrently(monkeypatch):
+    """Test closing orders overlap, capped by MAX_CONCURRENT_ORDERS, in order."""
+    from src.alphagen import schwab_client
+
+    monkeypatch.setattr(schwab_client, "MAX_CONCURRENT_ORDERS", 2)
+    in_flight = 0
+    peak = 0
+
+    async def submit_order(intent):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return intent
+
+    client = _client(lambda request: httpx.Response(200))
+    monkeypatch.setattr(client, "submit_order", submit_order)
+
+    executions = await client.close_positions(["A", "B", "C", "D"])
+    await client.close()
+
+    assert executions == ["A", "B", "C", "D"]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_close_positions_reports_failed_orders(monkeypatch):
+    """Test a rejected closing order is returned as failed beside the fills."""
+    from src.alphagen.core.events import TradeIntent
+    from src.alphagen.core.time_utils import now_est
+
+    intents = [
+        TradeIntent(now_est(), "BUY_TO_CLOSE", symbol, 2, 1.5, 0, 0)
+        for symbol in ("AAA", "BBB")
+    ]
+
+    async def submit_order(intent):
+        if intent.option_symbol == "AAA":
+            raise httpx.HTTPError("rejected")
+        return intent
+
+    client = _client(lambda request: httpx.Response(200))
+    monkeypatch.setattr(client, "submit_order", submit_order)
+
+    executions = await client.close_positions(intents)
+    await client.close()
+
+    assert executions[0].status == "failed"
+    assert executions[0].intent is intents[0]
+    assert executions[1] is intents[1]
+
+
+@pytest.mark.asyncio
+async def test_fetch_option_quote_served_from_cache_within_ttl(monkeypatch):
+    """Test repeat lookups inside the TTL reuse the quote without a request."""
+    from src.alphagen import schwab_client
+
+    requests = []
+    now = [100.0]
+    monkeypatch.setattr(schwab_client, "monotonic", lambda: now[0])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200, json={"quotes": {"AAA": {"bidPrice": 1.0, "askPrice": 1.2}}}
+        )
+
+    client = _client(handler)
+    first = await client.fetch_option_quote("AAA")
+    assert await client.fetch_option_quote("AAA") is first
+    assert len(requests) == 1
+
+    now[0] += 1.0
+    assert await client.fetch_option_quote("AAA") is not first
+    assert len(requests) == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_fetch_option_quote_reads_top_level_or_nested_payload():
+    """Test a quote is found keyed by symbol with or without a quotes wrapper."""
+    payloads = iter(
+        [
+            {"AAA": {"bidPrice": 1.0, "askPrice": 1.2}},
+            {"quotes": {"BBB": {"bidPrice": 2.0, "askPrice": 2.4}}},
+            {"quotes": []},
+        ]
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=next(payloads))
+
+    client = _client(handler)
+    assert (await client.fetch_option_quote("AAA")).ask == 1.2
+    assert (await client.fetch_option_quote("BBB")).ask == 2.4
+    assert await client.fetch_option_quote("CCC") is None
+    await client.close()
+
+
+def test_quote_cache_evicts_least_recently_used():
+    """Test the cache drops the stalest symbol once it is full."""
+    from src.alphagen.schwab_client import QuoteCache
+
+    cache = QuoteCache(ttl=60, max_size=2)
+    cache.put("AAA", "a")
+    cache.put("BBB", "b")
+    cache.get("AAA")
+    cache.put("CCC", "c")
+
+    assert cache.get("BBB") is None
+    assert (cache.get("AAA"), cache.get("CCC")) == ("a", "c")
+
+
+@pytest.mark.asyncio
+async def test_create_uses_pooled_transport_with_connect_retries(monkeypatch):
+    """Test the REST client shares a bounded keep-alive pool and retries connects."""
+    from src.alphagen import schwab_client
+
+    transports = []
+    real_transport = httpx.AsyncHTTPTransport
+
+    def transport(**kwargs):
+        transports.append(kwargs)
+        return real_transport(**kwargs)
+
+    monkeypatch.setattr(schwab_client.httpx, "AsyncHTTPTransport", transport)
+    client = SchwabClient.create()
+    await client.close()
+
+    assert transports == [
+        {
+            "http2": schwab_client.HTTP2_AVAILABLE,
+            "limits": schwab_client.HTTP_LIMITS,
+            "retries": 2,
+        }
+    ]
+    assert client._client.timeout.connect == 3
+
+
+@pytest.mark.asyncio
+async def test_create_shares_http_client_until_last_close():
+    """Test clients for the same endpoint share one pool, closed by the last."""
+    first = SchwabClient.create()
+    second = SchwabClient.create()
+    assert second._client is first._client
+
+    await first.close()
+    assert not second._client.is_closed
+
+    await second.close()
+    assert second._client.is_closed
+    third = SchwabClient.create()
+    assert third._client is not first._client
+    await third.close()
+
+
+@pytest.mark.asyncio
+async def test_close_twice_releases_shared_pool_once():
+    """Test a repeated close does not drop another instance's pool reference."""
+    first = SchwabClient.create()
+    second = SchwabClient.create()
+
+    await first.close()
+    await first.close()
+    assert first._pool_key is None
+    assert not second._client.is_closed
+
+    await second.close()
+    assert second._client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_submit_order_round_trips_json():
+    """Test the order body is JSON-encoded and the order id decoded."""
+    import json
+
+    from src.alphagen.core.events import TradeIntent
+    from src.alphagen.core.time_utils import now_est
+
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(201, json={"orderId": "abc"})
+
+    client = _client(handler)
+    intent = TradeIntent(now_est(), "SELL_TO_OPEN", "AAA", 2, 1.5, 4.5, 0.75)
+    execution = await client.submit_order(intent)
+    await client.close()
+
+    assert bodies[0]["symbol"] == "AAA"
+    assert bodies[0]["quantity"] == 2
+    assert execution.order_id == "abc"
+
+
+@pytest.mark.asyncio
+async def test_fetch_positions_shares_parsed_snapshot_time():
+    """Test positions with the same asOf string reuse one parsed timestamp."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        entry = {"quantity": -2, "averagePrice": 1.5, "marketValue": -300.0}
+        return httpx.Response(
+            200,
+            json={
+                "positions": [
+                    {**entry, "symbol": "AAA", "asOf": "2024-01-16T15:00:00+00:00"},
+                    {**entry, "symbol": "BBB", "asOf": "2024-01-16T15:00:00+00:00"},
+                    {**entry, "symbol": "CCC", "asOf": "2024-01-16T15:01:00+00:00"},
+                ]
+            },
+        )
+
+    client = _client(handler)
+    first, second, third = await client.fetch_positions()
+    await client.close()
+
+    assert first.as_of is second.as_of
+    assert first.as_of.isoformat() == "2024-01-16T10:00:00-05:00"
+    assert third.as_of.minute == 1
+
+
+@pytest.mark.asyncio
+async def test_response_reader_yields_body_chunks():
+    """Test the streamed body is handed out chunk by chunk, then b''."""
+    from src.alphagen.schwab_client import _ResponseReader
+
+    async def body():
+        yield b'{"positions": '
+        yield b"[]}"
+
+    reader = _ResponseReader(httpx.Response(200, content=body()))
+
+    assert [await reader.read(65536) for _ in range(3)] == [
+        b'{"positions": ',
+        b"[]}",
+        b"",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fetch_positions_streams_body_with_ijson():
+    """Test positions parsed incrementally match the buffered parse."""
+    pytest.importorskip("ijson")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        entry = {"quantity": -2, "averagePrice": 1.5, "marketValue": -300.0}
+        return httpx.Response(
+            200,
+            json={
+                "positions": [
+                    {**entry, "symbol": "AAA", "asOf": "2024-01-16T15:00:00+00:00"}
+                ]
+            },
+        )
+
+    client = _client(handler)
+    (position,) = await client.fetch_positions()
+    await client.close()
+
+    assert (position.symbol, position.quantity, position.average_price) == (
+        "AAA",
+        -2,
+        1.5,
+    )
+
+
+def test_positions_disk_cache_disabled_without_ttl(tmp_path):
+    """Test a zero TTL never touches disk, whatever is installed."""
+    from src.alphagen.schwab_client import PositionsDiskCache
+
+    cache = PositionsDiskCache(str(tmp_path / "positions"), ttl=0)
+    cache.put("acct", [])
+
+    assert cache.get("acct") is None
+    assert not (tmp_path / "positions").exists()
+
+
+def test_positions_disk_cache_round_trips_snapshots(tmp_path):
+    """Test cached positions come back equal, per account."""
+    pytest.importorskip("diskcache")
+    from src.alphagen.core.time_utils import now_est
+    from src.alphagen.schwab_client import PositionSnapshot, PositionsDiskCache
+
+    snapshots = [PositionSnapshot("QQQ", -2, 1.5, -300.0, now_est())]
+    cache = PositionsDiskCache(str(tmp_path), ttl=60)
+    cache.put("acct", snapshots)
+
+    assert cache.get("acct") == snapshots
+    assert cache.get("other") is None
+    cache.close()
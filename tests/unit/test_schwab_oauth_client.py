@@ -0,0 +1,142 @@
+"""Unit tests for the Schwab OAuth client wrapper."""
+
+import threading
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.alphagen import schwab_oauth_client
+from src.alphagen.schwab_oauth_client import SchwabOAuthClient
+
+
+@pytest.mark.asyncio
+async def test_blocking_api_calls_run_off_the_event_loop_thread():
+    """Test synchronous schwab-api calls are dispatched to the worker pool."""
+    loop_thread = threading.get_ident()
+    call_threads = []
+
+    def get_account(account_id):
+        call_threads.append(threading.get_ident())
+        return {
+            "securitiesAccount": {
+                "positions": [
+                    {
+                        "instrument": {"symbol": "QQQ"},
+                        "longQuantity": 3,
+                        "shortQuantity": 0,
+                        "marketValue": 1200.0,
+                        "averagePrice": 400.0,
+                    }
+                ]
+            }
+        }
+
+    api = MagicMock()
+    api.get_account.side_effect = get_account
+    client = SchwabOAuthClient(api, "12345")
+
+    positions = await client.fetch_positions()
+
+    api.get_account.assert_called_once_with("12345")
+    assert call_threads and call_threads[0] != loop_thread
+    assert [(p.symbol, p.quantity, p.market_value) for p in positions] == [
+        ("QQQ", 3, 1200.0)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_token_refresh_runs_on_worker_pool():
+    """Test token refresh failures are still reported after dispatch."""
+    api = MagicMock()
+    api.ensure_valid_access_token.side_effect = RuntimeError("refresh failed")
+    client = SchwabOAuthClient(api, "12345")
+
+    assert await client._refresh_token_if_needed() is False
+    api.ensure_valid_access_token.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_shared_client_is_reference_counted(monkeypatch):
+    """Test shared() hands out one client that closes on the last release."""
+    monkeypatch.setattr(schwab_oauth_client, "_shared_client", None)
+    monkeypatch.setattr(schwab_oauth_client, "_shared_refs", 0)
+    created = SchwabOAuthClient(MagicMock(), "12345")
+
+    with (
+        patch.object(SchwabOAuthClient, "create", return_value=created) as create,
+        patch.object(SchwabOAuthClient, "close", new_callable=AsyncMock) as close,
+    ):
+        first = SchwabOAuthClient.shared()
+        second = SchwabOAuthClient.shared()
+        assert first is second is created
+        create.assert_called_once_with()
+
+        await first.release()
+        close.assert_not_awaited()
+        await second.release()
+        close.assert_awaited_once()
+
+        assert SchwabOAuthClient.shared() is created
+        assert create.call_count == 2
+
+
+def test_shared_client_not_cached_when_unconfigured(monkeypatch):
+    """Test a missing configuration is retried on the next shared() call."""
+    monkeypatch.setattr(schwab_oauth_client, "_shared_client", None)
+    monkeypatch.setattr(schwab_oauth_client, "_shared_refs", 0)
+
+    with patch.object(SchwabOAuthClient, "create", return_value=None) as create:
+        assert SchwabOAuthClient.shared() is None
+        assert SchwabOAuthClient.shared() is None
+
+    assert create.call_count == 2
+    assert schwab_oauth_client._shared_refs == 0
+
+
+@pytest.mark.asyncio
+async def test_fetch_option_quotes_bounds_fan_out(monkeypatch):
+    """Test quote fan-out overlaps requests but leaves API workers free."""
+    import asyncio
+
+    client = SchwabOAuthClient(MagicMock(), "12345")
+    in_flight = peak = 0
+
+    async def fetch_option_quote(symbol):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return None if symbol == "BAD" else symbol
+
+    monkeypatch.setattr(client, "fetch_option_quote", fetch_option_quote)
+    symbols = ["A", "B", "BAD", "C", "D", "E"]
+
+    assert await client.fetch_option_quotes(symbols) == ["A", "B", "C", "D", "E"]
+    assert peak == schwab_oauth_client.MAX_CONCURRENT_QUOTES
+
+
+@pytest.mark.asyncio
+async def test_oauth_setup_uses_schwab_py_login_flow(monkeypatch):
+    """Test the login flow is schwab-py's and runs with the configured settings."""
+    from schwab import auth
+
+    assert schwab_oauth_client.client_from_login_flow is auth.client_from_login_flow
+
+    config = MagicMock()
+    config.schwab.api_key = "key"
+    config.schwab.api_secret = "secret"
+    config.schwab.callback_url = "https://127.0.0.1:8182"
+    config.schwab.token_path = "config/schwab_token.json"
+    login = MagicMock()
+    monkeypatch.setattr(schwab_oauth_client, "CONFIG", config)
+    monkeypatch.setattr(schwab_oauth_client, "client_from_login_flow", login)
+
+    assert await schwab_oauth_client.run_oauth_setup() is True
+    login.assert_called_once_with(
+        api_key="key",
+        app_secret="secret",
+        callback_url="https://127.0.0.1:8182",
+        token_path="config/schwab_token.json",
+        interactive=False,
+    )
@@ -0,0 +1,131 @@
+"""Unit tests for the Schwab polling market data provider."""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.alphagen.config import load_app_config
+from src.alphagen.market_data.schwab_stream import (
+    MAX_ERROR_BACKOFF_SECONDS,
+    POLL_INTERVAL_SECONDS,
+    InvalidTokenError,
+    SchwabMarketDataProvider,
+)
+
+
+def _provider(allow_mock_fallback: bool = False) -> SchwabMarketDataProvider:
+    provider = SchwabMarketDataProvider.__new__(SchwabMarketDataProvider)
+    provider._logger = MagicMock()
+    provider._client = AsyncMock()
+    provider._client.fetch_equity_quote.side_effect = RuntimeError("offline")
+    provider._callbacks = MagicMock()
+    provider._callbacks.on_equity_tick = AsyncMock()
+    provider._callbacks.on_option_quote = AsyncMock()
+    config = load_app_config().model_copy(deep=True)
+    config.features.allow_mock_fallback = allow_mock_fallback
+    provider._config = config
+    return provider
+
+
+async def _poll(provider: SchwabMarketDataProvider, cycles: int) -> list[float]:
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+        if len(delays) >= cycles:
+            raise asyncio.CancelledError
+
+    with (
+        patch("src.alphagen.market_data.schwab_stream.asyncio.sleep", fake_sleep),
+        pytest.raises(asyncio.CancelledError),
+    ):
+        await provider._poll_market_data()
+    return delays
+
+
+@pytest.mark.asyncio
+async def test_poll_errors_back_off_without_mock_data():
+    """Test failed polls back off exponentially and emit nothing by default."""
+    provider = _provider()
+
+    delays = await _poll(provider, 4)
+
+    assert delays == [
+        POLL_INTERVAL_SECONDS * 2,
+        POLL_INTERVAL_SECONDS * 4,
+        MAX_ERROR_BACKOFF_SECONDS,
+        MAX_ERROR_BACKOFF_SECONDS,
+    ]
+    provider._callbacks.on_equity_tick.assert_not_called()
+    provider._callbacks.on_option_quote.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_poll_errors_emit_mock_data_when_enabled():
+    """Test the mock fallback only runs when explicitly enabled."""
+    provider = _provider(allow_mock_fallback=True)
+
+    await _poll(provider, 1)
+
+    provider._callbacks.on_equity_tick.assert_awaited_once()
+    provider._callbacks.on_option_quote.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_successful_poll_resets_backoff():
+    """Test a successful fetch returns to the regular poll interval."""
+    provider = _provider()
+    provider._client.fetch_equity_quote.side_effect = [
+        RuntimeError("offline"),
+        None,
+        RuntimeError("offline"),
+    ]
+
+    delays = await _poll(provider, 3)
+
+    assert delays == [
+        POLL_INTERVAL_SECONDS * 2,
+        POLL_INTERVAL_SECONDS,
+        POLL_INTERVAL_SECONDS * 2,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_token_error_is_reported_and_polling_resumes():
+    """Test an invalid token reaches on_error without ending the poll loop."""
+    provider = _provider()
+    provider._callbacks.on_error = AsyncMock()
+    provider._client.fetch_equity_quote.side_effect = [
+        InvalidTokenError("expired"),
+        InvalidTokenError("expired"),
+        None,
+        RuntimeError("offline"),
+    ]
+
+    delays = await _poll(provider, 4)
+
+    assert delays == [
+        MAX_ERROR_BACKOFF_SECONDS,
+        MAX_ERROR_BACKOFF_SECONDS,
+        POLL_INTERVAL_SECONDS,
+        POLL_INTERVAL_SECONDS * 2,
+    ]
+    errors = [c.args[0] for c in provider._callbacks.on_error.call_args_list]
+    assert len(errors) == 2
+    assert all(isinstance(error, InvalidTokenError) for error in errors)
+    provider._callbacks.on_equity_tick.assert_not_called()
+
+
+def test_factory_passes_config_to_provider():
+    """Test the factory hands its config to the provider instead of reloading."""
+    from src.alphagen.market_data.factory import create_market_data_provider
+
+    config = load_app_config().model_copy()
+    with patch(
+        "src.alphagen.market_data.factory.SchwabMarketDataProvider"
+    ) as provider_cls:
+        provider = create_market_data_provider(config)
+
+    provider_cls.assert_called_once_with(config)
+    assert provider is provider_cls.return_value
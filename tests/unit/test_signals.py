@@ -176,6 +176,7 @@ def test_cooldown_state_management():
     # Test expired cooldown
     expired = CooldownState.expired()
     assert not expired.active(now_est())
+    assert CooldownState.expired().until is expired.until
 
     # Test active cooldown
     future_time = now_est() + timedelta(seconds=30)
@@ -185,3 +186,53 @@ def test_cooldown_state_management():
     # Test extending cooldown
     extended = active.extend(timedelta(seconds=60))
     assert extended.until > active.until
+
+
+@pytest.mark.asyncio
+async def test_handle_batch_matches_per_tick_signals():
+    """Test batch replay emits exactly what per-tick handling would."""
+    import random
+
+    from src.alphagen.signals import tick_batch
+
+    rng = random.Random(7)
+    start = now_est()
+    ticks = []
+    for i in range(500):
+        as_of = start + timedelta(seconds=20 * i)
+        vwap = 400.0 + rng.choice([-1.0, 0.0, 1.0]) * rng.random()
+        option = (
+            OptionQuote(f"OPT{i % 3}", 400.0, 1.0 + i * 0.01, 1.2, as_of, as_of)
+            if i % 17
+            else None
+        )
+        ticks.append(
+            NormalizedTick(
+                as_of=as_of,
+                equity=EquityTick("QQQ", 400.0, vwap, 400.0, as_of),
+                option=option,
+            )
+        )
+
+    per_tick, batched = AsyncMock(), AsyncMock()
+    engine = SignalEngine(emit=per_tick, cooldown=timedelta(minutes=2))
+    for tick in ticks:
+        await engine.handle_tick(tick)
+    batch_engine = SignalEngine(emit=batched, cooldown=timedelta(minutes=2))
+    await batch_engine.handle_batch(tick_batch(ticks[:250]))
+    await batch_engine.handle_batch(tick_batch(ticks[250:]))
+
+    expected = [c.args[0] for c in per_tick.await_args_list]
+    actual = [c.args[0] for c in batched.await_args_list]
+    assert len(expected) > 5
+    assert [
+        (s.as_of, s.action, s.option_symbol, s.rationale, s.cooldown_until)
+        for s in actual
+    ] == [
+        (s.as_of, s.action, s.option_symbol, s.rationale, s.cooldown_until)
+        for s in expected
+    ]
+    assert [s.reference_price for s in actual] == pytest.approx(
+        [s.reference_price for s in expected]
+    )
+    assert batch_engine._last_diff == engine._last_diff
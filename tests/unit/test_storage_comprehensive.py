@@ -1,14 +1,38 @@
 """Comprehensive tests for storage module."""
 
+import asyncio
+
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime
 
-from src.alphagen.storage import session_scope, insert_positions
+from src.alphagen.storage import (
+    BulkWriter,
+    EquityTickRow,
+    PositionSnapshotRow,
+    get_session_factory,
+    init_models,
+    session_scope,
+    insert_positions,
+    start_bulk_writer,
+    stop_bulk_writer,
+    RETRY_BACKOFF,
+    WRITE_ATTEMPTS,
+)
 from src.alphagen.core.events import PositionSnapshot
 from src.alphagen.config import EST
 
 
+def _tick_rows(count: int) -> list[EquityTickRow]:
+    as_of = datetime(2024, 1, 15, 10, 0, 0, tzinfo=EST)
+    return [
+        EquityTickRow(
+            symbol="QQQ", price=float(n), session_vwap=1.0, ma9=1.0, as_of=as_of
+        )
+        for n in range(count)
+    ]
+
+
 class TestStorageComprehensive:
     """Comprehensive tests for storage functions."""
 
@@ -23,7 +47,8 @@ class TestStorageComprehensive:
     @pytest.mark.asyncio
     async def test_session_scope_success(self):
         """Test session_scope commits on success."""
-        with patch("src.alphagen.storage.AsyncSession") as mock_session_class:
+        with patch("src.alphagen.storage.get_session_factory") as mock_get_factory:
+            mock_session_class = mock_get_factory.return_value
             mock_session = AsyncMock()
             mock_session_class.return_value = mock_session
 
@@ -35,10 +60,18 @@ class TestStorageComprehensive:
             mock_session.commit.assert_called_once()
             mock_session.close.assert_called_once()
 
+    def test_session_factory_is_reused(self):
+        """Test sessions come from one factory that keeps rows loaded on commit."""
+        factory = get_session_factory()
+
+        assert get_session_factory() is factory
+        assert factory.kw["expire_on_commit"] is False
+
     @pytest.mark.asyncio
     async def test_session_scope_rollback_on_exception(self):
         """Test session_scope rolls back on exception."""
-        with patch("src.alphagen.storage.AsyncSession") as mock_session_class:
+        with patch("src.alphagen.storage.get_session_factory") as mock_get_factory:
+            mock_session_class = mock_get_factory.return_value
             mock_session = AsyncMock()
             mock_session_class.return_value = mock_session
 
@@ -87,3 +120,228 @@ class TestStorageComprehensive:
 
             mock_session_scope.assert_called_once()
             assert mock_session.add.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_writer_commits_burst_in_one_session(self):
+        """Test rows queued within the flush interval share one commit."""
+        writer = BulkWriter(max_batch=200, flush_interval=0.01)
+        with patch("src.alphagen.storage.session_scope") as mock_session_scope:
+            mock_session = AsyncMock()
+            mock_session_scope.return_value.__aenter__.return_value = mock_session
+
+            writer.start()
+            writer.enqueue(*_tick_rows(5))
+            await asyncio.sleep(0.05)
+            await writer.stop()
+
+            mock_session_scope.assert_called_once()
+            mock_session.exec.assert_awaited_once()
+            values = mock_session.exec.call_args.kwargs["params"]
+            assert [value["price"] for value in values] == [0.0, 1.0, 2.0, 3.0, 4.0]
+            assert "id" not in values[0]
+
+    @pytest.mark.asyncio
+    async def test_bulk_writer_caps_batch_size(self):
+        """Test a full batch is written without waiting and stop flushes the rest."""
+        writer = BulkWriter(max_batch=3, flush_interval=60)
+        with patch("src.alphagen.storage.session_scope") as mock_session_scope:
+            mock_session = AsyncMock()
+            mock_session_scope.return_value.__aenter__.return_value = mock_session
+
+            writer.start()
+            writer.enqueue(*_tick_rows(5))
+            await asyncio.sleep(0)
+            await writer.stop()
+
+            batches = [
+                [value["price"] for value in c.kwargs["params"]]
+                for c in mock_session.exec.call_args_list
+            ]
+            assert batches == [[0.0, 1.0, 2.0], [3.0, 4.0]]
+
+    @pytest.mark.asyncio
+    async def test_bulk_writer_stop_finishes_batch_in_flight(self):
+        """Test stopping mid-write waits for the batch instead of dropping it."""
+        writer = BulkWriter(max_batch=2, flush_interval=60)
+        started = asyncio.Event()
+        release = asyncio.Event()
+        written = []
+
+        async def exec_(statement, params):
+            started.set()
+            await release.wait()
+            written.extend(value["price"] for value in params)
+
+        with patch("src.alphagen.storage.session_scope") as mock_session_scope:
+            mock_session = AsyncMock()
+            mock_session.exec.side_effect = exec_
+            mock_session_scope.return_value.__aenter__.return_value = mock_session
+
+            writer.start()
+            writer.enqueue(*_tick_rows(3))
+            await started.wait()
+            stop = asyncio.create_task(writer.stop())
+            await asyncio.sleep(0)
+            assert not stop.done()
+            release.set()
+            await stop
+
+        assert written == [0.0, 1.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_bulk_writer_retries_failed_batch_with_backoff(self):
+        """Test a failed batch is retried after a growing pause, before newer rows."""
+        writer = BulkWriter(max_batch=2, flush_interval=0)
+        delays = []
+        real_sleep = asyncio.sleep
+
+        async def sleep(delay):
+            delays.append(delay)
+            await real_sleep(0)
+
+        with (
+            patch("src.alphagen.storage.session_scope") as mock_session_scope,
+            patch("src.alphagen.storage.asyncio.sleep", sleep),
+        ):
+            mock_session = AsyncMock()
+            mock_session.exec.side_effect = [
+                RuntimeError("locked"),
+                RuntimeError("locked"),
+                None,
+                None,
+            ]
+            mock_session_scope.return_value.__aenter__.return_value = mock_session
+
+            writer.enqueue(*_tick_rows(3))
+            await writer.stop()
+
+            batches = [
+                [value["price"] for value in c.kwargs["params"]]
+                for c in mock_session.exec.call_args_list
+            ]
+        assert batches == [[0.0, 1.0], [0.0, 1.0], [0.0, 1.0], [2.0]]
+        assert delays == [RETRY_BACKOFF, RETRY_BACKOFF * 2]
+
+    @pytest.mark.asyncio
+    async def test_bulk_writer_drops_batch_after_repeated_failures(self):
+        """Test a batch that keeps failing is dropped so later rows still land."""
+        writer = BulkWriter(max_batch=5, flush_interval=0)
+        bad_rows = _tick_rows(5)
+        written = []
+
+        async def exec_(statement, params):
+            if params[0]["price"] == bad_rows[0].price:
+                raise RuntimeError("constraint failed")
+            written.append(len(params))
+
+        with (
+            patch("src.alphagen.storage.session_scope") as mock_session_scope,
+            patch("src.alphagen.storage.RETRY_BACKOFF", 0),
+        ):
+            mock_session = AsyncMock()
+            mock_session.exec.side_effect = exec_
+            mock_session_scope.return_value.__aenter__.return_value = mock_session
+            writer._logger = Mock()
+
+            writer.start()
+            writer.enqueue(*bad_rows)
+            await asyncio.sleep(0)
+            writer.enqueue(*_tick_rows(30)[1:])
+            await writer.stop()
+
+        sizes = [len(c.kwargs["params"]) for c in mock_session.exec.call_args_list]
+        assert max(sizes) <= 5
+        assert sizes[:WRITE_ATTEMPTS] == [5] * WRITE_ATTEMPTS
+        assert sum(written) == 29
+        assert not writer._pending
+        writer._logger.error.assert_called_once_with(
+            "bulk_write_dropped",
+            rows=5,
+            attempts=WRITE_ATTEMPTS,
+            error="constraint failed",
+        )
+
+    @pytest.mark.asyncio
+    async def test_insert_helpers_enqueue_while_writer_runs(self):
+        """Test helpers hand rows to the active writer until it is stopped."""
+        as_of = datetime(2024, 1, 15, 10, 0, 0, tzinfo=EST)
+        snapshot = PositionSnapshot("QQQ", 1, 1.0, 1.0, as_of)
+        with patch("src.alphagen.storage.session_scope") as mock_session_scope:
+            mock_session = AsyncMock()
+            mock_session_scope.return_value.__aenter__.return_value = mock_session
+
+            start_bulk_writer()
+            await insert_positions([snapshot, snapshot])
+            mock_session_scope.assert_not_called()
+            await stop_bulk_writer()
+
+            mock_session_scope.assert_called_once()
+            assert len(mock_session.exec.call_args.kwargs["params"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_writer_inserts_rows_per_table(self):
+        """Test a mixed batch lands in each table through Core INSERTs."""
+        from sqlalchemy import text
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+        from sqlmodel.ext.asyncio.session import AsyncSession
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        factory = async_sessionmaker(engine, class_=AsyncSession)
+        as_of = datetime(2024, 1, 15, 10, 0, 0, tzinfo=EST)
+        snapshot = PositionSnapshotRow(
+            symbol="QQQ", quantity=1, average_price=1.0, market_value=1.0, as_of=as_of
+        )
+        with (
+            patch("src.alphagen.storage.get_engine", return_value=engine),
+            patch("src.alphagen.storage.get_session_factory", return_value=factory),
+        ):
+            await init_models()
+            writer = BulkWriter(flush_interval=60)
+            writer.start()
+            writer.enqueue(*_tick_rows(3), snapshot)
+            await writer.stop()
+
+        async with engine.connect() as conn:
+            ticks = (
+                await conn.execute(text("SELECT id, price FROM equitytickrow"))
+            ).all()
+            positions = (
+                await conn.execute(text("SELECT symbol FROM positionsnapshotrow"))
+            ).all()
+        await engine.dispose()
+
+        assert ticks == [(1, 0.0), (2, 1.0), (3, 2.0)]
+        assert positions == [("QQQ",)]
+
+    @pytest.mark.asyncio
+    async def test_init_models_adds_indexes_to_existing_tables(self):
+        """Test init_models indexes tables created before indexes were declared."""
+        from sqlalchemy import text
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "CREATE TABLE optionquoterow (id INTEGER PRIMARY KEY,"
+                    " option_symbol VARCHAR, strike FLOAT, bid FLOAT, ask FLOAT,"
+                    " expiry DATETIME, as_of DATETIME)"
+                )
+            )
+
+        with patch("src.alphagen.storage.get_engine", return_value=engine):
+            await init_models()
+            await init_models()
+
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'index'")
+            )
+            indexes = {row[0] for row in result}
+        await engine.dispose()
+
+        assert {
+            "ix_optionquoterow_as_of",
+            "ix_optionquoterow_option_symbol_as_of",
+            "ix_signalrow_option_symbol_as_of",
+        } <= indexes
@@ -123,6 +123,22 @@ class TestTimeUtils:
         assert result.date() == datetime(2024, 1, 17).date()
         assert result > custom_after
 
+    def test_session_bounds_memoized_per_date(self):
+        """Test session_bounds reuses the window for moments on the same day."""
+        morning = session_bounds(datetime(2024, 1, 16, 9, 0, 0, tzinfo=EST))
+        evening = session_bounds(datetime(2024, 1, 16, 20, 0, 0, tzinfo=EST))
+
+        assert morning is evening
+        assert session_bounds(datetime(2024, 1, 17, 9, 0, 0, tzinfo=EST)) != morning
+
+    def test_next_session_open_skips_weekends(self):
+        """Test next_session_open from a Friday lands on Monday."""
+        friday_close = datetime(2024, 1, 19, 17, 0, 0, tzinfo=EST)
+        result = next_session_open(friday_close)
+
+        assert result.date() == datetime(2024, 1, 22).date()
+        assert result.hour == 9
+
     def test_to_est_with_naive_datetime(self):
         """Test to_est with naive datetime."""
         naive_dt = datetime(2024, 1, 15, 10, 0, 0)
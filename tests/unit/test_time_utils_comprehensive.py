@@ -433,32 +433,22 @@ class TestTimeUtilsComprehensive:
         for diff in time_diffs:
             assert diff < 10
 
-    @patch("src.alphagen.core.time_utils.relativedelta")
-    def test_next_session_open_uses_relativedelta(self, mock_relativedelta):
-        """Test next_session_open uses relativedelta for day increment."""
+    def test_next_session_open_steps_one_day(self):
+        """Test next_session_open probes the following day first."""
         current_time = datetime(
             2024, 1, 15, 10, 0, 0, tzinfo=ZoneInfo("America/New_York")
         )
 
-        with patch("src.alphagen.core.time_utils.now_est") as mock_now_est:
-            mock_now_est.return_value = current_time
-
-            with patch("src.alphagen.core.time_utils.session_bounds") as mock_bounds:
-                next_session_start = datetime(
-                    2024, 1, 16, 8, 30, 0, tzinfo=ZoneInfo("America/New_York")
-                )
-                next_session_end = datetime(
-                    2024, 1, 16, 16, 30, 0, tzinfo=ZoneInfo("America/New_York")
-                )
-                mock_bounds.return_value = (next_session_start, next_session_end)
-
-                with patch(
-                    "src.alphagen.core.time_utils.US_MARKET_HOLIDAYS"
-                ) as mock_holidays:
-                    mock_holidays.__contains__ = MagicMock(return_value=False)
+        with patch("src.alphagen.core.time_utils.session_bounds") as mock_bounds:
+            next_session_start = datetime(
+                2024, 1, 16, 8, 30, 0, tzinfo=ZoneInfo("America/New_York")
+            )
+            next_session_end = datetime(
+                2024, 1, 16, 16, 30, 0, tzinfo=ZoneInfo("America/New_York")
+            )
+            mock_bounds.return_value = (next_session_start, next_session_end)
 
-                    result = next_session_open(current_time)
+            result = next_session_open(current_time)
 
-                    # Verify relativedelta was called
-                    mock_relativedelta.assert_called_with(days=1)
-                    assert result == next_session_start
+            mock_bounds.assert_called_once_with(current_time + timedelta(days=1))
+            assert result == next_session_start
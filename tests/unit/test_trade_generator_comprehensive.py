@@ -33,14 +33,11 @@ class TestTradeGeneratorComprehensive:
     @pytest.mark.asyncio
     async def test_handle_signal_creates_trade_intent(self, mock_emit, sample_signal):
         """Test handle_signal creates and emits trade intent."""
-        with patch("alphagen.trade_generator.load_app_config") as mock_load_config:
-            # Mock the config
-            mock_config = Mock()
-            mock_config.risk.stop_loss_multiple = 2.0
-            mock_config.risk.take_profit_multiple = 0.5
-            mock_config.risk.max_position_size = 10
-            mock_load_config.return_value = mock_config
-
+        mock_config = Mock()
+        mock_config.risk.stop_loss_multiple = 2.0
+        mock_config.risk.take_profit_multiple = 0.5
+        mock_config.risk.max_position_size = 10
+        with patch("alphagen.trade_generator.CONFIG", mock_config):
             generator = TradeGenerator(emit=mock_emit)
 
             await generator.handle_signal(sample_signal)
@@ -60,14 +57,11 @@ class TestTradeGeneratorComprehensive:
     @pytest.mark.asyncio
     async def test_handle_signal_with_zero_take_profit(self, mock_emit, sample_signal):
         """Test handle_signal with very small reference price ensures minimum take profit."""
-        with patch("alphagen.trade_generator.load_app_config") as mock_load_config:
-            # Mock the config
-            mock_config = Mock()
-            mock_config.risk.stop_loss_multiple = 2.0
-            mock_config.risk.take_profit_multiple = 0.5
-            mock_config.risk.max_position_size = 10
-            mock_load_config.return_value = mock_config
-
+        mock_config = Mock()
+        mock_config.risk.stop_loss_multiple = 2.0
+        mock_config.risk.take_profit_multiple = 0.5
+        mock_config.risk.max_position_size = 10
+        with patch("alphagen.trade_generator.CONFIG", mock_config):
             # Use a very small reference price
             sample_signal.reference_price = 0.01
 
@@ -85,14 +79,11 @@ class TestTradeGeneratorComprehensive:
         self, mock_emit, sample_signal
     ):
         """Test handle_signal with large reference price."""
-        with patch("alphagen.trade_generator.load_app_config") as mock_load_config:
-            # Mock the config
-            mock_config = Mock()
-            mock_config.risk.stop_loss_multiple = 1.5
-            mock_config.risk.take_profit_multiple = 0.3
-            mock_config.risk.max_position_size = 25
-            mock_load_config.return_value = mock_config
-
+        mock_config = Mock()
+        mock_config.risk.stop_loss_multiple = 1.5
+        mock_config.risk.take_profit_multiple = 0.3
+        mock_config.risk.max_position_size = 25
+        with patch("alphagen.trade_generator.CONFIG", mock_config):
             # Use a large reference price
             sample_signal.reference_price = 10.0
 
@@ -109,13 +100,19 @@ class TestTradeGeneratorComprehensive:
             assert call_args.take_profit == 10.0 * 0.7  # 1 - 0.3
 
     def test_initialization_loads_config(self, mock_emit):
-        """Test initialization loads app config."""
-        with patch("alphagen.trade_generator.load_app_config") as mock_load_config:
-            mock_config = Mock()
-            mock_load_config.return_value = mock_config
-
+        """Test initialization reads risk settings from the app config."""
+        mock_config = Mock()
+        mock_config.risk.stop_loss_multiple = 2.0
+        mock_config.risk.take_profit_multiple = 0.5
+        mock_config.risk.max_position_size = 10
+        with patch("alphagen.trade_generator.CONFIG", mock_config):
             generator = TradeGenerator(emit=mock_emit)
 
-            # Should load config and store risk settings
-            mock_load_config.assert_called_once()
+            # Should store risk settings
             assert generator._risk == mock_config.risk
+
+        # Later config changes do not affect an existing generator
+        mock_config.risk.stop_loss_multiple = 9.0
+        assert generator._stop_factor == 3.0
+        assert generator._take_profit_factor == 0.5
+        assert generator._quantity == 10
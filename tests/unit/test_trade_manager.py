@@ -1,5 +1,7 @@
 """Unit tests for trade management logic."""
 
+import asyncio
+
 import pytest
 from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock
@@ -78,6 +80,7 @@ async def test_handle_intent_opens_position(trade_manager, mock_emit_execution):
     )
 
     await trade_manager.handle_intent(intent)
+    await trade_manager.drain()
 
     # Verify position was opened
     assert "QQQ241220C00400000" in trade_manager._open_positions
@@ -100,6 +103,7 @@ async def test_single_position_rule(trade_manager, mock_emit_execution):
     )
 
     await trade_manager.handle_intent(intent1)
+    await trade_manager.drain()
 
     # Try to open second position (should be blocked)
     intent2 = TradeIntent(
@@ -113,6 +117,7 @@ async def test_single_position_rule(trade_manager, mock_emit_execution):
     )
 
     await trade_manager.handle_intent(intent2)
+    await trade_manager.drain()
 
     # Should still only have one position
     assert len(trade_manager._open_positions) == 1
@@ -135,6 +140,7 @@ async def test_take_profit_exit(trade_manager, mock_emit_execution):
     )
 
     await trade_manager.handle_intent(intent)
+    await trade_manager.drain()
 
     # Create quote that triggers take profit
     quote = OptionQuote(
@@ -168,6 +174,7 @@ async def test_stop_loss_exit(trade_manager, mock_emit_execution):
     )
 
     await trade_manager.handle_intent(intent)
+    await trade_manager.drain()
 
     # Create quote that triggers stop loss
     quote = OptionQuote(
@@ -253,6 +260,7 @@ async def test_close_all_positions(trade_manager, mock_emit_execution):
     )
 
     await trade_manager.handle_intent(intent)
+    await trade_manager.drain()
 
     # Close all positions
     await trade_manager.close_all(reason="manual")
@@ -260,3 +268,182 @@ async def test_close_all_positions(trade_manager, mock_emit_execution):
     # Position should be closed
     assert len(trade_manager._open_positions) == 0
     assert mock_emit_execution.call_count == 2  # One for open, one for close
+
+
+@pytest.mark.asyncio
+async def test_close_all_continues_past_failed_close(
+    trade_manager, mock_schwab_client, mock_emit_execution
+):
+    """Test one failed closing order does not stop the other positions closing."""
+    opened = mock_schwab_client.submit_order.return_value
+    trade_manager._open_positions = {"AAA": opened, "BBB": opened}
+
+    async def submit_order(intent):
+        if intent.option_symbol == "AAA":
+            raise RuntimeError("rejected")
+        return opened
+
+    mock_schwab_client.submit_order.side_effect = submit_order
+
+    await trade_manager.close_all(reason="shutdown")
+
+    assert mock_schwab_client.submit_order.await_count == 2
+    assert mock_emit_execution.await_count == 1
+    assert "BBB" not in trade_manager._open_positions
+
+
+def _intent(symbol: str = "QQQ241220C00400000", action: str = "SELL_TO_OPEN"):
+    return TradeIntent(
+        as_of=now_est(),
+        action=action,
+        option_symbol=symbol,
+        quantity=25,
+        limit_price=5.50,
+        stop_loss=11.00,
+        take_profit=2.75,
+    )
+
+
+@pytest.mark.asyncio
+async def test_handle_intent_does_not_wait_for_broker(
+    trade_manager, mock_schwab_client, mock_emit_execution
+):
+    """Test intents are queued so the tick path never awaits the broker."""
+    release = asyncio.Event()
+    submitted = mock_schwab_client.submit_order.return_value
+
+    async def slow_submit(intent):
+        await release.wait()
+        return submitted
+
+    mock_schwab_client.submit_order.side_effect = slow_submit
+
+    await trade_manager.handle_intent(_intent())
+    # A pending order counts toward the single-position rule.
+    await trade_manager.handle_intent(_intent("QQQ241220C00400001"))
+    await asyncio.sleep(0)
+    mock_emit_execution.assert_not_called()
+
+    release.set()
+    await trade_manager.drain()
+    await trade_manager.shutdown()
+
+    assert mock_schwab_client.submit_order.await_count == 1
+    assert list(trade_manager._open_positions) == ["QQQ241220C00400000"]
+    assert not trade_manager._pending_orders
+
+
+@pytest.mark.asyncio
+async def test_same_symbol_intents_submit_in_order(trade_manager, mock_schwab_client):
+    """Test a rollover closes the earlier open before the next one is sent."""
+    actions = []
+    submitted = mock_schwab_client.submit_order.return_value
+
+    async def record(intent):
+        actions.append(intent.action)
+        await asyncio.sleep(0)
+        return submitted
+
+    mock_schwab_client.submit_order.side_effect = record
+
+    await trade_manager.handle_intent(_intent())
+    await trade_manager.handle_intent(_intent())
+    await trade_manager.drain()
+    await trade_manager.shutdown()
+
+    assert actions == ["SELL_TO_OPEN", "BUY_TO_CLOSE", "SELL_TO_OPEN"]
+
+
+@pytest.mark.asyncio
+async def test_failed_submission_is_logged_and_released(
+    trade_manager, mock_schwab_client
+):
+    """Test a broker error does not wedge the queue or the symbol."""
+    mock_schwab_client.submit_order.side_effect = RuntimeError("rejected")
+
+    await trade_manager.handle_intent(_intent())
+    await trade_manager.drain()
+    await trade_manager.shutdown()
+
+    assert not trade_manager._open_positions
+    assert not trade_manager._pending_orders
+    assert not trade_manager._symbol_locks
+
+
+def _take_profit_quote(symbol: str = "QQQ241220C00400000") -> OptionQuote:
+    return OptionQuote(
+        option_symbol=symbol,
+        strike=400.0,
+        bid=2.50,
+        ask=2.75,
+        expiry=now_est() + timedelta(hours=1),
+        as_of=now_est(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_exits_close_once(trade_manager, mock_schwab_client):
+    """Test overlapping exit quotes and close_all send a single closing order."""
+    await trade_manager.handle_intent(_intent())
+    await trade_manager.drain()
+
+    release = asyncio.Event()
+    actions = []
+    submitted = mock_schwab_client.submit_order.return_value
+
+    async def slow_submit(intent):
+        actions.append(intent.action)
+        await release.wait()
+        return submitted
+
+    mock_schwab_client.submit_order.side_effect = slow_submit
+
+    tasks = [
+        asyncio.create_task(trade_manager.update_option_quote(_take_profit_quote()))
+        for _ in range(3)
+    ]
+    tasks.append(asyncio.create_task(trade_manager.close_all(reason="shutdown")))
+    await asyncio.sleep(0)
+    # The closing symbol still blocks others under the single-position rule
+    await trade_manager.handle_intent(_intent("QQQ241220C00400001"))
+    release.set()
+    await asyncio.gather(*tasks)
+    await trade_manager.shutdown()
+
+    assert actions == ["BUY_TO_CLOSE"]
+    assert not trade_manager._open_positions
+    assert not trade_manager._pending_orders
+    assert not trade_manager._symbol_locks
+
+
+@pytest.mark.asyncio
+async def test_exit_and_queued_rollover_close_once(trade_manager, mock_schwab_client):
+    """Test a rollover queued behind an exit does not close the position again."""
+    await trade_manager.handle_intent(_intent())
+    await trade_manager.drain()
+
+    release = asyncio.Event()
+    actions = []
+    submitted = mock_schwab_client.submit_order.return_value
+
+    async def submit(intent):
+        actions.append(intent.action)
+        if intent.action == "BUY_TO_CLOSE":
+            await release.wait()
+        return submitted
+
+    mock_schwab_client.submit_order.side_effect = submit
+
+    exit_task = asyncio.create_task(
+        trade_manager.update_option_quote(_take_profit_quote())
+    )
+    await asyncio.sleep(0)
+    await trade_manager.handle_intent(_intent())
+    await asyncio.sleep(0)
+    release.set()
+    await exit_task
+    await trade_manager.drain()
+    await trade_manager.shutdown()
+
+    assert actions == ["BUY_TO_CLOSE", "SELL_TO_OPEN"]
+    assert list(trade_manager._open_positions) == ["QQQ241220C00400000"]
@@ -2,7 +2,7 @@
 
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.alphagen.trade_manager import TradeManager
 from src.alphagen.core.events import (
@@ -13,6 +13,7 @@ from src.alphagen.core.events import (
     TradeExecution,
 )
 from src.alphagen.config import EST
+from src.alphagen.core.time_utils import session_bounds
 
 
 class TestTradeManagerComprehensive:
@@ -99,6 +100,7 @@ class TestTradeManagerComprehensive:
         trade_manager._close_position = AsyncMock()
 
         await trade_manager.handle_intent(sample_intent)
+        await trade_manager.drain()
 
         # Should close existing position first
         trade_manager._close_position.assert_called_once_with(
@@ -110,11 +112,28 @@ class TestTradeManagerComprehensive:
         self, trade_manager, sample_tick
     ):
         """Test handle_tick with option updates the quote."""
-        trade_manager.update_option_quote = AsyncMock()
+        trade_manager._evaluate_exits = AsyncMock()
+
+        await trade_manager.handle_tick(sample_tick)
+
+        option = sample_tick.option
+        assert trade_manager._last_quotes[option.option_symbol] is option
+        trade_manager._evaluate_exits.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_handle_tick_evaluates_exits_for_open_position(
+        self, trade_manager, sample_tick
+    ):
+        """Test handle_tick checks exits when the quoted symbol is open."""
+        option = sample_tick.option
+        trade_manager._open_positions[option.option_symbol] = MagicMock()
+        trade_manager._evaluate_exits = AsyncMock()
 
         await trade_manager.handle_tick(sample_tick)
 
-        trade_manager.update_option_quote.assert_called_once_with(sample_tick.option)
+        trade_manager._evaluate_exits.assert_awaited_once_with(
+            option.option_symbol, option.mid(), option.as_of
+        )
 
     @pytest.mark.asyncio
     async def test_handle_tick_without_option_does_nothing(self, trade_manager):
@@ -207,6 +226,43 @@ class TestTradeManagerComprehensive:
             reason="take-profit",
         )
 
+    @pytest.mark.asyncio
+    async def test_evaluate_exits_resolves_session_close_once_per_day(
+        self, trade_manager, sample_intent
+    ):
+        """Test the session close is looked up once per day, not per quote."""
+        execution = TradeExecution(
+            order_id="12345",
+            status="FILLED",
+            fill_price=2.58,
+            pnl_contrib=0.20,
+            as_of=datetime(2024, 1, 15, 9, 0, 0, tzinfo=EST),
+            intent=sample_intent,
+        )
+        symbol = sample_intent.option_symbol
+        trade_manager._open_positions[symbol] = execution
+        trade_manager._close_position = AsyncMock()
+        price = (sample_intent.take_profit + sample_intent.stop_loss) / 2
+
+        with patch(
+            "src.alphagen.trade_manager.session_bounds",
+            wraps=session_bounds,
+        ) as bounds:
+            for minute in range(3):
+                at = datetime(2024, 1, 15, 10, minute, 0, tzinfo=EST)
+                await trade_manager._evaluate_exits(symbol, price, at)
+            assert bounds.call_count == 1
+            trade_manager._close_position.assert_not_called()
+
+            await trade_manager._evaluate_exits(
+                symbol, price, datetime(2024, 1, 16, 17, 0, 0, tzinfo=EST)
+            )
+
+        assert bounds.call_count == 2
+        trade_manager._close_position.assert_called_once_with(
+            symbol, price=price, reason="session-close"
+        )
+
     @pytest.mark.asyncio
     async def test_evaluate_exits_stop_loss(self, trade_manager, sample_intent):
         """Test _evaluate_exits triggers stop loss exit."""
@@ -266,6 +322,34 @@ class TestTradeManagerComprehensive:
             sample_intent.option_symbol, price=2.60, reason="session-close"
         )
 
+    @pytest.mark.asyncio
+    async def test_evaluate_exits_session_close_for_utc_quote(
+        self, trade_manager, sample_intent
+    ):
+        """Test a UTC quote stamp is matched to its EST session, not the UTC day."""
+        from datetime import timezone
+
+        execution = TradeExecution(
+            order_id="12345",
+            status="FILLED",
+            fill_price=2.58,
+            pnl_contrib=0.20,
+            as_of=datetime(2024, 1, 15, 9, 0, 0, tzinfo=EST),
+            intent=sample_intent,
+        )
+        trade_manager._open_positions[sample_intent.option_symbol] = execution
+        trade_manager._close_position = AsyncMock()
+
+        # 01:00 UTC on the 16th is 20:00 EST on the 15th, after that close
+        after_close = datetime(2024, 1, 16, 1, 0, 0, tzinfo=timezone.utc)
+        await trade_manager._evaluate_exits(
+            sample_intent.option_symbol, 2.60, after_close
+        )
+
+        trade_manager._close_position.assert_called_once_with(
+            sample_intent.option_symbol, price=2.60, reason="session-close"
+        )
+
     @pytest.mark.asyncio
     async def test_evaluate_exits_no_exit(self, trade_manager, sample_intent):
         """Test _evaluate_exits does not exit when conditions not met."""
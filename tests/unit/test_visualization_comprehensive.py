@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 from unittest.mock import Mock, patch
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import tempfile
 
@@ -12,6 +12,7 @@ import tempfile
 import matplotlib
 
 matplotlib.use("Agg")  # Use non-GUI backend for testing
+import matplotlib.dates as mdates
 
 
 class TestLiveChartComprehensive:
@@ -83,13 +84,11 @@ class TestLiveChartComprehensive:
         chart = LiveChart()
         chart._running = True
         chart._thread = Mock()
-        chart._queue = Mock()
 
         with patch.object(chart, "_join_thread") as mock_join:
             await chart.stop()
 
             assert chart._running is False
-            chart._queue.put.assert_called_once_with(None)
             mock_join.assert_called_once()
             assert chart._thread is None
 
@@ -121,7 +120,6 @@ class TestLiveChartComprehensive:
         from src.alphagen.visualization.live_chart import LiveChart
 
         chart = LiveChart()
-        chart._queue = Mock()
 
         # Create a mock tick
         mock_tick = Mock()
@@ -132,7 +130,7 @@ class TestLiveChartComprehensive:
         with patch.object(chart, "start") as mock_start:
             chart.handle_tick(mock_tick)
             mock_start.assert_called_once()
-            chart._queue.put.assert_called_once()
+            assert len(chart._pending) == 1
 
     def test_handle_tick_when_running(self):
         """Test handle_tick when chart is already running."""
@@ -140,7 +138,6 @@ class TestLiveChartComprehensive:
 
         chart = LiveChart()
         chart._running = True
-        chart._queue = Mock()
 
         # Create a mock tick
         mock_tick = Mock()
@@ -149,14 +146,13 @@ class TestLiveChartComprehensive:
         mock_tick.equity.ma9 = 99.5
 
         chart.handle_tick(mock_tick)
-        chart._queue.put.assert_called_once()
+        assert len(chart._pending) == 1
 
     def test_handle_signal_starts_chart_if_not_running(self):
         """Test handle_signal starts chart if not running."""
         from src.alphagen.visualization.live_chart import LiveChart
 
         chart = LiveChart()
-        chart._queue = Mock()
 
         # Create a mock signal
         mock_signal = Mock()
@@ -167,7 +163,7 @@ class TestLiveChartComprehensive:
         with patch.object(chart, "start") as mock_start:
             chart.handle_signal(mock_signal)
             mock_start.assert_called_once()
-            chart._queue.put.assert_called_once()
+            assert len(chart._pending) == 1
 
     def test_handle_signal_when_running(self):
         """Test handle_signal when chart is already running."""
@@ -175,7 +171,6 @@ class TestLiveChartComprehensive:
 
         chart = LiveChart()
         chart._running = True
-        chart._queue = Mock()
 
         # Create a mock signal
         mock_signal = Mock()
@@ -184,7 +179,7 @@ class TestLiveChartComprehensive:
         mock_signal.action = "BUY_OPEN"
 
         chart.handle_signal(mock_signal)
-        chart._queue.put.assert_called_once()
+        assert len(chart._pending) == 1
 
     def test_run_matplotlib_import_failure(self):
         """Test _run when matplotlib import fails."""
@@ -210,10 +205,6 @@ class TestLiveChartComprehensive:
 
         chart = LiveChart()
         chart._running = True
-        chart._queue = Mock()
-
-        # Mock queue to return None immediately (shutdown)
-        chart._queue.get_nowait.return_value = None
 
         with (
             patch("matplotlib.use") as mock_use,
@@ -266,18 +257,12 @@ class TestLiveChartComprehensive:
 
         chart = LiveChart()
         chart._running = True
-        chart._queue = Mock()
 
         # Add some tick data
-        from src.alphagen.visualization.live_chart import _TickPoint
-
-        tick_point = _TickPoint(
-            timestamp=datetime.now(timezone.utc), vwap=100.0, ma9=99.5
-        )
-        chart._tick_buffer.append(tick_point)
+        chart._tick_buffer.append(0.0, 100.0, 99.5)
 
-        # Mock queue to return tick data then None
-        chart._queue.get_nowait.side_effect = [("tick", tick_point), None]
+        # Queue tick data
+        chart._pending.append(("tick", datetime.now(timezone.utc), 100.0, 99.5))
 
         with (
             patch("matplotlib.use"),
@@ -335,10 +320,6 @@ class TestLiveChartComprehensive:
 
         chart = LiveChart()
         chart._running = True
-        chart._queue = Mock()
-
-        # Mock queue to return None immediately
-        chart._queue.get_nowait.return_value = None
 
         with (
             patch("matplotlib.use"),
@@ -397,10 +378,6 @@ class TestLiveChartComprehensive:
 
         chart = LiveChart()
         chart._running = True
-        chart._queue = Mock()
-
-        # Mock queue to return None immediately
-        chart._queue.get_nowait.return_value = None
 
         with (
             patch("matplotlib.use"),
@@ -452,10 +429,6 @@ class TestLiveChartComprehensive:
 
         chart = LiveChart()
         chart._running = True
-        chart._queue = Mock()
-
-        # Mock queue to return None immediately
-        chart._queue.get_nowait.return_value = None
 
         with (
             patch("matplotlib.use"),
@@ -653,78 +626,104 @@ class TestSimpleChartComprehensive:
 
     def test_update_chart_with_data(self):
         """Test _update_chart with tick data."""
-        from src.alphagen.visualization.simple_chart import SimpleChart, _TickPoint
+        from src.alphagen.visualization.simple_chart import SimpleChart
 
         chart = SimpleChart()
         chart._running = True
-        chart._line_vwap = Mock()
-        chart._line_ma9 = Mock()
+        chart._lines = Mock()
         chart._scatter = Mock()
         chart._ax = Mock()
+        chart._ax.get_xlim.return_value = (0.0, 1.0)
+        chart._ax.get_ylim.return_value = (0.0, 1.0)
+        chart._fig = Mock()
 
         # Add tick data
-        tick_point = _TickPoint(
-            timestamp=datetime.now(timezone.utc), vwap=100.0, ma9=99.5
-        )
-        chart._tick_buffer.append(tick_point)
+        chart._record_tick(datetime.now(timezone.utc), 100.0, 99.5)
+
+        artists = chart._update_chart(0)
+
+        # Verify lines were updated and blitted
+        vwap, ma9 = chart._lines.set_segments.call_args[0][0]
+        assert (vwap[0][1], ma9[0][1]) == (100.0, 99.5)
+        assert artists == (chart._lines, chart._scatter)
+        # Data outside the initial limits widens the axes with a full redraw
+        chart._ax.set_ylim.assert_called_once()
+        chart._fig.canvas.draw.assert_called_once()
+
+        chart._fig.canvas.draw.reset_mock()
+        chart._ax.get_xlim.return_value = chart._ax.set_xlim.call_args[0][0]
+        chart._ax.get_ylim.return_value = chart._ax.set_ylim.call_args[0][0]
+        chart._record_tick(datetime.now(timezone.utc), 100.0, 99.5)
+        chart._update_chart(1)
+        chart._fig.canvas.draw.assert_not_called()
+        assert chart._lines.set_segments.call_count == 2
+
+    def test_update_chart_skips_rebuild_without_new_data(self):
+        """Test idle frames re-blit the artists without touching their data."""
+        from src.alphagen.visualization.simple_chart import SimpleChart
+
+        chart = SimpleChart()
+        chart._running = True
+        chart._lines = Mock()
+        chart._scatter = Mock()
+        chart._ax = Mock()
+        chart._ax.get_xlim.return_value = (0.0, 1.0)
+        chart._ax.get_ylim.return_value = (0.0, 1.0)
+        chart._fig = Mock()
+        chart._record_tick(datetime.now(timezone.utc), 100.0, 99.5)
 
         chart._update_chart(0)
+        artists = chart._update_chart(1)
 
-        # Verify lines were updated
-        chart._line_vwap.set_data.assert_called_once()
-        chart._line_ma9.set_data.assert_called_once()
-        chart._ax.relim.assert_called_once()
-        chart._ax.autoscale_view.assert_called_once()
+        assert artists == (chart._lines, chart._scatter)
+        chart._lines.set_segments.assert_called_once()
+
+        chart._record_signal(datetime.now(timezone.utc), 100.0, "SELL_TO_OPEN")
+        chart._update_chart(2)
+        assert chart._lines.set_segments.call_count == 2
 
     def test_update_chart_with_signals(self):
         """Test _update_chart with signal data."""
-        from src.alphagen.visualization.simple_chart import (
-            SimpleChart,
-            _TickPoint,
-            _SignalPoint,
-        )
+        import matplotlib.dates as mdates
+
+        from src.alphagen.visualization.simple_chart import SimpleChart
 
         chart = SimpleChart()
         chart._running = True
-        chart._line_vwap = Mock()
-        chart._line_ma9 = Mock()
+        chart._lines = Mock()
         chart._scatter = Mock()
         chart._ax = Mock()
 
         # Add tick and signal data
-        tick_point = _TickPoint(
-            timestamp=datetime.now(timezone.utc), vwap=100.0, ma9=99.5
-        )
-        signal_point = _SignalPoint(
-            timestamp=datetime.now(timezone.utc), price=100.0, action="BUY_OPEN"
-        )
-        chart._tick_buffer.append(tick_point)
-        chart._signal_buffer.append(signal_point)
+        signal_time = datetime.now(timezone.utc)
+        chart._record_tick(datetime.now(timezone.utc), 100.0, 99.5)
+        chart._record_signal(signal_time, 100.0, "BUY_OPEN")
 
         chart._update_chart(0)
 
         # Verify scatter was updated with signals
         chart._scatter.set_offsets.assert_called_once()
+        offsets = chart._scatter.set_offsets.call_args[0][0]
+        assert offsets.tolist() == [[mdates.date2num(signal_time), 100.0]]
+        assert offsets.base is chart._signal_buffer._rows
+        chart._scatter.set_sizes.assert_called_once()
+        assert chart._scatter.set_sizes.call_args[0][0].tolist() == [80.0]
 
     def test_update_chart_exception_handling(self):
         """Test _update_chart handles exceptions."""
-        from src.alphagen.visualization.simple_chart import SimpleChart, _TickPoint
+        from src.alphagen.visualization.simple_chart import SimpleChart
 
         chart = SimpleChart()
         chart._running = True
-        chart._line_vwap = Mock()
-        chart._line_ma9 = Mock()
+        chart._lines = Mock()
         chart._scatter = Mock()
         chart._ax = Mock()
 
-        # Make set_data raise an exception
-        chart._line_vwap.set_data.side_effect = Exception("Update failed")
+        # Make set_segments raise an exception
+        chart._lines.set_segments.side_effect = Exception("Update failed")
 
         # Add tick data
-        tick_point = _TickPoint(
-            timestamp=datetime.now(timezone.utc), vwap=100.0, ma9=99.5
-        )
-        chart._tick_buffer.append(tick_point)
+        chart._record_tick(datetime.now(timezone.utc), 100.0, 99.5)
 
         chart._update_chart(0)  # Should handle exception gracefully
 
@@ -976,16 +975,13 @@ class TestFileChartComprehensive:
 
     def test_save_chart_with_data(self):
         """Test _save_chart with tick data."""
-        from src.alphagen.visualization.file_chart import FileChart, _TickPoint
+        from src.alphagen.visualization.file_chart import FileChart
 
         with tempfile.TemporaryDirectory() as temp_dir:
             chart = FileChart(output_dir=temp_dir)
 
             # Add tick data
-            tick_point = _TickPoint(
-                timestamp=datetime.now(timezone.utc), vwap=100.0, ma9=99.5
-            )
-            chart._tick_buffer.append(tick_point)
+            chart._record_tick(datetime.now(timezone.utc), 100.0, 99.5)
 
             with (
                 patch("matplotlib.pyplot.style") as mock_style,
@@ -1005,35 +1001,31 @@ class TestFileChartComprehensive:
                 mock_ax.xaxis.set_major_formatter = Mock()
                 mock_ax.xaxis.get_majorticklabels = Mock()
                 mock_ax.xaxis.get_majorticklabels.return_value = []
+                mock_ax.get_xlim.return_value = (0.0, 1.0)
+                mock_ax.get_ylim.return_value = (0.0, 1.0)
                 mock_subplots.return_value = (mock_fig, mock_ax)
 
+                chart._save_chart()
+                chart._last_save = float("-inf")
                 chart._save_chart()
 
+                # The figure is built once and kept open between saves
                 mock_style.use.assert_called_once_with("dark_background")
                 mock_subplots.assert_called_once()
-                mock_savefig.assert_called_once()
-                mock_close.assert_called_once_with(mock_fig)
+                assert mock_fig.savefig.call_count == 2
+                mock_savefig.assert_not_called()
+                mock_close.assert_not_called()
 
     def test_save_chart_with_signals(self):
         """Test _save_chart with signal data."""
-        from src.alphagen.visualization.file_chart import (
-            FileChart,
-            _TickPoint,
-            _SignalPoint,
-        )
+        from src.alphagen.visualization.file_chart import FileChart
 
         with tempfile.TemporaryDirectory() as temp_dir:
             chart = FileChart(output_dir=temp_dir)
 
             # Add tick and signal data
-            tick_point = _TickPoint(
-                timestamp=datetime.now(timezone.utc), vwap=100.0, ma9=99.5
-            )
-            signal_point = _SignalPoint(
-                timestamp=datetime.now(timezone.utc), price=100.0, action="BUY_OPEN"
-            )
-            chart._tick_buffer.append(tick_point)
-            chart._signal_buffer.append(signal_point)
+            chart._record_tick(datetime.now(timezone.utc), 100.0, 99.5)
+            chart._record_signal(datetime.now(timezone.utc), 100.0, "BUY_OPEN")
 
             with (
                 patch("matplotlib.pyplot.style"),
@@ -1054,6 +1046,8 @@ class TestFileChartComprehensive:
                 mock_ax.xaxis.set_major_formatter = Mock()
                 mock_ax.xaxis.get_majorticklabels = Mock()
                 mock_ax.xaxis.get_majorticklabels.return_value = []
+                mock_ax.get_xlim.return_value = (0.0, 1.0)
+                mock_ax.get_ylim.return_value = (0.0, 1.0)
                 mock_subplots.return_value = (mock_fig, mock_ax)
 
                 chart._save_chart()
@@ -1063,16 +1057,13 @@ class TestFileChartComprehensive:
 
     def test_save_chart_exception_handling(self):
         """Test _save_chart handles exceptions."""
-        from src.alphagen.visualization.file_chart import FileChart, _TickPoint
+        from src.alphagen.visualization.file_chart import FileChart
 
         with tempfile.TemporaryDirectory() as temp_dir:
             chart = FileChart(output_dir=temp_dir)
 
             # Add tick data
-            tick_point = _TickPoint(
-                timestamp=datetime.now(timezone.utc), vwap=100.0, ma9=99.5
-            )
-            chart._tick_buffer.append(tick_point)
+            chart._record_tick(datetime.now(timezone.utc), 100.0, 99.5)
 
             # Make subplots raise an exception
             mock_plt = Mock()
@@ -1083,21 +1074,18 @@ class TestFileChartComprehensive:
 
     def test_save_chart_filename_generation(self):
         """Test _save_chart generates proper filename."""
-        from src.alphagen.visualization.file_chart import FileChart, _TickPoint
+        from src.alphagen.visualization.file_chart import FileChart
 
         with tempfile.TemporaryDirectory() as temp_dir:
             chart = FileChart(output_dir=temp_dir)
 
             # Add tick data
-            tick_point = _TickPoint(
-                timestamp=datetime.now(timezone.utc), vwap=100.0, ma9=99.5
-            )
-            chart._tick_buffer.append(tick_point)
+            chart._record_tick(datetime.now(timezone.utc), 100.0, 99.5)
 
             with (
                 patch("matplotlib.pyplot.style"),
                 patch("matplotlib.pyplot.subplots") as mock_subplots,
-                patch("matplotlib.pyplot.savefig") as mock_savefig,
+                patch("matplotlib.pyplot.savefig"),
                 patch("matplotlib.pyplot.close"),
             ):
                 mock_fig = Mock()
@@ -1112,12 +1100,14 @@ class TestFileChartComprehensive:
                 mock_ax.xaxis.set_major_formatter = Mock()
                 mock_ax.xaxis.get_majorticklabels = Mock()
                 mock_ax.xaxis.get_majorticklabels.return_value = []
+                mock_ax.get_xlim.return_value = (0.0, 1.0)
+                mock_ax.get_ylim.return_value = (0.0, 1.0)
                 mock_subplots.return_value = (mock_fig, mock_ax)
 
                 chart._save_chart()
 
                 # Verify savefig was called with proper filename pattern
-                call_args = mock_savefig.call_args
+                call_args = mock_fig.savefig.call_args
                 filename = call_args[0][0]
                 assert str(chart._output_dir) in str(filename)
                 assert "trading_chart_" in str(filename)
@@ -1387,6 +1377,123 @@ class TestSimpleGUIChartComprehensive:
         # Should only keep last 3 ticks
         assert len(chart.data_buffer) == 3
 
+    @patch("src.alphagen.visualization.simple_gui_chart.FigureCanvasTkAgg")
+    @patch("src.alphagen.visualization.simple_gui_chart.Figure")
+    def test_handle_tick_skips_zero_prices(self, mock_figure_class, mock_canvas_class):
+        """Test zero-price ticks never reach the plot and the range tracks inserts."""
+        from src.alphagen.visualization.simple_gui_chart import SimpleGUChart
+
+        mock_parent, mock_fig, mock_ax, mock_line, mock_canvas = self._setup_mocks()
+        mock_figure_class.return_value = mock_fig
+        mock_canvas_class.return_value = mock_canvas
+        mock_ax.get_xlim.return_value = (0.0, 1.0)
+
+        chart = SimpleGUChart(mock_parent)
+        base = datetime(2024, 1, 2, 15, 0, tzinfo=timezone.utc)
+        for i, price in enumerate((101.0, 0.0, 103.0)):
+            mock_tick = Mock()
+            mock_tick.as_of = base + timedelta(minutes=i)
+            mock_tick.equity = Mock(price=price, session_vwap=100.0 + i, ma9=99.5)
+            chart.handle_tick(mock_tick)
+
+        assert len(chart.data_buffer) == 2
+        assert (chart.min_price, chart.max_price) == (99.5, 103.0)
+        chart._update_plot()
+
+        times, prices = mock_line.set_data.call_args_list[0].args
+        assert list(prices) == [101.0, 103.0]
+        assert list(times) == list(mdates.date2num([base, base + timedelta(minutes=2)]))
+
+    @pytest.mark.asyncio
+    async def test_read_historical_columns(self):
+        """Test stored ticks come back as (4, N) columns, oldest first, no zeros."""
+        from contextlib import asynccontextmanager
+
+        from sqlalchemy.ext.asyncio import create_async_engine
+        from sqlmodel.ext.asyncio.session import AsyncSession
+
+        from src.alphagen.storage import EquityTickRow, init_models
+        from src.alphagen.visualization.simple_gui_chart import SimpleGUChart
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        with patch("src.alphagen.storage.get_engine", return_value=engine):
+            await init_models()
+
+        @asynccontextmanager
+        async def session_scope():
+            async with AsyncSession(engine) as session:
+                yield session
+
+        base = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(hours=1)
+        async with session_scope() as session:
+            # Stored out of order, with one zero price and one tick too old
+            for minutes, price in ((2, 103.0), (0, 101.0), (1, 0.0), (-5000, 99.0)):
+                session.add(
+                    EquityTickRow(
+                        symbol="QQQ",
+                        price=price,
+                        session_vwap=100.0 + minutes,
+                        ma9=99.5,
+                        as_of=base + timedelta(minutes=minutes),
+                    )
+                )
+            await session.commit()
+
+        with patch("alphagen.storage.session_scope", session_scope):
+            columns = await SimpleGUChart.read_historical_columns()
+        await engine.dispose()
+
+        assert columns.shape == (4, 2)
+        times, prices, vwap, ma9 = columns
+        expected = mdates.date2num([base, base + timedelta(minutes=2)])
+        assert list(times) == list(expected)
+        assert list(prices) == [101.0, 103.0]
+        assert list(vwap) == [100.0, 102.0]
+        assert list(ma9) == [99.5, 99.5]
+
+    @patch("src.alphagen.visualization.simple_gui_chart.FigureCanvasTkAgg")
+    @patch("src.alphagen.visualization.simple_gui_chart.Figure")
+    def test_update_plot_blits_while_limits_hold(
+        self, mock_figure_class, mock_canvas_class
+    ):
+        """Test only limit changes trigger a full draw; other updates blit."""
+        from src.alphagen.visualization.simple_gui_chart import SimpleGUChart
+
+        mock_parent, mock_fig, mock_ax, mock_line, mock_canvas = self._setup_mocks()
+        mock_figure_class.return_value = mock_fig
+        mock_canvas_class.return_value = mock_canvas
+        mock_ax.get_xlim.return_value = (0.0, 1.0)
+
+        chart = SimpleGUChart(mock_parent)
+        mock_canvas.mpl_connect.assert_called_once_with("draw_event", chart._on_draw)
+        base = datetime(2024, 1, 2, 15, 0, tzinfo=timezone.utc)
+
+        def add_tick(minute: int, price: float) -> None:
+            mock_tick = Mock()
+            mock_tick.as_of = base + timedelta(minutes=minute)
+            mock_tick.equity = Mock(price=price, session_vwap=100.0, ma9=99.0)
+            chart.handle_tick(mock_tick)
+
+        add_tick(0, 101.0)
+        add_tick(2, 102.0)
+        chart._update_plot()
+        # The first update fits the axes and needs a full draw.
+        mock_ax.set_xlim.assert_called_once()
+        mock_canvas.draw_idle.assert_called_once()
+        mock_canvas.blit.assert_not_called()
+
+        chart._on_draw(None)
+        mock_ax.get_xlim.return_value = mock_ax.set_xlim.call_args.args[0]
+        mock_canvas.draw_idle.reset_mock()
+
+        # A tick inside the current limits only repaints the lines.
+        add_tick(3, 101.5)
+        chart._update_plot()
+        mock_canvas.draw_idle.assert_not_called()
+        mock_canvas.restore_region.assert_called_once_with(chart._background)
+        mock_canvas.blit.assert_called_once_with(mock_ax.bbox)
+        mock_ax.set_ylim.assert_called_once()
+
     @patch("src.alphagen.visualization.simple_gui_chart.FigureCanvasTkAgg")
     @patch("src.alphagen.visualization.simple_gui_chart.Figure")
     def test_change_time_scale(self, mock_figure_class, mock_canvas_class):
@@ -7,6 +7,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 import tempfile
 
+import pytest
+
 
 class TestLiveChartSimple:
     """Simplified tests for LiveChart focusing on core functionality."""
@@ -29,6 +31,69 @@ class TestLiveChartSimple:
         chart = LiveChart(max_points=100)
         assert chart._max_points == 100
 
+    def test_tick_ring_buffer_returns_oldest_first(self):
+        """Test the tick history keeps the newest points in order once wrapped."""
+        from src.alphagen.visualization.base import _RingBuffer
+
+        ring = _RingBuffer(3)
+        for n in range(2):
+            ring.append(float(n), n + 10.0, n + 20.0)
+        assert [list(view) for view in ring.views()] == [
+            [0.0, 1.0],
+            [10.0, 11.0],
+            [20.0, 21.0],
+        ]
+
+        for n in range(2, 5):
+            ring.append(float(n), n + 10.0, n + 20.0)
+        times, vwap, ma9 = ring.views()
+        assert len(ring) == 3
+        assert list(times) == [2.0, 3.0, 4.0]
+        assert list(vwap) == [12.0, 13.0, 14.0]
+        assert list(ma9) == [22.0, 23.0, 24.0]
+
+    def test_tick_ring_buffer_tracks_price_range(self):
+        """Test the price range follows appends and evictions of its bounds."""
+        from src.alphagen.visualization.base import _RingBuffer
+
+        ring = _RingBuffer(3)
+        for vwap, ma9 in ((5.0, 6.0), (1.0, 2.0), (3.0, 9.0)):
+            ring.append(0.0, vwap, ma9)
+        assert ring.price_range() == (1.0, 9.0)
+
+        # Evicting (5, 6) leaves both bounds in place without a rescan.
+        ring.append(0.0, 4.0, 4.0)
+        assert not ring._range_stale
+        assert ring.price_range() == (1.0, 9.0)
+
+        # Evicting the point holding the low forces one rescan.
+        ring.append(0.0, 4.0, 4.0)
+        assert ring._range_stale
+        assert ring.price_range() == (3.0, 9.0)
+        assert not ring._range_stale
+
+    def test_marker_ring_overwrites_oldest_in_place(self):
+        """Test the marker ring stays bounded and hands out views of its rows."""
+        from src.alphagen.visualization.base import _MarkerRing
+
+        ring = _MarkerRing(2)
+        for time in (1.0, 2.0, 3.0):
+            ring.append(time, 400.0, 80.0)
+
+        assert len(ring) == 2
+        assert ring.view().base is ring._rows
+        assert sorted(ring.view()[:, 0]) == [2.0, 3.0]
+
+    def test_base_chart_requires_render(self):
+        """Test a chart subclass cannot be built without its _render."""
+        from src.alphagen.visualization.base import _BaseChart
+
+        class NoRender(_BaseChart):
+            pass
+
+        with pytest.raises(TypeError, match="_render"):
+            NoRender(10, "test")
+
     def test_start_when_already_running(self):
         """Test start() when chart is already running."""
         from src.alphagen.visualization.live_chart import LiveChart
@@ -40,12 +105,47 @@ class TestLiveChartSimple:
         chart.start()  # Should not create new thread
         assert chart._running is True
 
+    def test_frame_interval_follows_tick_rate(self):
+        """Test frames slow down when ticks are sparse and speed up in bursts."""
+        from src.alphagen.visualization.live_chart import LiveChart
+
+        chart = LiveChart()
+        chart._running = True
+        tick = Mock()
+        tick.as_of = datetime.now(timezone.utc)
+        tick.equity.session_vwap = 400.0
+        tick.equity.ma9 = 399.0
+        clock = "src.alphagen.visualization.live_chart.time.monotonic"
+
+        # No ticks yet: idle rate.
+        assert chart._frame_interval() == 1.0
+
+        # A burst of ticks drives the interval down to its floor.
+        for step in range(50):
+            with patch(clock, return_value=100.0 + step * 0.01):
+                chart.handle_tick(tick)
+        with patch(clock, return_value=100.5):
+            assert chart._frame_interval() == 0.1
+
+        # Ticks a second apart push it to the ceiling.
+        for step in range(50):
+            with patch(clock, return_value=101.0 + step):
+                chart.handle_tick(tick)
+        with patch(clock, return_value=150.5):
+            assert chart._frame_interval() == 1.0
+
+        # A quiet market falls back to the idle rate even after a burst.
+        chart._gap_ema = 0.01
+        with patch(clock, return_value=156.0):
+            assert chart._frame_interval() == 1.0
+        with patch(clock, return_value=151.0):
+            assert chart._frame_interval() == 0.1
+
     def test_handle_tick_starts_chart_if_not_running(self):
         """Test handle_tick starts chart if not running."""
         from src.alphagen.visualization.live_chart import LiveChart
 
         chart = LiveChart()
-        chart._queue = Mock()
 
         # Create a mock tick
         mock_tick = Mock()
@@ -56,14 +156,13 @@ class TestLiveChartSimple:
         with patch.object(chart, "start") as mock_start:
             chart.handle_tick(mock_tick)
             mock_start.assert_called_once()
-            chart._queue.put.assert_called_once()
+            assert len(chart._pending) == 1
 
     def test_handle_signal_starts_chart_if_not_running(self):
         """Test handle_signal starts chart if not running."""
         from src.alphagen.visualization.live_chart import LiveChart
 
         chart = LiveChart()
-        chart._queue = Mock()
 
         # Create a mock signal
         mock_signal = Mock()
@@ -74,7 +173,69 @@ class TestLiveChartSimple:
         with patch.object(chart, "start") as mock_start:
             chart.handle_signal(mock_signal)
             mock_start.assert_called_once()
-            chart._queue.put.assert_called_once()
+            assert len(chart._pending) == 1
+
+    def test_frame_drains_pending_batch(self):
+        """Test one frame swaps out every pending item and blits the result."""
+        import matplotlib.pyplot as plt
+
+        from src.alphagen.visualization.live_chart import LiveChart
+
+        plt.close("all")
+        chart = LiveChart()
+        chart._running = False
+        ts = datetime(2024, 1, 16, 15, 0, tzinfo=timezone.utc)
+        for n in range(3):
+            chart._pending.append(("tick", ts, 400.0 + n, 399.0 + n))
+        chart._pending.append(("signal", ts, 401.0, "SELL_TO_OPEN"))
+
+        with (
+            patch("matplotlib.use"),
+            patch("matplotlib.pyplot.ion"),
+            patch("matplotlib.pyplot.show"),
+            patch("matplotlib.pyplot.close"),
+        ):
+            chart._run()
+        # The initial full draw cached the background for blitting.
+        assert chart._background is not None
+        # Label space is reserved at setup instead of per relayout.
+        assert chart._fig.subplotpars.bottom == 0.2
+
+        chart._frame()
+        assert len(chart._tick_buffer) == 3
+        tick_time = chart._tick_buffer.views()[0][0]
+        assert list(chart._signal_buffer._rows[0]) == [tick_time, 401.0, 80.0]
+        assert not chart._pending
+
+        # Data inside the current view is blitted without a full draw.
+        chart._pending.append(("tick", ts, 401.0, 400.0))
+        with (
+            patch.object(chart._fig.canvas, "draw") as draw,
+            patch.object(chart._fig.canvas, "blit") as blit,
+        ):
+            chart._frame()
+            # An idle frame does no drawing at all.
+            chart._frame()
+        draw.assert_not_called()
+        blit.assert_called_once_with(chart._fig.bbox)
+        plt.close("all")
+
+
+class TestGrowLimits:
+    """Tests for the axis-limit tracking used by blitted charts."""
+
+    def test_limits_kept_while_data_fits(self):
+        """Test data inside the current view needs no relayout."""
+        from src.alphagen.visualization.limits import grow_limits
+
+        assert grow_limits((0.0, 10.0), 2.0, 8.0, min_margin=0.5) is None
+
+    def test_limits_grow_with_headroom(self):
+        """Test data leaving the view widens it with room to spare."""
+        from src.alphagen.visualization.limits import grow_limits
+
+        assert grow_limits((0.0, 10.0), 0.0, 20.0, min_margin=0.5) == (-2.0, 22.0)
+        assert grow_limits((0.0, 1.0), 5.0, 5.0, min_margin=0.5) == (4.5, 5.5)
 
 
 class TestSimpleChartSimple:
@@ -442,3 +603,142 @@ class TestSimpleGUIChartSimple:
         scales = list(chart.scale_configs.keys())
         expected_scales = ["1min", "5min", "15min", "1hour", "4hour", "1day", "3day"]
         assert scales == expected_scales
+
+    @patch("src.alphagen.visualization.simple_gui_chart.FigureCanvasTkAgg")
+    @patch("src.alphagen.visualization.simple_gui_chart.Figure")
+    def test_load_historical_columns(self, mock_figure_class, mock_canvas_class):
+        """Test history read off the Tk thread is buffered without zero prices."""
+        import numpy as np
+
+        from src.alphagen.visualization.simple_gui_chart import SimpleGUChart
+
+        mock_parent, mock_fig, mock_ax, mock_line, mock_canvas = self._setup_mocks()
+        mock_figure_class.return_value = mock_fig
+        mock_canvas_class.return_value = mock_canvas
+
+        chart = SimpleGUChart(mock_parent)
+        chart._update_plot = Mock()
+        chart.load_historical_columns(None)
+        assert len(chart.data_buffer) == 0
+
+        columns = np.array(
+            (
+                (1.0, 2.0, 3.0),
+                (100.0, 0.0, 102.0),
+                (99.0, 0.5, 101.0),
+                (98.0, 0.5, 100.0),
+            )
+        )
+        chart.load_historical_columns(columns)
+
+        assert chart._update_plot.call_count == 2
+        assert list(chart.data_buffer.columns()[1]) == [100.0, 102.0]
+        assert (chart.min_price, chart.max_price) == (98.0, 102.0)
+
+
+class TestTickColumns:
+    """Tests for the SimpleGUChart tick column buffer."""
+
+    @staticmethod
+    def _tick(minute: int, price: float) -> Mock:
+        tick = Mock()
+        tick.as_of = datetime(2024, 1, 2, 15, minute, tzinfo=timezone.utc)
+        tick.equity.price = price
+        tick.equity.session_vwap = price - 1.0
+        tick.equity.ma9 = price - 2.0
+        return tick
+
+    def test_columns_keep_newest_ticks_oldest_first(self):
+        """Test the buffer wraps in place and returns columns in order."""
+        import matplotlib.dates as mdates
+
+        from src.alphagen.visualization.simple_gui_chart import _TickColumns
+
+        buffer = _TickColumns(3)
+        for minute in range(2):
+            buffer.append(self._tick(minute, 100.0 + minute))
+        assert buffer.columns().base is buffer._columns
+
+        for minute in range(2, 5):
+            buffer.append(self._tick(minute, 100.0 + minute))
+        times, price, vwap, ma9 = buffer.columns()
+        assert len(buffer) == 3
+        assert list(price) == [102.0, 103.0, 104.0]
+        assert list(vwap) == [101.0, 102.0, 103.0]
+        assert list(ma9) == [100.0, 101.0, 102.0]
+        assert times[0] == mdates.date2num(self._tick(2, 0.0).as_of)
+
+        buffer.clear()
+        assert len(buffer) == 0
+
+    def test_resized_keeps_newest_ticks(self):
+        """Test resizing for a new time scale keeps the latest ticks."""
+        from src.alphagen.visualization.simple_gui_chart import _TickColumns
+
+        buffer = _TickColumns(4)
+        for minute in range(6):
+            buffer.append(self._tick(minute, 100.0 + minute))
+
+        smaller = buffer.resized(2)
+        assert smaller.maxlen == 2
+        assert list(smaller.columns()[1]) == [104.0, 105.0]
+        larger = buffer.resized(10)
+        assert list(larger.columns()[1]) == [102.0, 103.0, 104.0, 105.0]
+        larger.append(self._tick(6, 106.0))
+        assert len(larger) == 5
+
+    def test_extend_writes_columns_across_the_wrap(self):
+        """Test bulk writes continue after appends and keep the newest ticks."""
+        import numpy as np
+
+        from src.alphagen.visualization.simple_gui_chart import _TickColumns
+
+        buffer = _TickColumns(4)
+        buffer.append(self._tick(0, 100.0))
+        buffer.extend(np.array([[1.0, 2.0, 3.0, 4.0]] * 4) + [[0], [100], [99], [98]])
+        assert len(buffer) == 4
+        assert list(buffer.columns()[1]) == [101.0, 102.0, 103.0, 104.0]
+
+        buffer.extend(np.arange(24.0).reshape(4, 6))
+        assert list(buffer.columns()[0]) == [2.0, 3.0, 4.0, 5.0]
+
+
+class TestSimpleGUIChartRedraw:
+    """Tests for SimpleGUChart redraw coalescing."""
+
+    @patch("src.alphagen.visualization.simple_gui_chart.FigureCanvasTkAgg")
+    @patch("src.alphagen.visualization.simple_gui_chart.Figure")
+    def test_tick_burst_schedules_single_redraw(
+        self, mock_figure_class, mock_canvas_class
+    ):
+        """Test a burst of ticks is plotted by one deferred idle draw."""
+        from src.alphagen.visualization.simple_gui_chart import (
+            REDRAW_INTERVAL_MS,
+            SimpleGUChart,
+        )
+
+        mock_parent = Mock()
+        mock_ax = Mock()
+        mock_ax.plot.return_value = (Mock(),)
+        mock_ax.get_xlim.return_value = (0.0, 1.0)
+        mock_figure_class.return_value.add_subplot.return_value = mock_ax
+        mock_canvas = mock_canvas_class.return_value
+
+        chart = SimpleGUChart(mock_parent)
+        for i in range(5):
+            mock_tick = Mock()
+            mock_tick.as_of = datetime.now(timezone.utc)
+            mock_tick.equity.price = 101.0 + i
+            mock_tick.equity.session_vwap = 100.0 + i
+            mock_tick.equity.ma9 = 99.5 + i
+            chart.handle_tick(mock_tick)
+
+        mock_parent.after.assert_called_once_with(REDRAW_INTERVAL_MS, chart._redraw)
+        mock_canvas.draw_idle.assert_not_called()
+
+        chart._redraw()
+
+        mock_canvas.draw_idle.assert_called_once()
+        mock_canvas.draw.assert_not_called()
+        chart.handle_tick(mock_tick)
+        assert mock_parent.after.call_count == 2